@@ -0,0 +1,231 @@
+"""
+Benchmark cases of the Series and DataFrame hot paths.
+
+Every case is a setup function that creates its inputs for a size (number of rows) and
+with or without None values and returns the function that is timed. The inputs are
+generated with a fixed seed, so the same case always measures the same data.
+"""
+
+import operator
+import random
+from collections.abc import Callable
+
+from pandastwo.dataframe import DataFrame
+from pandastwo.series import Series
+
+# the fraction of None values of the inputs with nulls
+NULL_FRACTION = 0.1
+SEED = 42
+
+# name -> setup(size, nulls) returning the timed function
+CASES: dict[str, Callable[[int, bool], Callable[[], object]]] = {}
+
+
+def case(name: str) -> Callable:
+    """
+    Registers a setup function as a benchmark case.
+
+    Parameters
+    ----------
+    name : str
+        The name of the case, unique.
+
+    Returns
+    -------
+    Callable
+        The decorator.
+    """
+
+    def register(setup: Callable[[int, bool], Callable[[], object]]) -> Callable:
+        if name in CASES:
+            raise ValueError(f"duplicate benchmark case {name}")
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def values(data_type: type, size: int, nulls: bool, seed: int = SEED) -> list:
+    """
+    Generates the values of an input column.
+
+    Parameters
+    ----------
+    data_type : type
+        int (1 to 1000) and float (1 to 100), never 0 so they can be divisors, bool or
+        str (100 distinct values).
+    size : int
+        The number of values.
+    nulls : bool
+        Whether `NULL_FRACTION` of the values are None.
+    seed : int, optional
+        The seed of the random values, by default `SEED`.
+
+    Returns
+    -------
+    list
+        The values.
+    """
+    generator = random.Random(f"{seed}-{data_type.__name__}")
+    if data_type is int:
+        result = [generator.randrange(1, 1001) for _ in range(size)]
+    elif data_type is float:
+        result = [1 + generator.random() * 99 for _ in range(size)]
+    elif data_type is bool:
+        result = [generator.random() < 0.5 for _ in range(size)]
+    else:
+        result = [f"SKU-{generator.randrange(100)}" for _ in range(size)]
+    if nulls:
+        for position in generator.sample(range(size), int(size * NULL_FRACTION)):
+            result[position] = None
+    # a column must contain a value that is not None to infer its data type
+    if result and result[0] is None:
+        result[0] = values(data_type, 1, False, seed)[0]
+    return result
+
+
+def frame(size: int, nulls: bool) -> DataFrame:
+    """
+    Creates the DataFrame of the README example with random values.
+
+    Parameters
+    ----------
+    size : int
+        The number of rows.
+    nulls : bool
+        Whether the columns contain None values.
+
+    Returns
+    -------
+    DataFrame
+        The columns SKU (str), price (float), sales (int) and taxed (bool).
+    """
+    return DataFrame(
+        {
+            "SKU": Series(values(str, size, nulls)),
+            "price": Series(values(float, size, nulls)),
+            "sales": Series(values(int, size, nulls)),
+            "taxed": Series(values(bool, size, nulls)),
+        }
+    )
+
+
+for _data_type in (int, float, bool, str):
+
+    @case(f"construct.{_data_type.__name__}")
+    def _construct(
+        size: int, nulls: bool, data_type: type = _data_type
+    ) -> Callable[[], object]:
+        data = values(data_type, size, nulls)
+        return lambda: Series(data)
+
+
+@case("construct.dataframe")
+def _construct_dataframe(size: int, nulls: bool) -> Callable[[], object]:
+    columns = {name: series.data for name, series in frame(size, nulls).data.items()}
+    return lambda: DataFrame({name: Series(data) for name, data in columns.items()})
+
+
+_OPERATORS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
+
+for _name, _operation in _OPERATORS.items():
+
+    @case(f"series.{_name}")
+    def _series_operator(
+        size: int, nulls: bool, operation: Callable = _operation
+    ) -> Callable[[], object]:
+        left = Series(values(float, size, nulls))
+        right = Series(values(float, size, nulls, seed=SEED + 1))
+        return lambda: operation(left, right)
+
+    @case(f"scalar.{_name}")
+    def _scalar_operator(
+        size: int, nulls: bool, operation: Callable = _operation
+    ) -> Callable[[], object]:
+        left = Series(values(float, size, nulls))
+        return lambda: operation(left, 5.0)
+
+
+@case("scalar.rsub")
+def _reflected_scalar(size: int, nulls: bool) -> Callable[[], object]:
+    right = Series(values(int, size, nulls))
+    return lambda: 10 - right
+
+
+@case("scalar.eq_str")
+def _str_equality(size: int, nulls: bool) -> Callable[[], object]:
+    series = Series(values(str, size, nulls))
+    return lambda: series == "SKU-7"
+
+
+for _name, _operation in {
+    "and": operator.and_,
+    "or": operator.or_,
+    "xor": operator.xor,
+}.items():
+
+    @case(f"series.{_name}")
+    def _boolean_operator(
+        size: int, nulls: bool, operation: Callable = _operation
+    ) -> Callable[[], object]:
+        left = Series(values(bool, size, nulls))
+        right = Series(values(bool, size, nulls, seed=SEED + 1))
+        return lambda: operation(left, right)
+
+
+@case("series.invert")
+def _invert(size: int, nulls: bool) -> Callable[[], object]:
+    series = Series(values(bool, size, nulls))
+    return lambda: ~series
+
+
+@case("filter.series")
+def _filter_series(size: int, nulls: bool) -> Callable[[], object]:
+    series = Series(values(float, size, nulls))
+    mask = Series(values(bool, size, nulls))
+    return lambda: series[mask]
+
+
+@case("filter.dataframe")
+def _filter_dataframe(size: int, nulls: bool) -> Callable[[], object]:
+    df = frame(size, nulls)
+    mask = Series(values(bool, size, nulls))
+    return lambda: df[mask]
+
+
+@case("filter.readme_query")
+def _readme_query(size: int, nulls: bool) -> Callable[[], object]:
+    df = frame(size, nulls)
+    return lambda: df[(df["price"] + 5.0 > 10.0) & (df["sales"] > 3) & ~df["taxed"]][
+        "SKU"
+    ]
+
+
+@case("filter.readme_query_lazy")
+def _readme_query_lazy(size: int, nulls: bool) -> Callable[[], object]:
+    df = frame(size, nulls)
+    price, sales, taxed = (df[name].lazy() for name in ("price", "sales", "taxed"))
+    return lambda: df[(price + 5.0 > 10.0) & (sales > 3) & ~taxed]["SKU"]
+
+
+@case("repr.series")
+def _repr_series(size: int, nulls: bool) -> Callable[[], object]:
+    series = Series(values(float, size, nulls))
+    return lambda: repr(series)
+
+
+@case("repr.dataframe")
+def _repr_dataframe(size: int, nulls: bool) -> Callable[[], object]:
+    df = frame(size, nulls)
+    return lambda: repr(df)
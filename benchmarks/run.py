@@ -0,0 +1,273 @@
+"""
+Runs the benchmark cases and compares the results with a baseline.
+
+Usage::
+
+    python -m benchmarks.run --output results.json python -m benchmarks.run --sizes
+    1e3,1e7 --filter filter. --baseline results.json --threshold 0.2
+
+Every case is timed with `timeit` for every size, with and without None values: the
+number of calls per measurement is chosen so that a measurement takes at least
+`--min-time` seconds, the best of `--repeat` measurements is reported. The exit status
+is 1 if a case is slower than in the baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Iterable
+from itertools import count
+
+from benchmarks.cases import CASES
+from pandastwo import numpy_backend
+
+DEFAULT_SIZES = (10**3, 10**4, 10**5, 10**6)
+
+
+def key(name: str, size: int, nulls: bool) -> str:
+    """
+    Returns the key of a measurement in the results.
+
+    Parameters
+    ----------
+    name : str
+        The name of the case.
+    size : int
+        The number of rows.
+    nulls : bool
+        Whether the inputs contain None values.
+
+    Returns
+    -------
+    str
+        The key, e.g. "series.add/1000/nulls".
+    """
+    return f"{name}/{size}/{'nulls' if nulls else 'no-nulls'}"
+
+
+def measure(
+    name: str, size: int, nulls: bool, repeat: int, min_time: float = 0.2
+) -> float:
+    """
+    Times a benchmark case.
+
+    Parameters
+    ----------
+    name : str
+        The name of the case.
+    size : int
+        The number of rows.
+    nulls : bool
+        Whether the inputs contain None values.
+    repeat : int
+        The number of measurements.
+    min_time : float, optional
+        The minimum duration of a measurement in seconds, by default 0.2.
+
+    Returns
+    -------
+    float
+        The best time of a single call in seconds.
+    """
+    timer = timeit.Timer(CASES[name](size, nulls))
+    # like `Timer.autorange()` with a configurable duration: 1, 2, 5, 10, 20, 50, ...
+    # calls
+    for number in (multiple * 10**power for power in count() for multiple in (1, 2, 5)):
+        if timer.timeit(number) >= min_time:
+            break
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(
+    names: Iterable[str],
+    sizes: Iterable[int],
+    nulls: Iterable[bool],
+    repeat: int,
+    min_time: float = 0.2,
+    verbose: bool = False,
+) -> dict:
+    """
+    Times benchmark cases for all combinations of sizes and None values.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        The names of the cases.
+    sizes : Iterable[int]
+        The numbers of rows.
+    nulls : Iterable[bool]
+        Whether the inputs contain None values.
+    repeat : int
+        The number of measurements per combination.
+    min_time : float, optional
+        The minimum duration of a measurement in seconds, by default 0.2.
+    verbose : bool, optional
+        Whether every result is printed when it is measured, by default False.
+
+    Returns
+    -------
+    dict
+        The metadata of the run (Python version, platform, numpy) and the times in
+        seconds by key.
+    """
+    results = {}
+    for size in sizes:
+        for name in names:
+            for with_nulls in nulls:
+                seconds = measure(name, size, with_nulls, repeat, min_time)
+                results[key(name, size, with_nulls)] = seconds
+                if verbose:
+                    print(
+                        f"{key(name, size, with_nulls):<50} {seconds * 1e3:12.4f} ms",
+                        flush=True,
+                    )
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": numpy_backend.ENABLED,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    results: dict, baseline: dict, threshold: float
+) -> list[tuple[str, float, float]]:
+    """
+    Finds the measurements that are slower than in a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        The results of `run()`.
+    baseline : dict
+        Earlier results of `run()`, keys missing in either are ignored.
+    threshold : float
+        The tolerated slowdown, e.g. 0.1 for 10 percent.
+
+    Returns
+    -------
+    list[tuple[str, float, float]]
+        The key, the baseline time and the new time of every regression.
+    """
+    regressions = []
+    for name, seconds in results["results"].items():
+        before = baseline["results"].get(name)
+        if before is not None and seconds > before * (1 + threshold):
+            regressions.append((name, before, seconds))
+    return regressions
+
+
+def _sizes(text: str) -> list[int]:
+    """
+    Parses a comma separated list of sizes (e.g. "1e3,1e4,50000").
+
+    Parameters
+    ----------
+    text : str
+        The sizes.
+
+    Returns
+    -------
+    list[int]
+        The sizes.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If a size is not a positive number.
+    """
+    try:
+        sizes = [int(float(size)) for size in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sizes {text!r}") from None
+    if not all(size > 0 for size in sizes):
+        raise argparse.ArgumentTypeError(f"sizes must be positive (found: {text!r})")
+    return sizes
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Runs the benchmarks from the command line.
+
+    Parameters
+    ----------
+    arguments : list[str], optional
+        The command line arguments, by default `sys.argv[1:]`.
+
+    Returns
+    -------
+    int
+        The exit status, 1 if there are regressions compared to the baseline.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_sizes,
+        default=list(DEFAULT_SIZES),
+        help="comma separated row counts",
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run cases whose name contains this text"
+    )
+    parser.add_argument("--nulls", choices=["both", "with", "without"], default="both")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="measurements per case, the best is reported",
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="minimum seconds per measurement"
+    )
+    parser.add_argument(
+        "--pure-python", action="store_true", help="disable the numpy kernels"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with the results in this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="tolerated slowdown (default 0.1 = 10%%)",
+    )
+    options = parser.parse_args(arguments)
+
+    names = [name for name in CASES if options.filter in name]
+    if not names:
+        parser.error(f"no benchmark case matches {options.filter!r}")
+    if options.pure_python:
+        numpy_backend.ENABLED = False
+    nulls = {"both": [False, True], "with": [True], "without": [False]}[options.nulls]
+
+    results = run(
+        names, options.sizes, nulls, options.repeat, options.min_time, verbose=True
+    )
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if not options.baseline:
+        return 0
+
+    with open(options.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, options.threshold)
+    for name, before, seconds in regressions:
+        print(
+            f"REGRESSION {name}: {before * 1e3:.4f} ms -> {seconds * 1e3:.4f} ms ({seconds / before:.2f}x)"
+        )
+    if not regressions:
+        print(
+            f"no regressions compared to {options.baseline} (threshold {options.threshold:.0%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
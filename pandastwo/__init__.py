@@ -0,0 +1,16 @@
+from pandastwo.dataframe import DataFrame
+from pandastwo.io import load, read_csv
+from pandastwo.parallel import ParallelExecutor
+from pandastwo.partitioned import PartitionedDataFrame
+from pandastwo.profiling import profile
+from pandastwo.series import Series
+
+__all__ = [
+    "DataFrame",
+    "ParallelExecutor",
+    "PartitionedDataFrame",
+    "Series",
+    "load",
+    "profile",
+    "read_csv",
+]
@@ -0,0 +1,536 @@
+"""
+Null-skipping aggregation kernels.
+
+Every aggregation is an accumulator that is updated chunk by chunk with the valid values
+of a column, so a column is reduced in a single pass without creating a list of all its
+values. Accumulators of different chunks (e.g. of partitions of a column) can be merged
+into the result of the whole column.
+"""
+
+import math
+import operator
+from collections.abc import Callable, Iterator, Sequence
+from itertools import compress, repeat
+from typing import Self
+
+from pandastwo.buffers import Bitmap, Numeric
+
+# number of values converted to Python objects at once
+CHUNK_SIZE = 1 << 16
+
+
+def iter_chunks(
+    values: Numeric | list, validity: Bitmap | None, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Sequence]:
+    """
+    Yields the valid values of a column chunk by chunk.
+
+    Parameters
+    ----------
+    values : array, memoryview or list
+        The values buffer (not a Bitmap, bool columns are aggregated on their bits).
+    validity : Bitmap or None
+        The validity bitmap (None if there are no None values).
+    chunk_size : int, optional
+        The maximum number of values per chunk, by default `CHUNK_SIZE`.
+
+    Yields
+    ------
+    Sequence
+        The valid values of the next chunk (may be empty).
+    """
+    valids = None if validity is None else validity.to_bytes01()
+    for start in range(0, len(values), chunk_size):
+        chunk: Sequence = values[start : start + chunk_size]
+        if valids is not None:
+            chunk = list(compress(chunk, valids[start : start + chunk_size]))
+        yield chunk
+
+
+def _float_sum(chunk: Sequence[float]) -> float:
+    """
+    Sums floats exactly (correctly rounded), falls back to a plain sum for infinite
+    results.
+
+    Parameters
+    ----------
+    chunk : Sequence[float]
+        The values.
+
+    Returns
+    -------
+    float
+        The sum.
+    """
+    try:
+        return math.fsum(chunk)
+    except (OverflowError, ValueError):
+        # the sum overflows or adds infinities of different signs, it is inf or nan
+        # anyway
+        return sum(chunk, 0.0)
+
+
+class Accumulator[R]:
+    """
+    The state of an aggregation, updated with chunks of valid values.
+
+    R is the type of the result.
+    """
+
+    __slots__ = ()
+
+    def update(self, chunk: Sequence) -> None:
+        """
+        Adds a chunk of valid values.
+
+        Parameters
+        ----------
+        chunk : Sequence
+            The values, must not contain None.
+        """
+        raise NotImplementedError
+
+    def merge(self, other: Self) -> None:
+        """
+        Adds the values of another accumulator of the same kind.
+
+        Parameters
+        ----------
+        other : Accumulator
+            The accumulator of other chunks.
+        """
+        raise NotImplementedError
+
+    def result(self) -> R:
+        """
+        Returns the result of the aggregation.
+
+        Returns
+        -------
+        R
+            The result (None if it is undefined, e.g. the mean of no values).
+        """
+        raise NotImplementedError
+
+
+class Count(Accumulator[int]):
+    """
+    Counts the valid values.
+    """
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def update(self, chunk: Sequence) -> None:
+        self.count += len(chunk)
+
+    def merge(self, other: "Count") -> None:
+        self.count += other.count
+
+    def result(self) -> int:
+        return self.count
+
+
+class Sum(Accumulator[int | float]):
+    """
+    Sums the valid values.
+
+    int values are summed exactly. float values are summed exactly per chunk and the
+    chunk sums are combined with compensated (Neumaier) summation, so the result does
+    not depend on the order of the values like a naive running sum.
+
+    Parameters
+    ----------
+    data_type : type
+        The type of the values, int or float.
+    """
+
+    __slots__ = ("data_type", "total", "compensation")
+
+    def __init__(self, data_type: type) -> None:
+        self.data_type = data_type
+        self.total: int | float = data_type()
+        self.compensation = 0.0
+
+    def update(self, chunk: Sequence) -> None:
+        if self.data_type is float:
+            self._add(_float_sum(chunk))
+        else:
+            self.total += sum(chunk)
+
+    def merge(self, other: "Sum") -> None:
+        if self.data_type is float:
+            self._add(other.total)
+            self.compensation += other.compensation
+        else:
+            self.total += other.total
+
+    def _add(self, value: float) -> None:
+        """
+        Adds a float with compensated summation.
+
+        Parameters
+        ----------
+        value : float
+            The value to add.
+        """
+        total = self.total + value
+        if math.isfinite(total):
+            # keep the low order bits that were lost in the addition
+            if abs(self.total) >= abs(value):
+                self.compensation += (self.total - total) + value
+            else:
+                self.compensation += (value - total) + self.total
+        self.total = total
+
+    def result(self) -> int | float:
+        if self.data_type is float and math.isfinite(self.total):
+            return self.total + self.compensation
+        return self.total
+
+
+class Mean(Accumulator[float | None]):
+    """
+    Averages the valid values.
+
+    Parameters
+    ----------
+    data_type : type
+        The type of the values, int or float.
+    """
+
+    __slots__ = ("sum", "count")
+
+    def __init__(self, data_type: type) -> None:
+        self.sum = Sum(data_type)
+        self.count = 0
+
+    def update(self, chunk: Sequence) -> None:
+        self.sum.update(chunk)
+        self.count += len(chunk)
+
+    def merge(self, other: "Mean") -> None:
+        self.sum.merge(other.sum)
+        self.count += other.count
+
+    def result(self) -> float | None:
+        if not self.count:
+            return None
+        # int / int is correctly rounded, so the mean of ints is exact up to the last
+        # bit
+        return self.sum.result() / self.count
+
+
+class Extreme[T](Accumulator[T | None]):
+    """
+    Finds the minimum or maximum of the valid values.
+
+    NaN values are not skipped: if there is a NaN, the result is NaN.
+
+    Parameters
+    ----------
+    function : Callable
+        The builtin `min` or `max`.
+    """
+
+    __slots__ = ("function", "value")
+
+    def __init__(self, function: Callable) -> None:
+        self.function = function
+        self.value: T | None = None
+
+    def update(self, chunk: Sequence) -> None:
+        if not len(chunk):
+            return
+        value = self.function(chunk)
+        if isinstance(value, float) and any(map(math.isnan, chunk)):
+            value = math.nan
+        self._add(value)
+
+    def merge(self, other: "Extreme[T]") -> None:
+        if other.value is not None:
+            self._add(other.value)
+
+    def _add(self, value: T) -> None:
+        """
+        Combines the extreme of a chunk with the current one.
+
+        Parameters
+        ----------
+        value : T
+            The extreme of a chunk, not None.
+        """
+        if self.value is None or (isinstance(value, float) and math.isnan(value)):
+            self.value = value
+        elif not (isinstance(self.value, float) and math.isnan(self.value)):
+            self.value = self.function(self.value, value)
+
+    def result(self) -> T | None:
+        return self.value
+
+
+class Var(Accumulator[float | None]):
+    """
+    Computes the variance of the valid values.
+
+    Every chunk is reduced to its count, mean and sum of squared deviations from the
+    mean (two passes over the chunk, which is numerically stable), chunks are combined
+    with the parallel update formula of Chan et al.
+
+    Parameters
+    ----------
+    ddof : int, optional
+        Delta degrees of freedom, the divisor is `count - ddof`. By default 1 (sample
+        variance).
+    """
+
+    __slots__ = ("ddof", "count", "mean", "m2")
+
+    def __init__(self, ddof: int = 1) -> None:
+        self.ddof = ddof
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, chunk: Sequence) -> None:
+        count = len(chunk)
+        if not count:
+            return
+        # ints are summed exactly, int / int is correctly rounded
+        mean = (
+            _float_sum(chunk) if isinstance(chunk[0], float) else sum(chunk)
+        ) / count
+        deviations = list(map(operator.sub, chunk, repeat(mean)))
+        self._combine(count, mean, math.sumprod(deviations, deviations))
+
+    def merge(self, other: "Var") -> None:
+        if other.count:
+            self._combine(other.count, other.mean, other.m2)
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        """
+        Combines the statistics of a chunk with the current ones.
+
+        Parameters
+        ----------
+        count : int
+            The number of values of the chunk.
+        mean : float
+            The mean of the chunk.
+        m2 : float
+            The sum of squared deviations from the mean of the chunk.
+        """
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def result(self) -> float | None:
+        if self.count <= self.ddof:
+            return None
+        return self.m2 / (self.count - self.ddof)
+
+
+class Std(Var):
+    """
+    Computes the standard deviation of the valid values (the square root of `Var`).
+
+    Parameters
+    ----------
+    ddof : int, optional
+        Delta degrees of freedom, the divisor is `count - ddof`. By default 1 (sample
+        standard deviation).
+    """
+
+    __slots__ = ()
+
+    def result(self) -> float | None:
+        variance = super().result()
+        return None if variance is None else math.sqrt(variance)
+
+
+class Any(Accumulator[bool]):
+    """
+    Checks whether any valid bool value is True.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = False
+
+    def update(self, chunk: Sequence) -> None:
+        self.value = self.value or any(chunk)
+
+    def merge(self, other: "Any") -> None:
+        self.value = self.value or other.value
+
+    def result(self) -> bool:
+        return self.value
+
+
+class All(Accumulator[bool]):
+    """
+    Checks whether all valid bool values are True (also if there are no values).
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = True
+
+    def update(self, chunk: Sequence) -> None:
+        self.value = self.value and all(chunk)
+
+    def merge(self, other: "All") -> None:
+        self.value = self.value and other.value
+
+    def result(self) -> bool:
+        return self.value
+
+
+# aggregations by name and the data types they accept
+_NUMERIC = {int, float}
+_ANY_TYPE = {int, float, bool, str}
+_AGGREGATIONS: dict[str, tuple[Callable[[type], Accumulator], set[type]]] = {
+    "count": (lambda data_type: Count(), _ANY_TYPE),
+    "sum": (Sum, _NUMERIC),
+    "mean": (Mean, _NUMERIC),
+    "min": (lambda data_type: Extreme(min), _ANY_TYPE),
+    "max": (lambda data_type: Extreme(max), _ANY_TYPE),
+    "var": (lambda data_type: Var(), _NUMERIC),
+    "std": (lambda data_type: Std(), _NUMERIC),
+    "any": (lambda data_type: Any(), {bool}),
+    "all": (lambda data_type: All(), {bool}),
+}
+
+
+def create(name: str, data_type: type) -> Accumulator:
+    """
+    Creates the accumulator of an aggregation by name.
+
+    Parameters
+    ----------
+    name : str
+        The name of the aggregation, one of count, sum, mean, min, max, var, std, any,
+        all.
+    data_type : type
+        The type of the values that are aggregated.
+
+    Returns
+    -------
+    Accumulator
+        The new accumulator.
+
+    Raises
+    ------
+    ValueError
+        If the aggregation is unknown or cannot be applied to the data type.
+    """
+    if name not in _AGGREGATIONS:
+        raise ValueError(
+            f"unknown aggregation {name!r} (allowed are: {', '.join(_AGGREGATIONS)})"
+        )
+    factory, data_types = _AGGREGATIONS[name]
+    if data_type not in data_types:
+        raise ValueError(
+            f"aggregation {name} cannot be applied to data type {data_type}"
+        )
+    return factory(data_type)
+
+
+def result_type(name: str, data_type: type) -> type:
+    """
+    Returns the data type of the result of an aggregation.
+
+    Parameters
+    ----------
+    name : str
+        The name of the aggregation.
+    data_type : type
+        The data type of the aggregated values.
+
+    Returns
+    -------
+    type
+        The data type of the result.
+    """
+    if name == "count":
+        return int
+    if name in {"mean", "var", "std"}:
+        return float
+    if name in {"any", "all"}:
+        return bool
+    return data_type
+
+
+def reduce_groups(name: str, data_type: type, groups: list[Sequence]) -> list:
+    """
+    Reduces the valid values of every group with an aggregation.
+
+    count, sum, mean, min and max are mapped over all groups at once,
+    the other aggregations use one accumulator per group.
+
+    Parameters
+    ----------
+    name : str
+        The name of the aggregation (must be valid for the data type, see `create()`).
+    data_type : type
+        The data type of the values.
+    groups : list[Sequence]
+        The valid values of every group.
+
+    Returns
+    -------
+    list
+        The result of every group.
+    """
+    if name == "count":
+        return list(map(len, groups))
+    if name == "sum":
+        return list(map(_float_sum if data_type is float else sum, groups))
+    if name == "mean":
+        sums = reduce_groups("sum", data_type, groups)
+        return [
+            total / count if count else None
+            for total, count in zip(sums, map(len, groups))
+        ]
+    if name in {"min", "max"} and data_type is not float:
+        # without NaN values the builtins give the result directly
+        function = min if name == "min" else max
+        return [function(group) if group else None for group in groups]
+
+    results = []
+    for group in groups:
+        accumulator = create(name, data_type)
+        accumulator.update(group)
+        results.append(accumulator.result())
+    return results
+
+
+def aggregate[R](
+    accumulator: Accumulator[R], values: Numeric | list, validity: Bitmap | None
+) -> R:
+    """
+    Reduces a column with an accumulator in a single pass.
+
+    Parameters
+    ----------
+    accumulator : Accumulator
+        The new accumulator of the aggregation.
+    values : array, memoryview or list
+        The values buffer.
+    validity : Bitmap or None
+        The validity bitmap (None if there are no None values).
+
+    Returns
+    -------
+    R
+        The result of the aggregation.
+    """
+    for chunk in iter_chunks(values, validity):
+        accumulator.update(chunk)
+    return accumulator.result()
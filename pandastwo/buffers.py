@@ -0,0 +1,1423 @@
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Buffer, Iterable, Iterator
+from itertools import accumulate, compress, islice, repeat
+from math import inf, isinf
+from operator import eq, is_, is_not, sub
+from typing import Literal, overload
+
+# translation tables between one byte per bit (0x00/0x01) and ascii digits ("0"/"1")
+_BYTES_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGITS_TO_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+# array typecodes used for the physical storage of numeric Series
+INT_TYPECODE = "q"
+FLOAT_TYPECODE = "d"
+# the physical widths of numeric Series by dtype name (see `Series(data, dtype=...)`),
+# from narrow to wide
+INT_DTYPES = {"int8": "b", "int16": "h", "int32": "i", "int64": INT_TYPECODE}
+FLOAT_DTYPES = {"float32": "f", "float64": FLOAT_TYPECODE}
+# the typecodes of the widths by itemsize, for buffers of other libraries (literals for
+# the overloads of `memoryview.cast`)
+_INT_TYPECODES: dict[int, Literal["b", "h", "i", "q"]] = {
+    1: "b",
+    2: "h",
+    4: "i",
+    8: "q",
+}
+_FLOAT_TYPECODES: dict[int, Literal["f", "d"]] = {4: "f", 8: "d"}
+_DTYPE_NAMES = {
+    typecode: name for name, typecode in (INT_DTYPES | FLOAT_DTYPES).items()
+}
+# array typecode of the codes of dictionary encoded str Series
+CODE_TYPECODE = "i"
+# array typecode of the offsets of str Series stored as one UTF-8 buffer
+OFFSET_TYPECODE = "q"
+
+# str data is dictionary encoded automatically if it has at least this many values
+# and at most this fraction of them is distinct
+DICTIONARY_MIN_LENGTH = 1024
+DICTIONARY_MAX_FRACTION = 0.5
+
+# a numeric buffer: an array, or a memoryview of int or float values cast to the format
+# of an array typecode (see `typecode_of`)
+type NumericView = memoryview[int] | memoryview[float]
+type Numeric = array | NumericView
+
+
+def typecode_of(values: Numeric) -> str:
+    """
+    Returns the typecode of a numeric buffer.
+
+    Numeric buffers are arrays, or memoryviews cast to the same format (e.g. buffers of
+    a memory mapped file), which are read without copying.
+
+    Parameters
+    ----------
+    values : array or memoryview
+        The buffer.
+
+    Returns
+    -------
+    str
+        The array typecode.
+    """
+    return values.typecode if isinstance(values, array) else values.format
+
+
+def dtype_of(values: object) -> str | None:
+    """
+    Returns the physical width of the values of a numeric Series.
+
+    Parameters
+    ----------
+    values : object
+        The values buffer.
+
+    Returns
+    -------
+    str or None
+        The dtype name ("int8", "int16", "int32", "int64", "float32" or "float64"),
+        None if the values are not stored in a numeric buffer.
+    """
+    if not isinstance(values, (array, memoryview)):
+        return None
+    return _DTYPE_NAMES[typecode_of(values)]
+
+
+def int_typecode(low: int, high: int, at_least: str = "b") -> str | None:
+    """
+    Returns the narrowest int typecode that holds a range of values.
+
+    Parameters
+    ----------
+    low : int
+        The smallest value.
+    high : int
+        The largest value.
+    at_least : str, optional
+        The narrowest typecode to consider, by default "b" (8 bits).
+
+    Returns
+    -------
+    str or None
+        The typecode, None if the values do not fit into 64 bits.
+    """
+    typecodes = list(INT_DTYPES.values())
+    for typecode in typecodes[typecodes.index(at_least) :]:
+        limit = 1 << (8 * array(typecode).itemsize - 1)
+        if -limit <= low and high < limit:
+            return typecode
+    return None
+
+
+def narrow_ints(values: Numeric, at_least: str = "b") -> Numeric:
+    """
+    Stores int values in the narrowest width that holds them.
+
+    Parameters
+    ----------
+    values : array or memoryview
+        The values.
+    at_least : str, optional
+        The narrowest typecode to use, by default "b" (8 bits).
+
+    Returns
+    -------
+    array or memoryview
+        The values, not copied if they already have the typecode.
+    """
+    # the values of int buffers always fit into 64 bits
+    typecode = (
+        int_typecode(min(values, default=0), max(values, default=0), at_least)
+        or INT_TYPECODE
+    )
+    return values if typecode == typecode_of(values) else array(typecode, values)
+
+
+def float32_or_none(values: Numeric) -> array | None:
+    """
+    Rounds float values to float32.
+
+    Parameters
+    ----------
+    values : array or memoryview
+        The values.
+
+    Returns
+    -------
+    array or None
+        The values as `array('f')`, None if a finite value is too large for float32.
+    """
+    rounded = array(FLOAT_DTYPES["float32"], values)
+    # float32 overflows to infinity without an error
+    if (inf in rounded or -inf in rounded) and sum(map(isinf, rounded)) > sum(
+        map(isinf, values)
+    ):
+        return None
+    return rounded
+
+
+def convert_width(values: Numeric | list, dtype: str) -> Numeric | list:
+    """
+    Stores the values of an int or float Series in a physical width.
+
+    Parameters
+    ----------
+    values : array or memoryview or list
+        The values (a list holds ints that do not fit into 64 bits).
+    dtype : str
+        The dtype name of the width, "auto" for the narrowest width that holds the
+        values exactly (floats are stored as float32 only if no value is rounded).
+
+    Returns
+    -------
+    array or memoryview or list
+        The values, not copied if they already have the width (a list is kept for
+        "auto").
+
+    Raises
+    ------
+    ValueError
+        If an int does not fit into the width or a float is too large for float32.
+    """
+    if isinstance(values, list):
+        if dtype == "auto":
+            return values
+        raise ValueError(
+            f"the values do not fit into {dtype} (found ints that do not fit into 64 bits)"
+        )
+    floats = typecode_of(values) in FLOAT_DTYPES.values()
+    if dtype == "auto":
+        if not floats:
+            return narrow_ints(values)
+        rounded = array(FLOAT_DTYPES["float32"], values)
+        # compare the bits of the values widened back, NaN is not equal to itself
+        exact = array(FLOAT_TYPECODE, rounded).tobytes() == memoryview(values).cast("B")
+        return rounded if exact else values
+    typecode = (FLOAT_DTYPES if floats else INT_DTYPES)[dtype]
+    if typecode == typecode_of(values):
+        return values
+    if floats and typecode == FLOAT_DTYPES["float32"]:
+        float32 = float32_or_none(values)
+        if float32 is None:
+            raise ValueError(
+                "the values do not fit into float32 (found a value larger than its maximum)"
+            )
+        return float32
+    if not floats:
+        low, high = min(values, default=0), max(values, default=0)
+        if int_typecode(low, high, typecode) != typecode:
+            raise ValueError(
+                f"the values do not fit into {dtype} (found {low} to {high})"
+            )
+    return array(typecode, values)
+
+
+def as_array(values: Numeric) -> array:
+    """
+    Returns a numeric buffer as an array, a memoryview is copied.
+
+    Parameters
+    ----------
+    values : array or memoryview
+        The buffer.
+
+    Returns
+    -------
+    array
+        The values.
+    """
+    if isinstance(values, array):
+        return values
+    copied = array(values.format)
+    copied.frombytes(values.cast("B"))
+    return copied
+
+
+class Bitmap:
+    """
+    A fixed length sequence of bits packed into bytes (least significant bit first).
+
+    Bitmaps are used for the values of bool Series and for the validity of all Series (a
+    set bit marks a valid value, a cleared bit marks a None value). Bitwise operations
+    are done on the whole buffer at once by converting it to a Python int.
+
+    Parameters
+    ----------
+    buffer : bytes or memoryview
+        The packed bits. Must hold at least `length` bits, bits beyond `length` must be
+        zero.
+    length : int
+        The number of bits in the bitmap.
+    """
+
+    __slots__ = ("buffer", "length")
+
+    def __init__(self, buffer: bytes | memoryview, length: int) -> None:
+        self.buffer = buffer
+        self.length = length
+
+    @classmethod
+    def from_bytes01(cls, data: bytes) -> "Bitmap":
+        """
+        Create a Bitmap from a bytes object holding one 0x00 or 0x01 byte per bit.
+
+        Parameters
+        ----------
+        data : bytes
+            One byte per bit.
+
+        Returns
+        -------
+        Bitmap
+            The packed bitmap.
+        """
+        if not data:
+            return cls(b"", 0)
+        # reverse the digits so that the first element ends up in the least significant
+        # bit
+        value = int(data.translate(_BYTES_TO_DIGITS)[::-1], 2)
+        return cls.from_int(value, len(data))
+
+    @classmethod
+    def from_bools(cls, data: Iterable[object]) -> "Bitmap":
+        """
+        Create a Bitmap from an iterable where only elements that are `True` set a bit.
+
+        Parameters
+        ----------
+        data : Iterable[object]
+            The elements to pack. None and False both clear the bit.
+
+        Returns
+        -------
+        Bitmap
+            The packed bitmap.
+        """
+        return cls.from_bytes01(bytes(map(is_, data, repeat(True))))
+
+    @classmethod
+    def from_not_none(cls, data: Iterable[object]) -> "Bitmap":
+        """
+        Create a validity Bitmap from an iterable where every non-None element sets a
+        bit.
+
+        Parameters
+        ----------
+        data : Iterable[object]
+            The elements to check for None.
+
+        Returns
+        -------
+        Bitmap
+            The packed validity bitmap.
+        """
+        return cls.from_bytes01(bytes(map(is_not, data, repeat(None))))
+
+    @classmethod
+    def from_int(cls, value: int, length: int) -> "Bitmap":
+        """
+        Create a Bitmap from a Python int whose bit i is the i-th element.
+
+        Parameters
+        ----------
+        value : int
+            The bits. Must not have bits set beyond `length`.
+        length : int
+            The number of bits in the bitmap.
+
+        Returns
+        -------
+        Bitmap
+            The packed bitmap.
+        """
+        return cls(value.to_bytes((length + 7) // 8, "little"), length)
+
+    @classmethod
+    def full(cls, length: int, value: bool = True) -> "Bitmap":
+        """
+        Create a Bitmap with all bits set (or all bits cleared).
+
+        Parameters
+        ----------
+        length : int
+            The number of bits in the bitmap.
+        value : bool, optional
+            Whether the bits are set, by default True.
+
+        Returns
+        -------
+        Bitmap
+            The bitmap.
+        """
+        return cls.from_int((1 << length) - 1 if value else 0, length)
+
+    def to_int(self) -> int:
+        """
+        Return the bits as a Python int (bit i is the i-th element).
+
+        Returns
+        -------
+        int
+            The bits as an int.
+        """
+        return int.from_bytes(self.buffer, "little")
+
+    def to_bytes01(self) -> bytes:
+        """
+        Return the bits unpacked to one 0x00 or 0x01 byte per bit.
+
+        The result can directly be used as selectors for `itertools.compress`.
+
+        Returns
+        -------
+        bytes
+            One byte per bit.
+        """
+        if not self.length:
+            return b""
+        digits = format(self.to_int(), f"0{self.length}b")
+        return digits[::-1].encode("ascii").translate(_DIGITS_TO_BYTES)
+
+    def to_list(self) -> list[bool]:
+        """
+        Return the bits as a list of booleans.
+
+        Returns
+        -------
+        list[bool]
+            The unpacked bits.
+        """
+        return list(map(bool, self.to_bytes01()))
+
+    def count(self) -> int:
+        """
+        Return the number of set bits.
+
+        Returns
+        -------
+        int
+            The number of set bits.
+        """
+        return self.to_int().bit_count()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self.buffer[index >> 3] >> (index & 7) & 1)
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap.from_int(self.to_int() & other.to_int(), self.length)
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap.from_int(self.to_int() | other.to_int(), self.length)
+
+    def __xor__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap.from_int(self.to_int() ^ other.to_int(), self.length)
+
+    def __invert__(self) -> "Bitmap":
+        return Bitmap.from_int(~self.to_int() & ((1 << self.length) - 1), self.length)
+
+    def take(self, positions: Iterable[int]) -> "Bitmap":
+        """
+        Gather the bits at the given positions.
+
+        Parameters
+        ----------
+        positions : Iterable[int]
+            The positions of the bits to gather.
+
+        Returns
+        -------
+        Bitmap
+            The gathered bits.
+        """
+        bits = self.to_bytes01()
+        return Bitmap.from_bytes01(bytes(map(bits.__getitem__, positions)))
+
+    def filter(self, selectors: bytes) -> "Bitmap":
+        """
+        Keep only the bits where the selectors are non-zero.
+
+        Parameters
+        ----------
+        selectors : bytes
+            One byte per bit, non-zero bytes select the bit.
+
+        Returns
+        -------
+        Bitmap
+            The selected bits.
+        """
+        return Bitmap.from_bytes01(bytes(compress(self.to_bytes01(), selectors)))
+
+    def slice(self, start: int, stop: int) -> "Bitmap":
+        """
+        Return the bits from `start` up to (excluding) `stop`.
+
+        Parameters
+        ----------
+        start : int
+            The first bit, 0 <= start <= stop.
+        stop : int
+            The end of the range, stop <= length.
+
+        Returns
+        -------
+        Bitmap
+            The bits of the range.
+        """
+        length = stop - start
+        return Bitmap.from_int((self.to_int() >> start) & ((1 << length) - 1), length)
+
+
+class DictionaryArray:
+    """
+    Dictionary encoded str values: a table of the distinct values and one integer code
+    per value.
+
+    Comparisons, grouping and joins can work on the small integer codes instead of the
+    strings, and every distinct string is stored only once.
+
+    Parameters
+    ----------
+    codes : array
+        The index into `dictionary` of every value as `array('i')`, -1 for None.
+    dictionary : list[str]
+        The distinct values.
+    """
+
+    __slots__ = ("codes", "dictionary", "_index")
+
+    def __init__(self, codes: array, dictionary: list[str]) -> None:
+        self.codes = codes
+        self.dictionary = dictionary
+        self._index: dict[str, int] | None = None
+
+    @classmethod
+    def from_values(
+        cls, data: list, distinct: Iterable | None = None
+    ) -> "DictionaryArray":
+        """
+        Encodes a list of str values (or None).
+
+        Parameters
+        ----------
+        data : list
+            The values.
+        distinct : Iterable, optional
+            The distinct values of the data in the order of their first appearance (may
+            include None), if already known.
+
+        Returns
+        -------
+        DictionaryArray
+            The encoded values, the dictionary is in the order of the first appearance.
+        """
+        if distinct is None:
+            distinct = dict.fromkeys(data)
+        dictionary = [value for value in distinct if value is not None]
+        index = dict(zip(dictionary, range(len(dictionary))))
+        index[None] = -1
+        encoded = cls(array(CODE_TYPECODE, map(index.__getitem__, data)), dictionary)
+        del index[None]
+        encoded._index = index
+        return encoded
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str | None:
+        code = self.codes[index]
+        return None if code < 0 else self.dictionary[code]
+
+    def code_of(self, value: str) -> int:
+        """
+        Returns the code of a value.
+
+        Parameters
+        ----------
+        value : str
+            The value.
+
+        Returns
+        -------
+        int
+            The code, -1 if the value is not in the dictionary.
+        """
+        if self._index is None:
+            self._index = dict(zip(self.dictionary, range(len(self.dictionary))))
+        return self._index.get(value, -1)
+
+    def to_list(self) -> list:
+        """
+        Decodes the values.
+
+        Returns
+        -------
+        list
+            The values with None in place.
+        """
+        # code -1 refers to the appended None
+        return list(map((self.dictionary + [None]).__getitem__, self.codes))
+
+    def with_codes(self, codes: array) -> "DictionaryArray":
+        """
+        Creates values with the same dictionary and other codes.
+
+        Parameters
+        ----------
+        codes : array
+            The new codes.
+
+        Returns
+        -------
+        DictionaryArray
+            The values, sharing the dictionary.
+        """
+        encoded = DictionaryArray(codes, self.dictionary)
+        encoded._index = self._index
+        return encoded
+
+
+class StringArray:
+    """
+    str values stored in one contiguous UTF-8 buffer with the offsets of every value
+    (like Arrow strings).
+
+    Value i is `buffer[offsets[i]:offsets[i + 1]]` decoded from UTF-8. Compared to a
+    list of str objects there is no per value object overhead, and the two buffers can
+    be written or shared as they are. None values are stored as empty strings and must
+    be masked by a validity bitmap.
+
+    Parameters
+    ----------
+    offsets : array or memoryview
+        The start of every value in the buffer and the end of the last value as
+        `array('q')` (one more than the number of values), starting at 0.
+    buffer : bytes or memoryview
+        The UTF-8 encoded values, one after the other. A memoryview (e.g. of a memory
+        mapped file or shared memory) is never copied as a whole: single values are
+        copied when they are read and searches copy one chunk of `SEARCH_CHUNK` bytes at
+        a time.
+    """
+
+    __slots__ = ("offsets", "buffer")
+
+    # a scalar is compared by searching it in the buffer if it occurs in at most this
+    # fraction of the values, otherwise every value is compared
+    FIND_FRACTION = 0.05
+    # the number of bytes of a memoryview buffer that are searched at once
+    SEARCH_CHUNK = 1 << 20
+
+    def __init__(self, offsets: array | memoryview, buffer: bytes | memoryview) -> None:
+        self.offsets = offsets
+        self.buffer = buffer
+
+    @classmethod
+    def from_values(cls, data: Iterable) -> "StringArray":
+        """
+        Encodes str values (or None).
+
+        Parameters
+        ----------
+        data : Iterable
+            The values.
+
+        Returns
+        -------
+        StringArray
+            The encoded values, None is stored as an empty string.
+        """
+        encoded = [b"" if value is None else value.encode() for value in data]
+        return cls._from_parts(encoded)
+
+    @classmethod
+    def _from_parts(cls, parts: list) -> "StringArray":
+        """
+        Concatenates encoded values.
+
+        Parameters
+        ----------
+        parts : list
+            The UTF-8 encoded values as bytes-like objects.
+
+        Returns
+        -------
+        StringArray
+            The values.
+        """
+        offsets = array(OFFSET_TYPECODE, accumulate(map(len, parts), initial=0))
+        return cls(offsets, b"".join(parts))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.buffer[self.offsets[index] : self.offsets[index + 1]], "utf-8")
+
+    def _occurrences(self, pattern: bytes) -> Iterator[int]:
+        """
+        Finds all occurrences of an encoded value in the buffer.
+
+        Parameters
+        ----------
+        pattern : bytes
+            The UTF-8 encoded value, not empty.
+
+        Returns
+        -------
+        Iterator[int]
+            The position of every occurrence in ascending order (occurrences can
+            overlap).
+        """
+        buffer = self.buffer
+        step = len(buffer) if isinstance(buffer, bytes) else self.SEARCH_CHUNK
+        for start in range(0, len(buffer), step):
+            # a chunk overlaps the next one, so that occurrences crossing the boundary
+            # are found
+            chunk = (
+                buffer
+                if isinstance(buffer, bytes)
+                else bytes(buffer[start : start + step + len(pattern) - 1])
+            )
+            position = chunk.find(pattern)
+            # occurrences starting in the overlap are found in the next chunk
+            while 0 <= position < step:
+                yield start + position
+                position = chunk.find(pattern, position + 1)
+
+    def _slices(self, starts: Iterable[int], ends: Iterable[int]) -> Iterable[bytes]:
+        """
+        Returns the encoded bytes between pairs of offsets.
+
+        Parameters
+        ----------
+        starts : Iterable[int]
+            The start offsets.
+        ends : Iterable[int]
+            The end offsets.
+
+        Returns
+        -------
+        Iterable[bytes]
+            The encoded values.
+        """
+        buffer, slices = self.buffer, map(slice, starts, ends)
+        if isinstance(buffer, bytes):
+            return map(buffer.__getitem__, slices)
+        # slices of a memoryview are copied value by value, never the whole buffer
+        return map(bytes, map(buffer.__getitem__, slices))
+
+    def to_list(self) -> list[str]:
+        """
+        Decodes the values.
+
+        Returns
+        -------
+        list[str]
+            The values, empty strings in place of None.
+        """
+        return list(map(bytes.decode, self._slices(self.offsets, self.offsets[1:])))
+
+    def equal_scalar(self, value: str) -> bytes:
+        """
+        Compares every value with a str on the encoded bytes.
+
+        Parameters
+        ----------
+        value : str
+            The value to compare against.
+
+        Returns
+        -------
+        bytes
+            0x01 where the value is equal, 0x00 otherwise (None values are equal to "").
+        """
+        encoded = value.encode()
+        offsets = self.offsets
+        if not encoded:
+            return bytes(map(eq, offsets, offsets[1:]))
+        limit = int(len(self) * self.FIND_FRACTION)
+        positions = list(islice(self._occurrences(encoded), limit + 1))
+        if len(positions) > limit:
+            return bytes(map(eq, self._slices(offsets, offsets[1:]), repeat(encoded)))
+        # a value matches if one of the few occurrences in the whole buffer starts at
+        # its offset and ends at the offset of the next value
+        equal = bytearray(len(self))
+        for position in positions:
+            # empty values share their offset with the next value, take the last value
+            # starting here
+            index = bisect_right(offsets, position) - 1
+            if offsets[index] == position and offsets[index + 1] == position + len(
+                encoded
+            ):
+                equal[index] = 1
+        return bytes(equal)
+
+    def contains(self, pattern: bytes) -> bytes:
+        """
+        Tests if every value contains an encoded substring by searching the whole
+        buffer.
+
+        Parameters
+        ----------
+        pattern : bytes
+            The UTF-8 encoded substring.
+
+        Returns
+        -------
+        bytes
+            0x01 where the value contains the substring, 0x00 otherwise (None values are
+            empty strings).
+        """
+        if not pattern:
+            return b"\x01" * len(self)
+        offsets = self.offsets
+        found = bytearray(len(self))
+        end = 0
+        for position in self._occurrences(pattern):
+            if position < end:
+                continue  # later occurrences in the same value do not change the result
+            index = bisect_right(offsets, position) - 1
+            # an occurrence can span two values
+            if position + len(pattern) <= offsets[index + 1]:
+                found[index] = 1
+                end = offsets[index + 1]
+        return bytes(found)
+
+    def equal(self, other: "StringArray") -> bytes:
+        """
+        Compares the values element-wise with the values of another StringArray on the
+        encoded bytes.
+
+        Parameters
+        ----------
+        other : StringArray
+            The values to compare against, of the same length.
+
+        Returns
+        -------
+        bytes
+            0x01 where the values are equal, 0x00 otherwise (None values are equal to
+            "").
+        """
+        return bytes(
+            map(
+                eq,
+                self._slices(self.offsets, self.offsets[1:]),
+                other._slices(other.offsets, other.offsets[1:]),
+            )
+        )
+
+    def filter(self, selectors: bytes) -> "StringArray":
+        """
+        Keeps only the values where the selectors are non-zero.
+
+        Parameters
+        ----------
+        selectors : bytes
+            One byte per value, non-zero bytes select the value.
+
+        Returns
+        -------
+        StringArray
+            The selected values.
+        """
+        # select the offsets first, only the selected values are sliced
+        starts = compress(self.offsets, selectors)
+        ends = compress(self.offsets[1:], selectors)
+        return StringArray._from_parts(list(self._slices(starts, ends)))
+
+    def take(self, positions: Iterable[int]) -> "StringArray":
+        """
+        Gathers the values at the given positions.
+
+        Parameters
+        ----------
+        positions : Iterable[int]
+            The positions of the values to gather, -1 gives an empty string.
+
+        Returns
+        -------
+        StringArray
+            The gathered values.
+        """
+        # position -1 refers to an appended empty value
+        starts = as_array(self.offsets[:-1]) + array(OFFSET_TYPECODE, [0])
+        ends = as_array(self.offsets[1:]) + array(OFFSET_TYPECODE, [0])
+        positions = array(INT_TYPECODE, positions)
+        parts = self._slices(
+            map(starts.__getitem__, positions), map(ends.__getitem__, positions)
+        )
+        return StringArray._from_parts(list(parts))
+
+    def slice(self, start: int, stop: int) -> "StringArray":
+        """
+        Returns the values from `start` up to (excluding) `stop`.
+
+        Parameters
+        ----------
+        start : int
+            The first value, 0 <= start <= stop.
+        stop : int
+            The end of the range, stop <= length.
+
+        Returns
+        -------
+        StringArray
+            The values of the range.
+        """
+        first = self.offsets[start]
+        offsets = self.offsets[start : stop + 1]
+        if first:
+            offsets = array(OFFSET_TYPECODE, map(sub, offsets, repeat(first)))
+        return StringArray(offsets, self.buffer[first : self.offsets[stop]])
+
+
+# the values buffer of a Series (see `build_storage`): a numeric buffer of int and float
+# values, a list of objects, a Bitmap of bool values or encoded str values
+type Values = Numeric | list | Bitmap | DictionaryArray | StringArray
+
+
+class Selection:
+    """
+    The rows selected from a column by a boolean mask, computed once and applied to many
+    columns.
+
+    Dense selections are applied by compressing the whole column, sparse selections
+    by gathering the selected positions (a take), whichever touches less data.
+
+    Parameters
+    ----------
+    selectors : bytes
+        One byte per row, 0x01 selects the row and 0x00 drops it.
+    """
+
+    __slots__ = ("selectors", "count", "_positions")
+
+    # gather the positions if at most this fraction of the rows is selected
+    TAKE_FRACTION = 0.25
+
+    def __init__(self, selectors: bytes) -> None:
+        self.selectors = selectors
+        self.count = selectors.count(1)
+        self._positions: array | None = None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows of the column the selection is applied to.
+
+        Returns
+        -------
+        int
+            The number of rows.
+        """
+        return len(self.selectors)
+
+    @property
+    def positions(self) -> array:
+        """
+        The positions of the selected rows in ascending order.
+
+        Returns
+        -------
+        array
+            The positions as `array('q')`.
+        """
+        if self._positions is None:
+            self._positions = array(
+                INT_TYPECODE, compress(range(len(self.selectors)), self.selectors)
+            )
+        return self._positions
+
+    @property
+    def is_sparse(self) -> bool:
+        """
+        Whether the selection should be applied by gathering the selected positions.
+
+        Returns
+        -------
+        bool
+            True if only a small fraction of the rows is selected.
+        """
+        return self.count <= len(self.selectors) * self.TAKE_FRACTION
+
+    @overload
+    def apply(self, values: Bitmap) -> Bitmap: ...
+
+    @overload
+    def apply(self, values: Values) -> Values: ...
+
+    def apply(self, values: Values) -> Values:
+        """
+        Applies the selection to a values buffer or validity bitmap.
+
+        Parameters
+        ----------
+        values : Values
+            The buffer to select from.
+
+        Returns
+        -------
+        Values
+            The selected values, in the same kind of buffer.
+        """
+        if self.is_sparse:
+            return take_values(values, self.positions)
+        return filter_values(values, self.selectors)
+
+
+def numeric_buffer(data: Buffer) -> NumericView:
+    """
+    Wraps an object supporting the buffer protocol (e.g. an array, a numpy array or a
+    memoryview) as the values buffer of an int or float Series without copying.
+
+    Parameters
+    ----------
+    data : Buffer
+        The values: a one-dimensional contiguous buffer of 8, 16, 32 or 64-bit signed
+        integers, floats or doubles in the byte order of the machine.
+
+    Returns
+    -------
+    memoryview
+        A read-only view of the values cast to the typecode of their dtype (see
+        `INT_DTYPES` and `FLOAT_DTYPES`).
+
+    Raises
+    ------
+    ValueError
+        If the object does not support the buffer protocol or its format is not
+        supported.
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        raise ValueError(
+            f"data must be a list or support the buffer protocol (found {type(data)})"
+        ) from None
+    native = "<" if sys.byteorder == "little" else ">"
+    format = view.format.lstrip("@=" + native)
+    # the typecodes by itemsize, numpy exports int64 as "l" on most platforms and int32
+    # as "l" on Windows
+    typecode: Literal["b", "h", "i", "q", "f", "d"] | None = None
+    if len(format) == 1 and format in "bhilq":
+        typecode = _INT_TYPECODES.get(view.itemsize)
+    elif len(format) == 1 and format in "fd":
+        typecode = _FLOAT_TYPECODES.get(view.itemsize)
+    if typecode is None or view.ndim != 1 or not view.c_contiguous:
+        raise ValueError(
+            "buffers must be one-dimensional and contiguous with signed integers, floats or "
+            f"doubles in native byte order (found format {view.format!r}, itemsize "
+            f"{view.itemsize}, {view.ndim} dimensions)"
+        )
+    return view.toreadonly().cast("B").cast(typecode)
+
+
+def cast_view(view: memoryview, typecode: str) -> NumericView:
+    """
+    Casts a view of bytes to the format of an int or float array typecode.
+
+    Parameters
+    ----------
+    view : memoryview
+        The bytes of the values.
+    typecode : str
+        The typecode of an int or float width (see `INT_DTYPES` and `FLOAT_DTYPES`).
+
+    Returns
+    -------
+    memoryview
+        The values.
+    """
+    itemsize = array(typecode).itemsize
+    if typecode in FLOAT_DTYPES.values():
+        return view.cast(_FLOAT_TYPECODES[itemsize])
+    return view.cast(_INT_TYPECODES[itemsize])
+
+
+def validity_buffer(data: Buffer, length: int) -> Bitmap:
+    """
+    Wraps an object supporting the buffer protocol as a validity bitmap, copying it only
+    if it has bits set beyond `length`.
+
+    Parameters
+    ----------
+    data : Buffer
+        The packed bits, least significant bit first like the validity bitmaps of Arrow.
+        A set bit marks a valid value. May be longer than needed.
+    length : int
+        The number of values.
+
+    Returns
+    -------
+    Bitmap
+        The validity bitmap.
+
+    Raises
+    ------
+    ValueError
+        If the object does not support the buffer protocol or holds fewer than `length`
+        bits.
+    """
+    try:
+        view = memoryview(data).toreadonly().cast("B")
+    except TypeError:
+        raise ValueError(
+            f"validity must support the buffer protocol (found {type(data)})"
+        ) from None
+    size = (length + 7) // 8
+    if view.nbytes < size:
+        raise ValueError(
+            f"validity must hold at least {length} bits (found {view.nbytes * 8})"
+        )
+    bitmap = Bitmap(view[:size], length)
+    if length % 8 and view[size - 1] >> (length % 8):
+        # bits beyond the length must be zero
+        return Bitmap.from_int(bitmap.to_int() & ((1 << length) - 1), length)
+    return bitmap
+
+
+def combine_validity(left: Bitmap | None, right: Bitmap | None) -> Bitmap | None:
+    """
+    Combine two validity bitmaps so that a value is only valid if it is valid in both.
+
+    Parameters
+    ----------
+    left : Bitmap or None
+        The first validity bitmap (None means all values are valid).
+    right : Bitmap or None
+        The second validity bitmap (None means all values are valid).
+
+    Returns
+    -------
+    Bitmap or None
+        The combined validity bitmap (None if all values are valid).
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return left & right
+
+
+def count_nulls(validity: Bitmap | None) -> int:
+    """
+    Count the None values marked in a validity bitmap.
+
+    Parameters
+    ----------
+    validity : Bitmap or None
+        The validity bitmap (None means all values are valid).
+
+    Returns
+    -------
+    int
+        The number of cleared bits.
+    """
+    return 0 if validity is None else validity.length - validity.count()
+
+
+def build_storage(
+    data: list, data_type: type, null_count: int | None = None
+) -> tuple[Values, Bitmap | None]:
+    """
+    Convert a list of Python values (or None) into the physical storage of a Series.
+
+    int Series are stored in an `array('q')` (or a list if a value does not fit into 64
+    bits), float Series in an `array('d')`, bool Series in a Bitmap and str Series in a
+    list, or in a DictionaryArray if there are only few distinct values. None values are
+    replaced by a placeholder (0, 0.0, False) in the typed buffers and tracked in a
+    separate validity bitmap.
+
+    Parameters
+    ----------
+    data : list
+        The values of the Series. Must be of a single type or None.
+    data_type : type
+        The type of the values.
+    null_count : int, optional
+        The number of None values if already known, saves scanning the data for None.
+
+    Returns
+    -------
+    tuple[Values, Bitmap or None]
+        The values buffer and the validity bitmap (None if there are no None values).
+    """
+    has_none = None in data if null_count is None else null_count > 0
+    validity = Bitmap.from_not_none(data) if has_none else None
+
+    if data_type is bool:
+        return Bitmap.from_bools(data), validity
+    if data_type is str:
+        if len(data) >= DICTIONARY_MIN_LENGTH:
+            distinct = dict.fromkeys(data)
+            if len(distinct) <= len(data) * DICTIONARY_MAX_FRACTION:
+                return DictionaryArray.from_values(data, distinct), validity
+        return list(data), validity
+
+    placeholder = 0.0 if data_type is float else 0
+    values = [placeholder if x is None else x for x in data] if has_none else data
+    try:
+        return array(
+            FLOAT_TYPECODE if data_type is float else INT_TYPECODE, values
+        ), validity
+    except OverflowError:
+        # python ints are unbounded, keep values that do not fit into 64 bits as objects
+        return list(data), validity
+
+
+def to_pylist(values: Values, validity: Bitmap | None) -> list:
+    """
+    Convert the physical storage of a Series back into a list of Python values (or
+    None).
+
+    Parameters
+    ----------
+    values : Values
+        The values buffer.
+    validity : Bitmap or None
+        The validity bitmap (None if there are no None values).
+
+    Returns
+    -------
+    list
+        The values, with None where the validity bit is cleared.
+    """
+    if isinstance(values, list):
+        # object storage keeps None in place
+        return list(values)
+    if isinstance(values, DictionaryArray):
+        return values.to_list()
+    if isinstance(values, (Bitmap, StringArray)):
+        return _set_none(values.to_list(), validity)
+    return _set_none(values.tolist(), validity)
+
+
+def _set_none(data: list, validity: Bitmap | None) -> list:
+    """
+    Sets the values where the validity bit is cleared to None, in place.
+
+    Parameters
+    ----------
+    data : list
+        The values.
+    validity : Bitmap or None
+        The validity bitmap (None if there are no None values).
+
+    Returns
+    -------
+    list
+        The values.
+    """
+    if validity is not None:
+        valid = validity.to_bytes01()
+        for i in compress(range(len(data)), map((0).__eq__, valid)):
+            data[i] = None
+    return data
+
+
+@overload
+def filter_values(values: Bitmap, selectors: bytes) -> Bitmap: ...
+
+
+@overload
+def filter_values(values: Values, selectors: bytes) -> Values: ...
+
+
+def filter_values(values: Values, selectors: bytes) -> Values:
+    """
+    Keep only the values where the selectors are non-zero.
+
+    Parameters
+    ----------
+    values : Values
+        The values buffer.
+    selectors : bytes
+        One byte per value, non-zero bytes select the value.
+
+    Returns
+    -------
+    Values
+        The selected values, in the same kind of buffer.
+    """
+    if isinstance(values, Bitmap):
+        return values.filter(selectors)
+    if isinstance(values, list):
+        return list(compress(values, selectors))
+    if isinstance(values, DictionaryArray):
+        return values.with_codes(
+            array(CODE_TYPECODE, compress(values.codes, selectors))
+        )
+    if isinstance(values, StringArray):
+        return values.filter(selectors)
+    return array(typecode_of(values), compress(values, selectors))
+
+
+@overload
+def take_values(values: Bitmap, positions: Iterable[int]) -> Bitmap: ...
+
+
+@overload
+def take_values(values: Values, positions: Iterable[int]) -> Values: ...
+
+
+def take_values(values: Values, positions: Iterable[int]) -> Values:
+    """
+    Gather the values at the given positions.
+
+    Parameters
+    ----------
+    values : Values
+        The values buffer.
+    positions : Iterable[int]
+        The positions of the values to gather.
+
+    Returns
+    -------
+    Values
+        The gathered values, in the same kind of buffer.
+    """
+    if isinstance(values, Bitmap):
+        return values.take(positions)
+    if isinstance(values, list):
+        return list(map(values.__getitem__, positions))
+    if isinstance(values, DictionaryArray):
+        return values.with_codes(
+            array(CODE_TYPECODE, map(values.codes.__getitem__, positions))
+        )
+    if isinstance(values, StringArray):
+        return values.take(positions)
+    return array(typecode_of(values), map(values.__getitem__, positions))
+
+
+@overload
+def slice_values(values: Bitmap, start: int, stop: int) -> Bitmap: ...
+
+
+@overload
+def slice_values(values: Values, start: int, stop: int) -> Values: ...
+
+
+def slice_values(values: Values, start: int, stop: int) -> Values:
+    """
+    Return the values from `start` up to (excluding) `stop`.
+
+    Parameters
+    ----------
+    values : Values
+        The values buffer or validity bitmap.
+    start : int
+        The first value, 0 <= start <= stop.
+    stop : int
+        The end of the range, stop <= length.
+
+    Returns
+    -------
+    Values
+        The values of the range, in the same kind of buffer.
+    """
+    if isinstance(values, (Bitmap, StringArray)):
+        return values.slice(start, stop)
+    if isinstance(values, DictionaryArray):
+        return values.with_codes(values.codes[start:stop])
+    return values[start:stop]
+
+
+def take_nullable(
+    values: Values, validity: Bitmap | None, positions: array
+) -> tuple[Values, Bitmap | None]:
+    """
+    Gather the values and validity at the given positions, where position -1 gives None.
+
+    Parameters
+    ----------
+    values : Values
+        The values buffer.
+    validity : Bitmap or None
+        The validity bitmap (None if there are no None values).
+    positions : array
+        The positions of the values to gather as `array('q')`, -1 for a missing value.
+
+    Returns
+    -------
+    tuple[Values, Bitmap or None]
+        The gathered values and validity.
+    """
+    if -1 not in positions:
+        return take_values(
+            values, positions
+        ), None if validity is None else validity.take(positions)
+
+    # append a placeholder (0, 0.0, cleared bit, None, code -1 or empty string) and an
+    # invalid bit, which position -1 refers to
+    taken: Values
+    if isinstance(values, Bitmap):
+        bits = values.to_bytes01() + b"\x00"
+        taken = Bitmap.from_bytes01(bytes(map(bits.__getitem__, positions)))
+    elif isinstance(values, list):
+        taken = list(map((values + [None]).__getitem__, positions))
+    elif isinstance(values, DictionaryArray):
+        codes = as_array(values.codes) + array(CODE_TYPECODE, [-1])
+        taken = values.with_codes(
+            array(CODE_TYPECODE, map(codes.__getitem__, positions))
+        )
+    elif isinstance(values, StringArray):
+        # position -1 gives an empty string
+        taken = values.take(positions)
+    else:
+        typecode = typecode_of(values)
+        taken = array(
+            typecode,
+            map((as_array(values) + array(typecode, [0])).__getitem__, positions),
+        )
+    valids = b"\x01" * len(values) if validity is None else validity.to_bytes01()
+    valids += b"\x00"
+    return taken, Bitmap.from_bytes01(bytes(map(valids.__getitem__, positions)))
+
+
+def storage_bytes(
+    values: Values | bytes | bytearray | None, deep: bool = False
+) -> tuple[int, int]:
+    """
+    Measures the memory of a buffer.
+
+    Parameters
+    ----------
+    values : Values or bytes or bytearray or None
+        An array, memoryview, bytes, Bitmap, list, DictionaryArray, StringArray or None.
+    deep : bool, optional
+        Whether the Python objects referenced by lists (str and large int values, the
+        dictionary of a DictionaryArray) are measured, by default False.
+
+    Returns
+    -------
+    tuple[int, int]
+        The bytes of the buffer itself (the pointers of a list) and the bytes of the
+        distinct Python objects it references (0 if not `deep`).
+    """
+    if values is None:
+        return 0, 0
+    if isinstance(values, array):
+        return len(values) * values.itemsize, 0
+    if isinstance(values, memoryview):
+        return values.nbytes, 0
+    if isinstance(values, (bytes, bytearray)):
+        return len(values), 0
+    if isinstance(values, Bitmap):
+        return storage_bytes(values.buffer)
+    if isinstance(values, StringArray):
+        return storage_bytes(values.offsets)[0] + storage_bytes(values.buffer)[0], 0
+    if isinstance(values, DictionaryArray):
+        dictionary, objects = storage_bytes(values.dictionary, deep)
+        return storage_bytes(values.codes)[0] + dictionary, objects
+    # a list, every distinct object is counted once (None is not counted)
+    objects = 0
+    if deep:
+        distinct = {id(value): value for value in values if value is not None}
+        objects = sum(map(sys.getsizeof, distinct.values()))
+    return sys.getsizeof(values), objects
@@ -1,4 +1,12 @@
+from multiprocessing.shared_memory import SharedMemory
+from os import PathLike
 from typing import Self, overload
+
+from pandastwo import sorting
+from pandastwo.buffers import Selection
+from pandastwo.expressions import Expr
+from pandastwo.groupby import GroupBy
+from pandastwo.merge import merge
 from pandastwo.series import Series
 
 
@@ -44,6 +52,26 @@ class DataFrame:
 
         self.data = data
 
+    @classmethod
+    def _from_trusted(cls, data: dict[str, Series]) -> Self:
+        """
+        Create a DataFrame from columns produced by the library itself, skipping all
+        validation.
+
+        Parameters
+        ----------
+        data : dict[str, Series]
+            A dictionary of column names and Series objects of the same length.
+
+        Returns
+        -------
+        DataFrame
+            The new DataFrame.
+        """
+        df = cls.__new__(cls)
+        df.data = data
+        return df
+
     def _check_series_lengths(self, data: dict[str, Series]) -> None:
         """
         Validate that all Series objects in the data have the same length.
@@ -66,16 +94,18 @@ class DataFrame:
     def __getitem__(self, index: str) -> Series: ...
 
     @overload
-    def __getitem__(self, index: Series) -> Self: ...
+    def __getitem__(self, index: Series | Expr) -> "DataFrame": ...
 
-    def __getitem__(self, index: str | Series) -> Series | Self:
+    def __getitem__(self, index: str | Series | Expr) -> "Series | DataFrame":
         """
-        Retrieve a column by name or filter rows using a boolean Series.
+        Retrieve a column by name or filter rows using a boolean Series or expression.
 
         Parameters
         ----------
-        index : str or Series
-            The column name as a string or a boolean Series for row filtering.
+        index : str or Series or Expr
+            The column name as a string or a boolean Series for row filtering. A lazy
+            boolean expression (see `Series.lazy()`) is evaluated in a single pass
+            without creating intermediate Series.
 
         Returns
         -------
@@ -91,7 +121,11 @@ class DataFrame:
         ValueError
             If the boolean Series has invalid length or contains non-boolean values.
         """
-        if not isinstance(index, str) and not isinstance(index, Series):
+        if (
+            not isinstance(index, str)
+            and not isinstance(index, Series)
+            and not isinstance(index, Expr)
+        ):
             raise ValueError(
                 f"a dataframe index must be a string or a Series of booleans (found: {type(index)})"
             )
@@ -101,17 +135,363 @@ class DataFrame:
                 raise KeyError(f"key {index} not found in dataframe")
             return self.data[index]
 
-        if isinstance(index, Series):
-            if len(index) != len(next(iter(self.data.values()))):
+        return self._select(self._mask_selection(index))
+
+    def _mask_selection(self, index: Series | Expr) -> Selection:
+        """
+        Validates a boolean Series or expression and converts it into a selection of
+        rows.
+
+        Parameters
+        ----------
+        index : Series or Expr
+            The mask, True selects the row.
+
+        Returns
+        -------
+        Selection
+            The selected rows, shared by all columns.
+
+        Raises
+        ------
+        ValueError
+            If the mask has invalid length or is not of type bool.
+        """
+        if isinstance(index, Expr):
+            if index.length != len(next(iter(self.data.values()))):
+                raise ValueError(
+                    f"Boolean expression index must have the same length as the data (index length: {index.length}, data length: {len(next(iter(self.data.values())))})"
+                )
+            if index.data_type is not bool:
                 raise ValueError(
-                    f"Boolean Series index must have the same length as the data (index length: {len(index)}, data length: {len(list(self.data.values())[0])})"
+                    f"Boolean expression index must be of type bool (found: {index.data_type})"
                 )
-            for k in index.data:
-                if k is not None and not isinstance(k, bool):
-                    raise ValueError(
-                        f"Boolean Series index must contain only booleans or None type (found: {type(k)})"
-                    )
-            return DataFrame({k: self.data[k][index] for k in self.data.keys()})
+            if index._use_numpy():
+                # evaluated with the vectorized kernels, filter with the resulting mask
+                return index.collect()._selection()
+            return Selection(index._selectors())
+
+        if len(index) != len(next(iter(self.data.values()))):
+            raise ValueError(
+                f"Boolean Series index must have the same length as the data (index length: {len(index)}, data length: {len(list(self.data.values())[0])})"
+            )
+        if index.data_type is not bool:
+            raise ValueError(
+                f"Boolean Series index must contain only booleans or None type (found: {index.data_type})"
+            )
+        # the mask is validated and converted to a selection once for all columns
+        return index._selection()
+
+    def _select(self, selection: Selection) -> "DataFrame":
+        """
+        Keep only the selected rows of every column.
+
+        Parameters
+        ----------
+        selection : Selection
+            The selected rows, must have the same length as the columns.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with the selected rows.
+        """
+        return DataFrame._from_trusted(
+            {k: series._select(selection) for k, series in self.data.items()}
+        )
+
+    def view(self, index: Series | Expr) -> "DataFrame":
+        """
+        Filters rows with a boolean Series or expression like `df[index]`, but without
+        copying.
+
+        Every column becomes a view (see `Series.view()`) sharing the same selected
+        positions, the buffers of a column are only created once the column is used.
+
+        Parameters
+        ----------
+        index : Series or Expr
+            The mask for selecting rows.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame of column views.
+
+        Raises
+        ------
+        ValueError
+            If the index is not a boolean Series or expression of the same length.
+        """
+        if not isinstance(index, (Series, Expr)):
+            raise ValueError(
+                f"index must be a Series of booleans or a boolean expression (found: {type(index)})"
+            )
+        selection = self._mask_selection(index)
+        return DataFrame._from_trusted(
+            {k: series._view_of(selection) for k, series in self.data.items()}
+        )
+
+    def copy(self) -> "DataFrame":
+        """
+        Returns a copy of the DataFrame where every column has its own buffers.
+
+        Returns
+        -------
+        DataFrame
+            The copy.
+        """
+        return DataFrame._from_trusted(
+            {k: series.copy() for k, series in self.data.items()}
+        )
+
+    def memory_usage(self, deep: bool = False) -> "DataFrame":
+        """
+        Returns the memory used by the buffers of every column in bytes (see
+        `Series.memory_usage()`).
+
+        Parameters
+        ----------
+        deep : bool, optional
+            Whether the Python objects referenced by the values are measured as well, by
+            default False.
+
+        Returns
+        -------
+        DataFrame
+            One row per column with the columns "column", "values", "validity",
+            "objects" and "total".
+        """
+        usages = {name: series.memory_usage(deep) for name, series in self.data.items()}
+        result: dict[str, Series] = {"column": Series(list(usages))}
+        for key in ("values", "validity", "objects", "total"):
+            result[key] = Series([usage[key] for usage in usages.values()])
+        return DataFrame._from_trusted(result)
+
+    def compact(self) -> "DataFrame":
+        """
+        Returns the DataFrame with every column in its most compact storage (see
+        `Series.compact()`).
+
+        Returns
+        -------
+        DataFrame
+            The compact DataFrame, columns that are already compact are shared.
+        """
+        return DataFrame._from_trusted(
+            {k: series.compact() for k, series in self.data.items()}
+        )
+
+    def groupby(self, keys: str | list[str]) -> GroupBy:
+        """
+        Groups the rows by the values of one or more key columns.
+
+        Parameters
+        ----------
+        keys : str or list[str]
+            The name of the key column or a list of names.
+
+        Returns
+        -------
+        GroupBy
+            The groups, aggregate them with `GroupBy.agg()`.
+
+        Raises
+        ------
+        ValueError
+            If the keys are not a string or a non-empty list of strings.
+        KeyError
+            If a key column does not exist.
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+        if (
+            not isinstance(keys, list)
+            or not keys
+            or not all(isinstance(key, str) for key in keys)
+        ):
+            raise ValueError(
+                f"groupby keys must be a string or a non-empty list of strings (found: {keys})"
+            )
+        return GroupBy(self, keys)
+
+    def merge(
+        self,
+        other: Self,
+        on: str | list[str],
+        how: str = "inner",
+        suffixes: tuple[str, str] = ("_x", "_y"),
+    ) -> "DataFrame":
+        """
+        Joins the DataFrame with another DataFrame on key columns (hash join).
+
+        Rows with None in a key column never match. The rows of the result are in the
+        order of the rows of this DataFrame, rows with several matches are repeated in
+        the order of the matches.
+
+        Parameters
+        ----------
+        other : DataFrame
+            The right DataFrame.
+        on : str or list[str]
+            The key columns, must exist in both DataFrames with the same data types.
+        how : str, optional
+            "inner" keeps only matching rows, "left" keeps all rows of this DataFrame
+            (with None in the columns of `other` if there is no match). By default
+            "inner".
+        suffixes : tuple[str, str], optional
+            Appended to the names of non-key columns that exist in both DataFrames. By
+            default ("_x", "_y").
+
+        Returns
+        -------
+        DataFrame
+            The key columns and the other columns of this DataFrame followed by the
+            non-key columns of `other`.
+
+        Raises
+        ------
+        ValueError
+            If `other` is not a DataFrame, the arguments are invalid or the key columns
+            have different data types.
+        KeyError
+            If a key column does not exist.
+        """
+        if not isinstance(other, DataFrame):
+            raise ValueError(f"other must be a DataFrame (found: {type(other)})")
+        return merge(self, other, on, how, suffixes)
+
+    def sort_values(
+        self,
+        by: str | list[str],
+        ascending: bool | list[bool] = True,
+        na_position: str = "last",
+    ) -> "DataFrame":
+        """
+        Sorts the rows stably by one or more columns.
+
+        The last key is sorted first, every earlier key then stably sorts the resulting
+        order, so rows with equal values in a key stay ordered by the following keys.
+
+        Parameters
+        ----------
+        by : str or list[str]
+            The name of the key column or a list of names, the first key is the most
+            significant one.
+        ascending : bool or list[bool], optional
+            The sort direction of all keys or of every key, by default True.
+        na_position : str, optional
+            "last" or "first", where None values are placed. By default "last".
+
+        Returns
+        -------
+        DataFrame
+            The sorted DataFrame.
+
+        Raises
+        ------
+        ValueError
+            If an argument is invalid.
+        KeyError
+            If a key column does not exist.
+        """
+        if isinstance(by, str):
+            by = [by]
+        if (
+            not isinstance(by, list)
+            or not by
+            or not all(isinstance(key, str) for key in by)
+        ):
+            raise ValueError(
+                f"by must be a string or a non-empty list of strings (found: {by})"
+            )
+        keys = [self[key] for key in by]
+        ascending = sorting.check_sort_arguments(ascending, na_position, len(keys))
+        positions = sorting.argsort(keys, ascending, na_position)
+        return DataFrame._from_trusted(
+            {k: series._take(positions) for k, series in self.data.items()}
+        )
+
+    def save(self, path: str | PathLike) -> None:
+        """
+        Writes the DataFrame into a binary file that `pandastwo.load()` reads back.
+
+        The buffers of every column are written as they are (values, validity bitmap,
+        string offsets and dictionaries) after a header with the data types, so loading
+        needs no parsing and can memory map the file.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            The file, overwritten if it exists.
+        """
+        from pandastwo.io import save
+
+        save(self, path)
+
+    def to_shared(self, name: str) -> SharedMemory:
+        """
+        Copies the DataFrame into a shared memory segment that other processes attach
+        with `attach_shared()`.
+
+        The segment holds the buffers of every column (values, validity bitmap, string
+        offsets and dictionaries) in the format of `save()`, after a header that
+        describes where they are.
+
+        Parameters
+        ----------
+        name : str
+            The name of the segment.
+
+        Returns
+        -------
+        SharedMemory
+            The segment. It exists until it is unlinked (`segment.unlink()`), attached
+            DataFrames stay usable after that until they are released.
+
+        Raises
+        ------
+        ValueError
+            If the name is not a string.
+        FileExistsError
+            If a segment with the name already exists.
+        """
+        from pandastwo import shared
+
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"name must be a non-empty string (found: {name!r})")
+        return shared.create(self, name)
+
+    @classmethod
+    def attach_shared(cls, name: str) -> "DataFrame":
+        """
+        Creates a read-only DataFrame on top of a shared memory segment created by
+        `to_shared()`.
+
+        The columns use the shared buffers without copying or parsing them, so every
+        process that attaches the segment adds no memory for the values.
+
+        Parameters
+        ----------
+        name : str
+            The name of the segment.
+
+        Returns
+        -------
+        DataFrame
+            The DataFrame, it keeps the segment mapped as long as it (or a column of it)
+            is used.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the segment does not exist.
+        ValueError
+            If the segment was not created by `to_shared()`.
+        """
+        from pandastwo import shared
+
+        return shared.attach(name)
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,541 @@
+"""
+Lazily evaluated expressions over Series.
+
+`Series.lazy()` returns an `Expr`. Operators on an `Expr` do not compute anything, they
+build an expression tree which is type checked immediately (with the same rules as the
+eager operators) and evaluated only when `Expr.collect()` is called or the expression is
+used to filter a DataFrame.
+
+Without numpy the whole tree is compiled into a single Python function that evaluates
+every row in one pass, so no intermediate Series are allocated. If the numpy kernels are
+used for the operands, the tree is evaluated node by node with the vectorized kernels
+instead, which is faster than any pure Python loop.
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+from itertools import repeat
+from operator import is_
+from typing import TYPE_CHECKING, Any
+
+from pandastwo import numpy_backend
+
+if TYPE_CHECKING:
+    from pandastwo.series import Series
+
+_NUMERIC = {int, float}
+
+# operation name -> (python operator in generated code, name of the Series method)
+_ARITHMETIC = {
+    "add": ("+", "__add__"),
+    "sub": ("-", "__sub__"),
+    "mul": ("*", "__mul__"),
+    "truediv": ("/", "__truediv__"),
+}
+_COMPARISON = {
+    "lt": ("<", "__lt__"),
+    "le": ("<=", "__le__"),
+    "gt": (">", "__gt__"),
+    "ge": (">=", "__ge__"),
+    "ne": ("!=", "__ne__"),
+}
+_BOOLEAN = {
+    "and": ("&", "__and__"),
+    "or": ("|", "__or__"),
+    "xor": ("^", "__xor__"),
+}
+
+
+class Expr:
+    """
+    A node of a lazily evaluated expression tree.
+
+    Expressions are created with `Series.lazy()` and combined with the same operators as
+    Series. Scalars and Series can be used as operands as well.
+
+    Attributes
+    ----------
+    operation : str
+        The name of the operation ("series" and "scalar" for leaves).
+    operands : tuple
+        The child expressions (the Series or scalar for leaves).
+    data_type : type
+        The type of the values this expression evaluates to.
+    length : int or None
+        The length of the result (None for scalars).
+    """
+
+    __slots__ = ("operation", "operands", "data_type", "length")
+
+    def __init__(
+        self, operation: str, operands: tuple, data_type: type, length: int | None
+    ) -> None:
+        self.operation = operation
+        self.operands = operands
+        self.data_type = data_type
+        self.length = length
+
+    @classmethod
+    def _wrap(cls, value: object) -> "Expr":
+        """
+        Converts an operand into an expression.
+
+        Parameters
+        ----------
+        value : Expr or Series or int or float or bool or str
+            The operand.
+
+        Returns
+        -------
+        Expr
+            The expression.
+
+        Raises
+        ------
+        ValueError
+            If the operand can not be used in an expression.
+        """
+        from pandastwo.series import Series
+
+        if isinstance(value, Expr):
+            return value
+        if isinstance(value, Series):
+            return cls("series", (value,), value.data_type, len(value))
+        if type(value) in {int, float, bool, str}:
+            return cls("scalar", (value,), type(value), None)
+        raise ValueError(
+            f"Only expressions, Series or scalars can be used in expressions (found {type(value)})"
+        )
+
+    def _binary(self, other: object, operation: str, reflected: bool = False) -> "Expr":
+        """
+        Builds and type checks a node with two operands.
+
+        Parameters
+        ----------
+        other : object
+            The other operand.
+        operation : str
+            The name of the operation.
+        reflected : bool, optional
+            Whether `other` is the left operand, by default False.
+
+        Returns
+        -------
+        Expr
+            The new expression.
+
+        Raises
+        ------
+        ValueError
+            If the operands have different lengths or types that are not valid for the
+            operation.
+        """
+        left, right = self, Expr._wrap(other)
+        if reflected:
+            left, right = right, left
+        if (
+            left.length is not None
+            and right.length is not None
+            and left.length != right.length
+        ):
+            raise ValueError(
+                f"Series must have the same length for {operation} operations (found {left.length} and {right.length})"
+            )
+        types = (left.data_type, right.data_type)
+
+        if operation in _ARITHMETIC:
+            if types[0] not in _NUMERIC or types[1] not in _NUMERIC:
+                raise ValueError(
+                    f"Series must have numeric data types to do math operations (found {types[0]} and {types[1]})"
+                )
+            data_type = float if float in types or operation == "truediv" else int
+        elif operation in _COMPARISON:
+            # str values are compared lexicographically
+            if not (set(types) <= _NUMERIC or types[0] is types[1] is str):
+                raise ValueError(
+                    f"Series must both be numeric or both be of type str to be compared (found {types[0]} and {types[1]})"
+                )
+            data_type = bool
+        elif operation == "eq":
+            if types[0] is not types[1]:
+                raise ValueError(
+                    f"Series must have the same data type for equality operations (found {types[0]} and {types[1]})"
+                )
+            data_type = bool
+        else:
+            if types[0] is not bool or types[1] is not bool:
+                raise ValueError(
+                    f"Series must have the same data type bool, currently: {types[0]} and {types[1]}"
+                )
+            data_type = bool
+
+        length = left.length if left.length is not None else right.length
+        return Expr(operation, (left, right), data_type, length)
+
+    def __add__(self, other: object) -> "Expr":
+        return self._binary(other, "add")
+
+    def __radd__(self, other: object) -> "Expr":
+        return self._binary(other, "add", reflected=True)
+
+    def __sub__(self, other: object) -> "Expr":
+        return self._binary(other, "sub")
+
+    def __rsub__(self, other: object) -> "Expr":
+        return self._binary(other, "sub", reflected=True)
+
+    def __mul__(self, other: object) -> "Expr":
+        return self._binary(other, "mul")
+
+    def __rmul__(self, other: object) -> "Expr":
+        return self._binary(other, "mul", reflected=True)
+
+    def __truediv__(self, other: object) -> "Expr":
+        return self._binary(other, "truediv")
+
+    def __rtruediv__(self, other: object) -> "Expr":
+        return self._binary(other, "truediv", reflected=True)
+
+    def __lt__(self, other: object) -> "Expr":
+        return self._binary(other, "lt")
+
+    def __le__(self, other: object) -> "Expr":
+        return self._binary(other, "le")
+
+    def __gt__(self, other: object) -> "Expr":
+        return self._binary(other, "gt")
+
+    def __ge__(self, other: object) -> "Expr":
+        return self._binary(other, "ge")
+
+    def __ne__(self, other: object) -> "Expr":  # type: ignore[override]
+        return self._binary(other, "ne")
+
+    def __eq__(self, other: object) -> "Expr":  # type: ignore[override]
+        return self._binary(other, "eq")
+
+    def __and__(self, other: object) -> "Expr":
+        return self._binary(other, "and")
+
+    def __rand__(self, other: object) -> "Expr":
+        return self._binary(other, "and", reflected=True)
+
+    def __or__(self, other: object) -> "Expr":
+        return self._binary(other, "or")
+
+    def __ror__(self, other: object) -> "Expr":
+        return self._binary(other, "or", reflected=True)
+
+    def __xor__(self, other: object) -> "Expr":
+        return self._binary(other, "xor")
+
+    def __rxor__(self, other: object) -> "Expr":
+        return self._binary(other, "xor", reflected=True)
+
+    def __invert__(self) -> "Expr":
+        if self.data_type is not bool:
+            raise ValueError(
+                f"Series must have the data type bool to be inverted (found: {self.data_type})"
+            )
+        return Expr("invert", (self,), bool, self.length)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __len__(self) -> int:
+        """
+        Returns the length of the Series this expression evaluates to.
+
+        Returns
+        -------
+        int
+            The length of the result.
+
+        Raises
+        ------
+        TypeError
+            If the expression is a scalar.
+        """
+        if self.length is None:
+            raise TypeError("a scalar expression has no length")
+        return self.length
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the expression.
+
+        Returns
+        -------
+        str
+            The expression in infix notation.
+        """
+        if self.operation == "series":
+            return f"<Series[{self.data_type.__name__}] of length {self.length}>"
+        if self.operation == "scalar":
+            return repr(self.operands[0])
+        if self.operation == "invert":
+            return f"~{self.operands[0]!r}"
+        symbol = {**_ARITHMETIC, **_COMPARISON, **_BOOLEAN, "eq": ("==", "")}
+        left, right = self.operands
+        return f"({left!r} {symbol[self.operation][0]} {right!r})"
+
+    def _series_leaves(self) -> list["Series"]:
+        """
+        Returns the distinct Series used in the expression, in order of appearance.
+
+        Returns
+        -------
+        list[Series]
+            The Series leaves.
+        """
+        leaves: dict[int, Series] = {}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.operation == "series":
+                leaves.setdefault(id(node.operands[0]), node.operands[0])
+            elif node.operation != "scalar":
+                stack.extend(reversed(node.operands))
+        return list(leaves.values())
+
+    def _use_numpy(self) -> bool:
+        """
+        Checks whether the vectorized kernels would be used for the operands.
+
+        Returns
+        -------
+        bool
+            True if the expression should be evaluated node by node.
+        """
+        return numpy_backend.is_used(*self._series_leaves())
+
+    def _evaluate_eager(self) -> "Series":
+        """
+        Evaluates the expression node by node with the eager Series operators.
+
+        Returns
+        -------
+        Series
+            The result.
+        """
+        if self.operation == "series":
+            return self.operands[0]
+        if self.operation == "invert":
+            return ~self.operands[0]._evaluate_eager()
+
+        left, right = self.operands
+        x = left.operands[0] if left.operation == "scalar" else left._evaluate_eager()
+        y = (
+            right.operands[0]
+            if right.operation == "scalar"
+            else right._evaluate_eager()
+        )
+        if self.operation == "eq":
+            return x == y
+        method = {**_ARITHMETIC, **_COMPARISON, **_BOOLEAN}[self.operation][1]
+        if left.operation == "scalar":
+            # only arithmetic and boolean operations can have a scalar as the left
+            # operand, use the reflected operator of the Series
+            return getattr(y, method.replace("__", "__r", 1))(x)
+        return getattr(x, method)(y)
+
+    def _compile(self) -> tuple[Callable, list["Series"], bool]:
+        """
+        Compiles the whole expression into one Python function evaluating a single row.
+
+        Returns
+        -------
+        tuple[Callable, list[Series], bool]
+            A function returning the list of results for the given columns and scalars,
+            the Series to pass to it and whether the result can contain None.
+        """
+        leaves = self._series_leaves()
+        columns = {id(series): i for i, series in enumerate(leaves)}
+        scalars: list[object] = []
+        code, nullable = _generate(self, columns, scalars, [0])
+
+        rows = ", ".join(f"r{i}" for i in range(len(leaves)))
+        params = [f"c{i}" for i in range(len(leaves))] + [
+            f"s{i}" for i in range(len(scalars))
+        ]
+        iterator = (
+            "c0" if len(leaves) == 1 else f"zip({', '.join(params[: len(leaves)])})"
+        )
+        function = _build_function(
+            f"def fused({', '.join(params)}):\n"
+            f"    return [{code} for {rows} in {iterator}]\n"
+        )
+        return (lambda *columns: function(*columns, *scalars)), leaves, nullable
+
+    def _columns(self, leaves: list["Series"]) -> list[list]:
+        """
+        Returns the values of the Series leaves as lists for the compiled function.
+
+        Series without None values pass their raw values, which avoids building the None
+        list.
+
+        Parameters
+        ----------
+        leaves : list[Series]
+            The Series leaves.
+
+        Returns
+        -------
+        list[list]
+            The values of every leaf.
+        """
+        return [s.data if s.has_nulls else s._value_list() for s in leaves]
+
+    def collect(self) -> "Series":
+        """
+        Evaluates the expression.
+
+        Returns
+        -------
+        Series
+            The result of the expression.
+        """
+        from pandastwo.series import Series, _in_operand_width
+
+        if self.operation == "series":
+            return self.operands[0]
+        if self._use_numpy():
+            return self._evaluate_eager()
+
+        function, leaves, nullable = self._compile()
+        data = function(*self._columns(leaves))
+        null_count = data.count(None) if nullable else 0
+        # like the eager operators, arithmetic on narrow Series gives narrow results
+        return _in_operand_width(
+            Series._from_trusted(data, self.data_type, null_count), *leaves
+        )
+
+    def _selectors(self) -> bytes:
+        """
+        Evaluates a bool expression into filter selectors (one byte per row, 1 where
+        True).
+
+        Returns
+        -------
+        bytes
+            The selectors.
+
+        Raises
+        ------
+        ValueError
+            If the expression is not of type bool.
+        """
+        if self.data_type is not bool:
+            raise ValueError(
+                f"Boolean expression index must be of type bool (found: {self.data_type})"
+            )
+        if self.operation == "series" or self._use_numpy():
+            # None values of a bool Series are stored as cleared bits
+            return self._evaluate_eager()._bits().to_bytes01()
+        function, leaves, nullable = self._compile()
+        results = function(*self._columns(leaves))
+        if nullable:
+            return bytes(map(is_, results, repeat(True)))
+        return bytes(results)
+
+
+def _generate(
+    node: Expr, columns: dict[int, int], scalars: list[object], counter: list[int]
+) -> tuple[str, bool]:
+    """
+    Generates the Python code evaluating one row of an expression.
+
+    None values propagate exactly like in the eager operators, and both operands are
+    always evaluated so that errors (e.g. division by zero) are raised in the same
+    cases.
+
+    Parameters
+    ----------
+    node : Expr
+        The expression to generate code for.
+    columns : dict[int, int]
+        Maps the id of every Series leaf to its column number.
+    scalars : list[object]
+        The scalars of the expression, filled while generating.
+    counter : list[int]
+        Counter for unique temporary variable names.
+
+    Returns
+    -------
+    tuple[str, bool]
+        The code and whether it can evaluate to None.
+    """
+    if node.operation == "series":
+        series = node.operands[0]
+        return f"r{columns[id(series)]}", series.has_nulls
+    if node.operation == "scalar":
+        scalars.append(node.operands[0])
+        return f"s{len(scalars) - 1}", False
+
+    def temporary() -> str:
+        counter[0] += 1
+        return f"_t{counter[0]}"
+
+    if node.operation == "invert":
+        code, nullable = _generate(node.operands[0], columns, scalars, counter)
+        if not nullable:
+            return f"(not {code})", False
+        t = temporary()
+        return f"(None if ({t} := {code}) is None else not {t})", True
+
+    left, right = node.operands
+    a, a_nullable = _generate(left, columns, scalars, counter)
+    b, b_nullable = _generate(right, columns, scalars, counter)
+    nullable = a_nullable or b_nullable
+
+    if node.operation == "eq":
+        # None is equal to None but to no other value, the result is never None
+        return f"({a} == {b})", False
+    symbol = {**_ARITHMETIC, **_COMPARISON, **_BOOLEAN}[node.operation][0]
+
+    def cast(code: str, operand: Expr) -> str:
+        # ints are cast to float if the result of an arithmetic operation is a float
+        if (
+            node.operation in _ARITHMETIC
+            and node.data_type is float
+            and operand.data_type is int
+        ):
+            return f"float({code})"
+        return code
+
+    if not nullable:
+        # for bools `&`, `|` and `^` give the same results as `and`, `or` and `xor`
+        return f"({cast(a, left)} {symbol} {cast(b, right)})", False
+
+    t1, t2 = temporary(), temporary()
+    # a tuple is always true, it only makes sure both operands are evaluated first
+    bind = f"(({t1} := {a}), ({t2} := {b}))"
+    if node.operation == "and":
+        return f"(({t1} and {t2}) if {bind} else None)", True
+    if node.operation == "or":
+        return f"(({t1} or {t2}) if {bind} else None)", True
+    result = f"{cast(t1, left)} {symbol} {cast(t2, right)}"
+    return (
+        f"((None if {t1} is None or {t2} is None else {result}) if {bind} else None)",
+        True,
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_function(source: str) -> Callable:
+    """
+    Compiles the source code of a generated function.
+
+    Parameters
+    ----------
+    source : str
+        The source code defining a function named `fused`.
+
+    Returns
+    -------
+    Callable
+        The compiled function.
+    """
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<pandastwo expression>", "exec"), namespace)
+    return namespace["fused"]
@@ -0,0 +1,259 @@
+"""
+Hash-based grouping of DataFrame rows.
+
+The key columns are factorized once: every distinct key (or combination of keys) gets an
+integer code in the order of its first appearance. The rows are ordered by code once
+with a counting sort (one pass over the codes that places every row after the earlier
+rows of its group), the values of every aggregated column are then split into one bucket
+per code with a single take and the buckets are reduced with the kernels of
+`pandastwo.aggregations`, with the same None and NaN handling as the aggregations of a
+Series.
+"""
+
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+from itertools import accumulate, compress
+from typing import TYPE_CHECKING
+
+from pandastwo import aggregations
+from pandastwo.buffers import INT_TYPECODE, DictionaryArray, typecode_of
+from pandastwo.series import Series
+
+if TYPE_CHECKING:
+    from pandastwo.dataframe import DataFrame
+
+# the NaN key of all rows with a NaN key, NaN is not equal to itself but dicts find the
+# identical object
+_NAN = float("nan")
+
+
+def _hashable_keys(key: Series) -> tuple[Sequence, Callable[[int], object] | None]:
+    """
+    Returns the values of a key column used for hashing.
+
+    Parameters
+    ----------
+    key : Series
+        The key column.
+
+    Returns
+    -------
+    tuple[Sequence, Callable or None]
+        The values, the integer codes for a dictionary encoded column, and the function
+        that decodes a code (None if the values are not encoded). Every NaN value is the
+        same NaN object.
+    """
+    if isinstance(key._values, DictionaryArray):
+        # code -1 of None refers to the appended None
+        return key._values.codes, (key._values.dictionary + [None]).__getitem__
+    if key.data_type is float:
+        return [_NAN if value != value else value for value in key.data], None
+    return key.data, None
+
+
+def factorize(keys: list[Series]) -> tuple[array, list]:
+    """
+    Assigns an integer code to every distinct key in the order of the first appearance.
+
+    None and NaN are keys like any other value, all rows with a None key get the same
+    code and all rows with a NaN key get the same code.
+    Dictionary encoded key columns are hashed by their integer codes instead of the
+    strings.
+
+    Parameters
+    ----------
+    keys : list[Series]
+        The key columns, all of the same length.
+
+    Returns
+    -------
+    tuple[array, list]
+        The code of every row as `array('q')` and the distinct keys by code
+        (tuples of the values of all key columns if there is more than one).
+    """
+    columns, decoders = zip(*map(_hashable_keys, keys))
+    rows: Sequence = columns[0] if len(keys) == 1 else list(zip(*columns))
+    # dicts keep the insertion order, so the distinct keys are found in the order of
+    # their first appearance
+    table = dict(zip(dict.fromkeys(rows), range(len(rows))))
+    codes = array(INT_TYPECODE, map(table.__getitem__, rows))
+    uniques = list(table)
+    if len(keys) == 1:
+        if decoders[0] is not None:
+            uniques = list(map(decoders[0], uniques))
+    elif any(decoders):
+        uniques = [
+            tuple(
+                value if decode is None else decode(value)
+                for value, decode in zip(unique, decoders)
+            )
+            for unique in uniques
+        ]
+    return codes, uniques
+
+
+class GroupBy:
+    """
+    The rows of a DataFrame grouped by the values of key columns, created by
+    `DataFrame.groupby()`.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The grouped DataFrame.
+    keys : list[str]
+        The names of the key columns.
+    """
+
+    def __init__(self, df: "DataFrame", keys: list[str]) -> None:
+        self.df = df
+        self.keys = keys
+        self._codes, self._uniques = factorize([df[key] for key in keys])
+        self._order: tuple[list[int], list[int]] | None = None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of groups.
+
+        Returns
+        -------
+        int
+            The number of distinct keys.
+        """
+        return len(self._uniques)
+
+    def _key_columns(self) -> dict[str, Series]:
+        """
+        Creates one column per key with the key of every group.
+
+        Returns
+        -------
+        dict[str, Series]
+            The key columns by name.
+        """
+        if len(self.keys) == 1:
+            columns = [self._uniques]
+        else:
+            columns = [list(column) for column in zip(*self._uniques)] or [
+                [] for _ in self.keys
+            ]
+        return {
+            key: Series._from_trusted(
+                values, self.df[key].data_type, values.count(None)
+            )
+            for key, values in zip(self.keys, columns)
+        }
+
+    def _group_order(self) -> tuple[list[int], list[int]]:
+        """
+        Orders the rows by group once for all aggregated columns, with a counting sort
+        in O(n).
+
+        Returns
+        -------
+        tuple[list[int], list[int]]
+            The positions of the rows ordered by group (stable, so the rows of a group
+            keep their order) and the offsets of the groups in that order (one more than
+            the number of groups).
+        """
+        if self._order is None:
+            sizes = Counter(self._codes)
+            offsets = [0, *accumulate(map(sizes.__getitem__, range(len(self))))]
+            # every row goes to the next free position of its group, in row order
+            order = [0] * len(self._codes)
+            free = offsets[:-1]
+            for row, code in enumerate(self._codes):
+                order[free[code]] = row
+                free[code] += 1
+            self._order = order, offsets
+        return self._order
+
+    def _buckets(self, series: Series) -> list[Sequence]:
+        """
+        Splits the values of a column that are not None into one list per group.
+
+        Parameters
+        ----------
+        series : Series
+            The column, of the same length as the key columns.
+
+        Returns
+        -------
+        list[Sequence]
+            The values of every group (by code), arrays for int and float columns.
+        """
+        order, offsets = self._group_order()
+        bounds = zip(offsets, offsets[1:])
+        if isinstance(series._values, (array, memoryview)):
+            # slices of arrays are not tracked by the garbage collector, unlike hundreds
+            # of thousands of lists
+            typecode = typecode_of(series._values)
+            values: array | list = array(
+                typecode, map(series._values.__getitem__, order)
+            )
+            create: Callable[[Iterable], array | list] = partial(array, typecode)
+        else:
+            values = list(map(series._value_list().__getitem__, order))
+            create = list
+        if series._validity is None:
+            return [values[start:end] for start, end in bounds]
+        valids = bytes(map(series._validity.to_bytes01().__getitem__, order))
+        return [
+            create(compress(values[start:end], valids[start:end]))
+            for start, end in bounds
+        ]
+
+    def agg(self, aggregations_by_column: dict[str, str | list[str]]) -> "DataFrame":
+        """
+        Aggregates columns per group.
+
+        Parameters
+        ----------
+        aggregations_by_column : dict[str, str | list[str]]
+            The aggregations (count, sum, mean, min, max, var, std, any, all) by column
+            name. A single aggregation keeps the name of the column, for a list of
+            aggregations the result columns are named `<column>_<aggregation>`.
+
+        Returns
+        -------
+        DataFrame
+            One row per group (in the order of the first appearance of the key),
+            with the key columns followed by the aggregated columns.
+            None values are skipped like in the aggregations of a Series.
+
+        Raises
+        ------
+        ValueError
+            If a column or aggregation is unknown, cannot be applied to the data type of
+            the column, or two result columns have the same name.
+        KeyError
+            If a column does not exist.
+        """
+        from pandastwo.dataframe import DataFrame
+
+        if not isinstance(aggregations_by_column, dict) or not aggregations_by_column:
+            raise ValueError(
+                "aggregations must be a non-empty dictionary of column names and aggregations"
+            )
+
+        result = self._key_columns()
+        for column, names in aggregations_by_column.items():
+            series = self.df[column]
+            single = isinstance(names, str)
+            names = [names] if isinstance(names, str) else names
+            # validate all aggregations before splitting the column
+            for name in names:
+                aggregations.create(name, series.data_type)
+            buckets = self._buckets(series)
+            for name in names:
+                output = column if single else f"{column}_{name}"
+                if output in result:
+                    raise ValueError(f"duplicate result column {output}")
+                values = aggregations.reduce_groups(name, series.data_type, buckets)
+                data_type = aggregations.result_type(name, series.data_type)
+                result[output] = Series._from_trusted(
+                    values, data_type, values.count(None)
+                )
+        return DataFrame._from_trusted(result)
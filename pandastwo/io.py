@@ -0,0 +1,864 @@
+"""
+Reading and writing DataFrames to files.
+
+`read_csv` streams a CSV file in blocks of rows. The fields of every column are parsed
+block by block and appended to typed column buffers (arrays, packed bits), so the file
+is never held in memory as a whole and no intermediate list of Python values is type
+checked. With `chunksize` the DataFrames of the chunks are yielded one after the other,
+so files larger than the memory can be processed.
+
+`save` writes the buffers of every column as they are into a binary file, after a JSON
+header with the data type, physical width (dtype), encoding and position of the buffers
+of every column. `load` memory maps the file and creates the columns on top of the
+mapped buffers without reading or parsing them, so only the pages of the columns that
+are actually used are ever read from disk.
+
+The binary format::
+
+    MAGIC (8 bytes) | header length (8 bytes, little endian) | JSON header | buffers
+
+Every buffer starts at a multiple of `ALIGNMENT` bytes from the start of the buffers,
+which start at the first multiple of `ALIGNMENT` after the header. Numeric buffers use
+the byte order of the writing machine (recorded in the header).
+"""
+
+import csv
+import json
+import mmap as mmap_module
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Buffer, Callable, Iterator, Sequence
+from itertools import islice
+from os import PathLike
+from typing import Any, overload
+
+from pandastwo.buffers import (
+    CODE_TYPECODE,
+    FLOAT_DTYPES,
+    FLOAT_TYPECODE,
+    INT_DTYPES,
+    INT_TYPECODE,
+    OFFSET_TYPECODE,
+    Bitmap,
+    DictionaryArray,
+    NumericView,
+    StringArray,
+    cast_view,
+    to_pylist,
+)
+from pandastwo.dataframe import DataFrame
+from pandastwo.series import Series
+
+# the number of rows parsed at once if the file is read as a whole
+BLOCK_SIZE = 1 << 16
+
+# the first bytes of a file written by `save`
+MAGIC = b"PANDAS2\x00"
+# version 2 added the dtype of the columns, int and float buffers can be narrower than
+# 64 bits
+FORMAT_VERSION = 2
+# buffers start at multiples of this many bytes
+ALIGNMENT = 64
+_HEADER_LENGTH = struct.Struct("<Q")
+_DATA_TYPES: dict[str, type] = {"int": int, "float": float, "bool": bool, "str": str}
+
+# the fields of bool columns, an empty field is None
+_BOOLS = {"True": 1, "true": 1, "False": 0, "false": 0, "": 0}
+# the fields of inferred int and float columns: no whitespace, underscores, nan or inf,
+# which `int` and `float` accept
+_NUMBERS = {
+    int: re.compile(r"[+-]?[0-9]+"),
+    float: re.compile(r"[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?"),
+}
+
+
+def _parse(
+    fields: Sequence[str], data_type: type, null_count: int, strict: bool = False
+) -> array | bytes | list:
+    """
+    Parses the fields of a column.
+
+    Parameters
+    ----------
+    fields : Sequence[str]
+        The fields, empty fields are None.
+    data_type : type
+        The type of the column.
+    null_count : int
+        The number of empty fields.
+    strict : bool, default False
+        Whether int and float fields must be plain decimal numbers (for inferred
+        columns), otherwise everything `int` and `float` accept is parsed.
+
+    Returns
+    -------
+    array or bytes or list
+        The values: an `array('q')` for int (a list with None in place if a value does
+        not fit into 64 bits), an `array('d')` for float, one 0x00 or 0x01 byte per
+        value for bool and a list with None in place for str.
+
+    Raises
+    ------
+    ValueError
+        If a field cannot be parsed as the type.
+    """
+    if data_type is str:
+        return [field or None for field in fields] if null_count else list(fields)
+    if data_type is bool:
+        try:
+            return bytes(map(_BOOLS.__getitem__, fields))
+        except KeyError as error:
+            raise ValueError(f"invalid bool {error}") from None
+    # placeholders of the None values
+    filled = [field or "0" for field in fields] if null_count else fields
+    if strict:
+        invalid = next(
+            (field for field in filled if not _NUMBERS[data_type].fullmatch(field)),
+            None,
+        )
+        if invalid is not None:
+            raise ValueError(f"invalid {data_type.__name__} {invalid!r}")
+    if data_type is float:
+        return array(FLOAT_TYPECODE, map(float, filled))
+    try:
+        return array(INT_TYPECODE, map(int, filled))
+    except OverflowError:
+        # python ints are unbounded, keep values that do not fit into 64 bits as objects
+        return [int(field) if field else None for field in fields]
+
+
+def _infer(fields: Sequence[str], null_count: int) -> tuple[type, array | bytes | list]:
+    """
+    Finds the type of a column and parses its fields.
+
+    Parameters
+    ----------
+    fields : Sequence[str]
+        The fields, empty fields are None.
+    null_count : int
+        The number of empty fields.
+
+    Returns
+    -------
+    tuple[type, array or bytes or list]
+        The first of int, float and bool that all fields can be parsed as (str
+        otherwise, also if all fields are empty) and the parsed values (see `_parse`).
+        Only plain decimal numbers are inferred as int and float.
+    """
+    if null_count < len(fields):
+        for data_type in (int, float, bool):
+            try:
+                return data_type, _parse(fields, data_type, null_count, strict=True)
+            except ValueError:
+                pass
+    return str, _parse(fields, str, null_count)
+
+
+class _ColumnBuilder:
+    """
+    The typed buffers a column of a CSV file is appended to block by block.
+
+    Parameters
+    ----------
+    name : str
+        The name of the column.
+    data_type : type or None
+        The type of the column, None to infer it from the first block.
+    """
+
+    def __init__(self, name: str, data_type: type | None) -> None:
+        self.name = name
+        self.data_type = data_type
+        # only inferred int columns become float columns
+        self.inferred = data_type is None
+        self.values: array | bytearray | list | None = None
+        self.valids = bytearray()
+        self.null_count = 0
+
+    def append(self, fields: Sequence[str], first_row: int) -> None:
+        """
+        Parses the fields of a block and appends them.
+
+        Parameters
+        ----------
+        fields : Sequence[str]
+            The fields of the column in the block.
+        first_row : int
+            The number of the first row of the block for the error message.
+
+        Raises
+        ------
+        ValueError
+            If a field cannot be parsed as the type of the column.
+        """
+        null_count = fields.count("")
+        parsed: array | bytes | list | None
+        if self.data_type is None:
+            self.data_type, parsed = _infer(fields, null_count)
+        else:
+            try:
+                parsed = _parse(fields, self.data_type, null_count, self.inferred)
+            except ValueError as error:
+                parsed = self._parse_promoted(fields, null_count)
+                if parsed is None:
+                    raise ValueError(
+                        f"column {self.name} of type {self.data_type.__name__} cannot parse a value "
+                        f"in the rows from {first_row} ({error}), pass its type in dtypes"
+                    ) from None
+
+        if self.values is None:
+            # the bytes of bool values
+            self.values = bytearray(parsed) if isinstance(parsed, bytes) else parsed
+        elif isinstance(parsed, list) and isinstance(self.values, array):
+            # an int that does not fit into 64 bits, the column keeps its values as
+            # objects
+            self.values = [
+                value if valid else None
+                for value, valid in zip(self.values, self.valids)
+            ]
+            self.values += parsed
+        elif isinstance(self.values, list) and isinstance(parsed, array):
+            self.values += [
+                value if field else None for value, field in zip(parsed, fields)
+            ]
+        else:
+            self.values.extend(parsed)
+        self.valids += bytes(map(bool, fields)) if null_count else b"\x01" * len(fields)
+        self.null_count += null_count
+
+    def _parse_promoted(
+        self, fields: Sequence[str], null_count: int
+    ) -> array | bytes | list | None:
+        """
+        Parses the fields of a block as float if an inferred int column gets a float
+        after its first block, the column then becomes a float column.
+
+        Parameters
+        ----------
+        fields : Sequence[str]
+            The fields of the column in the block.
+        null_count : int
+            The number of empty fields.
+
+        Returns
+        -------
+        array or bytes or list or None
+            The parsed values (see `_parse`), None if the column cannot become a float
+            column.
+        """
+        if self.data_type is not int or not self.inferred or self.values is None:
+            return None
+        try:
+            parsed = _parse(fields, float, null_count, strict=True)
+            # None values of object storage get the placeholder 0.0
+            self.values = array(
+                FLOAT_TYPECODE, (float(value or 0) for value in self.values)
+            )
+        except (ValueError, OverflowError):
+            return None
+        self.data_type = float
+        return parsed
+
+    def to_series(self) -> Series:
+        """
+        Creates the Series of the appended values.
+
+        Returns
+        -------
+        Series
+            The column.
+        """
+        # the type is None only if there are no rows, it cannot be inferred then
+        data_type = self.data_type or str
+        if self.values is None:
+            return Series._from_trusted([], data_type, 0)
+        if isinstance(self.values, list):
+            # str or ints that do not fit into 64 bits, None values are in place
+            return Series._from_trusted(self.values, data_type, self.null_count)
+        values = (
+            Bitmap.from_bytes01(bytes(self.values))
+            if isinstance(self.values, bytearray)
+            else self.values
+        )
+        validity = Bitmap.from_bytes01(bytes(self.valids)) if self.null_count else None
+        return Series._from_storage(data_type, values, validity, self.null_count)
+
+
+def _check_dtypes(dtypes: dict[str, type] | None) -> dict[str, type]:
+    """
+    Validates the types given for columns.
+
+    Parameters
+    ----------
+    dtypes : dict[str, type] or None
+        The types by column name.
+
+    Returns
+    -------
+    dict[str, type]
+        The types by column name.
+
+    Raises
+    ------
+    ValueError
+        If the types are not a dictionary of column names and int, float, bool or str.
+    """
+    if dtypes is None:
+        return {}
+    if not isinstance(dtypes, dict) or not all(
+        isinstance(name, str) and data_type in {int, float, bool, str}
+        for name, data_type in dtypes.items()
+    ):
+        raise ValueError(
+            f"dtypes must be a dictionary of column names and int, float, bool or str (found: {dtypes})"
+        )
+    return dtypes
+
+
+def _read_blocks(
+    path: str | PathLike, block_size: int, dtypes: dict[str, type], delimiter: str
+) -> Iterator[list[_ColumnBuilder]]:
+    """
+    Reads a CSV file block by block.
+
+    Every block is appended to the column builders, which are yielded after the header
+    and after every block.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The file, its first row holds the column names.
+    block_size : int
+        The number of rows per block.
+    dtypes : dict[str, type]
+        The types of columns whose type is not inferred.
+    delimiter : str
+        The field delimiter.
+
+    Yields
+    ------
+    list[_ColumnBuilder]
+        The column builders.
+
+    Raises
+    ------
+    ValueError
+        If the file has no header, duplicate or unknown column names, a row with a
+        different number of fields than the header or a field that cannot be parsed as
+        the type of its column.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
+            raise ValueError(f"{path} has no header row")
+        if len(set(header)) != len(header):
+            raise ValueError(f"column names must be unique (found: {header})")
+        unknown = set(dtypes) - set(header)
+        if unknown:
+            raise ValueError(f"dtypes for columns that do not exist: {sorted(unknown)}")
+        builders = [_ColumnBuilder(name, dtypes.get(name)) for name in header]
+        # rows are numbered from 1 after the header
+        first_row = 1
+        yield builders
+        while rows := list(islice(reader, block_size)):
+            for number, row in enumerate(rows, first_row):
+                if len(row) != len(header):
+                    raise ValueError(
+                        f"row {number} has {len(row)} fields, the header has {len(header)}"
+                    )
+            for builder, fields in zip(builders, zip(*rows)):
+                builder.append(fields, first_row)
+            first_row += len(rows)
+            yield builders
+
+
+def _read_chunks(blocks: Iterator[list[_ColumnBuilder]]) -> Iterator[DataFrame]:
+    """
+    Yields every block of a CSV file as a DataFrame.
+
+    The types of the columns are taken from the first chunk.
+
+    Parameters
+    ----------
+    blocks : Iterator[list[_ColumnBuilder]]
+        The blocks of the file (see `_read_blocks`), after the header was read.
+
+    Yields
+    ------
+    DataFrame
+        The rows of the chunk.
+    """
+    for builders in blocks:
+        yield DataFrame._from_trusted(
+            {builder.name: builder.to_series() for builder in builders}
+        )
+        for builder in builders:
+            # keep the type, start new buffers (so an int column cannot become a float
+            # column any more)
+            builder.values = None
+            builder.valids = bytearray()
+            builder.null_count = 0
+
+
+@overload
+def read_csv(
+    path: str | PathLike,
+    chunksize: None = None,
+    dtypes: dict[str, type] | None = None,
+    delimiter: str = ",",
+) -> DataFrame: ...
+
+
+@overload
+def read_csv(
+    path: str | PathLike,
+    chunksize: int,
+    dtypes: dict[str, type] | None = None,
+    delimiter: str = ",",
+) -> Iterator[DataFrame]: ...
+
+
+def read_csv(
+    path: str | PathLike,
+    chunksize: int | None = None,
+    dtypes: dict[str, type] | None = None,
+    delimiter: str = ",",
+) -> DataFrame | Iterator[DataFrame]:
+    """
+    Reads a CSV file with a header row into a DataFrame.
+
+    The file is streamed and parsed in blocks directly into typed column buffers. The
+    type of every column not given in `dtypes` is inferred from the first block of rows
+    as the first of int, float and bool that all its fields can be parsed as (bool
+    accepts True/False and true/false), otherwise str. An int column becomes a float
+    column if a float follows later in the file. Empty fields are None.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The file, UTF-8 encoded.
+    chunksize : int, optional
+        If given, the file is read lazily and a generator of DataFrames with at most
+        this many rows is returned, the column types are then inferred from the first
+        chunk. By default the whole file is read into one DataFrame.
+    dtypes : dict[str, type], optional
+        The types (int, float, bool or str) of columns whose type is not inferred.
+    delimiter : str, optional
+        The field delimiter, by default ",".
+
+    Returns
+    -------
+    DataFrame or Iterator[DataFrame]
+        The DataFrame, or a generator of DataFrames if `chunksize` is given.
+
+    Raises
+    ------
+    ValueError
+        If the arguments are invalid, the file has no header, duplicate or unknown
+        column names, a row with a different number of fields than the header, or a
+        field that cannot be parsed as the type of its column (also a float in an int
+        column of a later chunk).
+    """
+    if chunksize is not None and (type(chunksize) is not int or chunksize < 1):
+        raise ValueError(
+            f"chunksize must be a positive integer or None (found: {chunksize})"
+        )
+    dtypes = _check_dtypes(dtypes)
+    if chunksize is not None:
+        blocks = _read_blocks(path, chunksize, dtypes, delimiter)
+        # read the header now, so that a missing file or an invalid header raises before
+        # the first chunk
+        next(blocks)
+        return _read_chunks(blocks)
+
+    for builders in _read_blocks(path, BLOCK_SIZE, dtypes, delimiter):
+        pass
+    return DataFrame._from_trusted(
+        {builder.name: builder.to_series() for builder in builders}
+    )
+
+
+def _column_buffers(series: Series) -> tuple[str, dict[str, Buffer]]:
+    """
+    Returns the buffers a column is saved as.
+
+    Parameters
+    ----------
+    series : Series
+        The column.
+
+    Returns
+    -------
+    tuple[str, dict[str, Buffer]]
+        The encoding of the values ("plain", "dictionary", "utf8" or "text" for ints
+        that do not fit into 64 bits) and the buffers by name, all supporting the buffer
+        protocol.
+    """
+    values = series._values
+    buffers: dict[str, Buffer] = {}
+    if series._validity is not None:
+        buffers["validity"] = series._validity.buffer
+    if isinstance(values, DictionaryArray):
+        dictionary = StringArray.from_values(values.dictionary)
+        buffers.update(
+            codes=values.codes, offsets=dictionary.offsets, data=dictionary.buffer
+        )
+        return "dictionary", buffers
+    if isinstance(values, list):
+        if series.data_type is int:
+            values = StringArray.from_values(
+                None if value is None else str(value) for value in values
+            )
+            encoding = "text"
+        else:
+            values = StringArray.from_values(values)
+            encoding = "utf8"
+        buffers.update(offsets=values.offsets, data=values.buffer)
+        return encoding, buffers
+    if isinstance(values, StringArray):
+        buffers.update(offsets=values.offsets, data=values.buffer)
+        return "utf8", buffers
+    buffers["values"] = values.buffer if isinstance(values, Bitmap) else values
+    return "plain", buffers
+
+
+def _layout(df: DataFrame) -> tuple[bytes, list[tuple[int, memoryview]], int]:
+    """
+    Places the buffers of all columns of a DataFrame in the binary format.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The DataFrame.
+
+    Returns
+    -------
+    tuple[bytes, list[tuple[int, memoryview]], int]
+        The start of the file up to the buffers (magic, header length, header and
+        padding), the buffers with their positions from the start of the file, and the
+        size of the file.
+    """
+    columns = []
+    buffers: list[tuple[int, memoryview]] = []
+    position = 0
+    for name, series in df.data.items():
+        encoding, column_buffers = _column_buffers(series)
+        locations = {}
+        for buffer_name, buffer in column_buffers.items():
+            raw = memoryview(buffer).cast("B")
+            position += -position % ALIGNMENT
+            locations[buffer_name] = [position, raw.nbytes]
+            buffers.append((position, raw))
+            position += raw.nbytes
+        columns.append(
+            {
+                "name": name,
+                "data_type": series.data_type.__name__,
+                "dtype": series.dtype,
+                "encoding": encoding,
+                "null_count": series.null_count,
+                "buffers": locations,
+            }
+        )
+    header = {
+        "version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "length": len(next(iter(df.data.values()))),
+        "columns": columns,
+    }
+    encoded = json.dumps(header).encode()
+    prefix = MAGIC + _HEADER_LENGTH.pack(len(encoded)) + encoded
+    prefix += bytes(-len(prefix) % ALIGNMENT)
+    start = len(prefix)
+    return prefix, [(start + offset, raw) for offset, raw in buffers], start + position
+
+
+def _write_into(
+    layout: tuple[bytes, list[tuple[int, memoryview]], int], target: memoryview
+) -> None:
+    """
+    Copies a DataFrame in the binary format into a writable buffer (e.g. shared memory).
+
+    Parameters
+    ----------
+    layout : tuple[bytes, list[tuple[int, memoryview]], int]
+        The result of `_layout()`.
+    target : memoryview
+        The buffer, at least as large as the size of the layout. The padding between the
+        buffers is not written.
+    """
+    prefix, buffers, _ = layout
+    target[: len(prefix)] = prefix
+    for position, raw in buffers:
+        target[position : position + raw.nbytes] = raw
+
+
+def save(df: DataFrame, path: str | PathLike) -> None:
+    """
+    Writes a DataFrame into a binary file, see `DataFrame.save()`.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The DataFrame.
+    path : str or PathLike
+        The file, overwritten if it exists.
+    """
+    prefix, buffers, _ = _layout(df)
+    with open(path, "wb") as file:
+        file.write(prefix)
+        for position, raw in buffers:
+            file.write(bytes(position - file.tell()))
+            file.write(raw)
+
+
+def _read_header(read: Callable[[int], bytes], source: str) -> tuple[dict, int]:
+    """
+    Reads the header of a DataFrame in the binary format.
+
+    Parameters
+    ----------
+    read : Callable[[int], bytes]
+        Returns the next bytes of the file, starting at its beginning.
+    source : str
+        The name of the file for error messages.
+
+    Returns
+    -------
+    tuple[dict, int]
+        The header and the position of the buffers in the file.
+
+    Raises
+    ------
+    ValueError
+        If the file was not written by `save`, by a newer version or on a machine with
+        another byte order.
+    """
+    prefix = read(len(MAGIC) + _HEADER_LENGTH.size)
+    if prefix[: len(MAGIC)] != MAGIC or len(prefix) < len(MAGIC) + _HEADER_LENGTH.size:
+        raise ValueError(f"{source} is not a pandastwo file")
+    (length,) = _HEADER_LENGTH.unpack(prefix[len(MAGIC) :])
+    header = json.loads(read(length))
+    if header["version"] > FORMAT_VERSION:
+        raise ValueError(
+            f"{source} has format version {header['version']}, only up to {FORMAT_VERSION} is supported"
+        )
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(
+            f"{source} was written on a {header['byteorder']} endian machine"
+        )
+    end = len(prefix) + length
+    return header, end + -end % ALIGNMENT
+
+
+def _load_column(
+    column: dict, length: int, read: Callable[[list[int], str | None], Any]
+) -> Series:
+    """
+    Creates a column from its buffers.
+
+    Parameters
+    ----------
+    column : dict
+        The entry of the column in the header.
+    length : int
+        The number of rows.
+    read : Callable[[list[int], str | None], Any]
+        Returns the buffer at a location (offset and size) from the header, cast to an
+        array typecode if given (an array, or a memoryview of the mapped file). The kind
+        of buffer depends on the encoding in the header.
+
+    Returns
+    -------
+    Series
+        The column.
+    """
+    data_type = _DATA_TYPES[column["data_type"]]
+    null_count = column["null_count"]
+    buffers = column["buffers"]
+    validity = Bitmap(read(buffers["validity"], None), length) if null_count else None
+    encoding = column["encoding"]
+    if encoding == "plain":
+        if data_type is bool:
+            values = Bitmap(read(buffers["values"], None), length)
+        else:
+            # version 1 files have no dtype, their values have 64 bits
+            dtype = column.get("dtype", "float64" if data_type is float else "int64")
+            values = read(buffers["values"], (INT_DTYPES | FLOAT_DTYPES)[dtype])
+        return Series._from_storage(data_type, values, validity, null_count)
+
+    strings = StringArray(
+        read(buffers["offsets"], OFFSET_TYPECODE), read(buffers["data"], None)
+    )
+    if encoding == "dictionary":
+        dictionary = DictionaryArray(
+            read(buffers["codes"], CODE_TYPECODE), strings.to_list()
+        )
+        return Series._from_storage(str, dictionary, validity, null_count)
+    if encoding == "text":
+        # ints that do not fit into 64 bits
+        data = [
+            None if value is None else int(value)
+            for value in to_pylist(strings, validity)
+        ]
+        return Series._from_trusted(data, int, null_count)
+    return Series._from_storage(str, strings, validity, null_count)
+
+
+def _check_columns(header: dict, columns: list[str] | None, source: str) -> list[dict]:
+    """
+    Validates the columns to load and returns their entries in the header.
+
+    Parameters
+    ----------
+    header : dict
+        The header (see `_read_header()`).
+    columns : list[str] or None
+        The names of the columns to load, None for all columns.
+    source : str
+        The name of the file for error messages.
+
+    Returns
+    -------
+    list[dict]
+        The entries of the columns in the header.
+
+    Raises
+    ------
+    ValueError
+        If `columns` is not a non-empty list of strings.
+    KeyError
+        If a column does not exist.
+    """
+    if columns is not None and (
+        not isinstance(columns, list)
+        or not columns
+        or not all(isinstance(name, str) for name in columns)
+    ):
+        raise ValueError(
+            f"columns must be a non-empty list of strings (found: {columns})"
+        )
+    by_name = {column["name"]: column for column in header["columns"]}
+    for name in columns or []:
+        if name not in by_name:
+            raise KeyError(f"column {name} does not exist in {source}")
+    return [by_name[name] for name in columns or by_name]
+
+
+def _from_view(
+    view: memoryview, source: str, columns: list[str] | None = None
+) -> DataFrame:
+    """
+    Creates a DataFrame on top of the buffers of a DataFrame in the binary format
+    without copying them.
+
+    Parameters
+    ----------
+    view : memoryview
+        The binary format, e.g. a memory mapped file or shared memory.
+    source : str
+        The name of the file for error messages.
+    columns : list[str], optional
+        The columns to create, by default all columns.
+
+    Returns
+    -------
+    DataFrame
+        The DataFrame, its columns keep `view` alive.
+
+    Raises
+    ------
+    ValueError
+        If the buffer does not contain a DataFrame in the binary format or `columns` is
+        invalid.
+    KeyError
+        If a column does not exist.
+    """
+    position = 0
+
+    def read_bytes(size: int) -> bytes:
+        nonlocal position
+        position += size
+        return bytes(view[position - size : position])
+
+    header, start = _read_header(read_bytes, source)
+
+    def read(location: list[int], typecode: str | None) -> NumericView:
+        offset, size = location
+        raw = view[start + offset : start + offset + size]
+        return raw if typecode is None else cast_view(raw, typecode)
+
+    return DataFrame._from_trusted(
+        {
+            column["name"]: _load_column(column, header["length"], read)
+            for column in _check_columns(header, columns, source)
+        }
+    )
+
+
+def load(
+    path: str | PathLike, mmap: bool = True, columns: list[str] | None = None
+) -> DataFrame:
+    """
+    Reads a DataFrame written by `DataFrame.save()`.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The file.
+    mmap : bool, optional
+        Whether the file is memory mapped, by default True. The columns are then created
+        on top of the mapped buffers without reading them, the operating system reads
+        the pages of a column when it is used. The file must not be changed while the
+        DataFrame (or a Series created from it without copying) is used. If False, the
+        buffers of the columns are read into memory.
+    columns : list[str], optional
+        The columns to load, by default all columns. Only the buffers of these columns
+        are touched.
+
+    Returns
+    -------
+    DataFrame
+        The DataFrame. str columns are stored in UTF-8 buffers (see
+        `Series.utf8_encode()`) unless they were dictionary encoded.
+
+    Raises
+    ------
+    ValueError
+        If the file was not written by `DataFrame.save()` or `columns` is invalid.
+    KeyError
+        If a column does not exist.
+    """
+    with open(path, "rb") as file:
+        if mmap:
+            # the mapping stays open as long as a memoryview of it exists
+            try:
+                mapped = memoryview(
+                    mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ)
+                )
+            except ValueError:
+                # an empty file can not be mapped
+                raise ValueError(f"{path} is not a pandastwo file") from None
+            return _from_view(mapped, str(path), columns)
+
+        header, start = _read_header(file.read, str(path))
+        selected = _check_columns(header, columns, str(path))
+
+        def read(location: list[int], typecode: str | None) -> bytes | array:
+            offset, size = location
+            file.seek(start + offset)
+            raw = file.read(size)
+            if typecode is None:
+                return raw
+            values = array(typecode)
+            values.frombytes(raw)
+            return values
+
+        result = {
+            column["name"]: _load_column(column, header["length"], read)
+            for column in selected
+        }
+    return DataFrame._from_trusted(result)
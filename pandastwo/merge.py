@@ -0,0 +1,271 @@
+"""
+Hash joins of DataFrames.
+
+The rows of the build side are inserted into a dict by key, the rows of the probe side
+look up their key in it. The join produces the matching row positions of both sides,
+every column of the result is then gathered with a single take (position -1 gives None
+for the unmatched rows of a left join).
+"""
+
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import compress, repeat
+from operator import ne
+from typing import TYPE_CHECKING
+
+from pandastwo.buffers import INT_TYPECODE, DictionaryArray, combine_validity
+from pandastwo.series import Series
+
+if TYPE_CHECKING:
+    from pandastwo.dataframe import DataFrame
+
+
+def _key_rows(df: "DataFrame", on: list[str]) -> list:
+    """
+    Returns the key of every row.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The DataFrame.
+    on : list[str]
+        The names of the key columns.
+
+    Returns
+    -------
+    list
+        The values of the key column, or tuples of the values of all key columns.
+    """
+    if len(on) == 1:
+        return df[on[0]].data
+    return list(zip(*(df[key].data for key in on)))
+
+
+def _valid_positions(df: "DataFrame", on: list[str]) -> Iterable[int]:
+    """
+    Returns the positions of the rows without None in any key column.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The DataFrame.
+    on : list[str]
+        The names of the key columns.
+
+    Returns
+    -------
+    Iterable[int]
+        The positions in ascending order.
+    """
+    validity = None
+    for key in on:
+        validity = combine_validity(validity, df[key]._validity)
+    length = len(df[on[0]])
+    return (
+        range(length)
+        if validity is None
+        else compress(range(length), validity.to_bytes01())
+    )
+
+
+def _build(df: "DataFrame", on: list[str]) -> tuple[dict, bool]:
+    """
+    Inserts the rows of the build side into a hash table by key, rows with a None key
+    are skipped.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The build side.
+    on : list[str]
+        The names of the key columns.
+
+    Returns
+    -------
+    tuple[dict, bool]
+        The table and whether the keys are unique. The table maps every key to the
+        position of its row if the keys are unique, otherwise to a list of the positions
+        of all rows with the key.
+    """
+    rows = _key_rows(df, on)
+    table: dict = {}
+    for position in _valid_positions(df, on):
+        table.setdefault(rows[position], []).append(position)
+    if len(table) == len(df[on[0]]) or all(
+        len(positions) == 1 for positions in table.values()
+    ):
+        return {key: positions[0] for key, positions in table.items()}, True
+    return table, False
+
+
+def _probe_rows(df: "DataFrame", on: list[str], table: dict) -> tuple[dict, Sequence]:
+    """
+    Returns the keys of the probe side and the hash table to look them up in.
+
+    A dictionary encoded key column looks up every distinct value once,
+    the rows are then matched by their integer codes.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The probe side.
+    on : list[str]
+        The names of the key columns.
+    table : dict
+        The hash table of the build side (see `_build`).
+
+    Returns
+    -------
+    tuple[dict, Sequence]
+        The hash table and the keys of the rows.
+    """
+    values = df[on[0]]._values
+    if len(on) == 1 and isinstance(values, DictionaryArray):
+        # None has code -1, which is never in the table
+        by_code = {
+            code: table[value]
+            for code, value in enumerate(values.dictionary)
+            if value in table
+        }
+        return by_code, values.codes
+    return table, _key_rows(df, on)
+
+
+def _probe(
+    table: dict, rows: Sequence, unique: bool, keep_unmatched: bool
+) -> tuple[array, array]:
+    """
+    Looks up the key of every row of the probe side in the hash table.
+
+    Parameters
+    ----------
+    table : dict
+        The hash table of the build side (see `_build`).
+    rows : Sequence
+        The keys of the probe side. Keys containing None are never in the table.
+    unique : bool
+        Whether the keys of the build side are unique.
+    keep_unmatched : bool
+        Whether rows without a match are kept with build position -1 (left join).
+
+    Returns
+    -------
+    tuple[array, array]
+        The probe and build positions of the result rows, ordered by probe position
+        and by build position within the same probe row.
+    """
+    if unique:
+        # a single lookup per row, -1 if the key is not in the table
+        matches = array(INT_TYPECODE, map(table.get, rows, repeat(-1)))
+        if keep_unmatched:
+            return array(INT_TYPECODE, range(len(rows))), matches
+        matched = bytes(map(ne, matches, repeat(-1)))
+        return (
+            array(INT_TYPECODE, compress(range(len(rows)), matched)),
+            array(INT_TYPECODE, compress(matches, matched)),
+        )
+
+    probe_positions = array(INT_TYPECODE)
+    build_positions = array(INT_TYPECODE)
+    for position, key in enumerate(rows):
+        positions = table.get(key)
+        if positions is None:
+            if keep_unmatched:
+                probe_positions.append(position)
+                build_positions.append(-1)
+            continue
+        probe_positions.extend(repeat(position, len(positions)))
+        build_positions.extend(positions)
+    return probe_positions, build_positions
+
+
+def merge(
+    left: "DataFrame",
+    right: "DataFrame",
+    on: str | list[str],
+    how: str = "inner",
+    suffixes: tuple[str, str] = ("_x", "_y"),
+) -> "DataFrame":
+    """
+    Joins two DataFrames on key columns, see `DataFrame.merge()`.
+
+    Parameters
+    ----------
+    left : DataFrame
+        The left DataFrame.
+    right : DataFrame
+        The right DataFrame.
+    on : str or list[str]
+        The key columns, must exist in both DataFrames with the same data types.
+    how : str, optional
+        "inner" keeps only matching rows, "left" keeps all rows of the left DataFrame.
+        By default "inner".
+    suffixes : tuple[str, str], optional
+        Appended to the names of non-key columns that exist in both DataFrames. By
+        default ("_x", "_y").
+
+    Returns
+    -------
+    DataFrame
+        The joined DataFrame.
+
+    Raises
+    ------
+    ValueError
+        If the arguments are invalid or the key columns have different data types.
+    KeyError
+        If a key column does not exist.
+    """
+    from pandastwo.dataframe import DataFrame
+
+    if isinstance(on, str):
+        on = [on]
+    if (
+        not isinstance(on, list)
+        or not on
+        or not all(isinstance(key, str) for key in on)
+    ):
+        raise ValueError(
+            f"on must be a string or a non-empty list of strings (found: {on})"
+        )
+    if how not in {"inner", "left"}:
+        raise ValueError(f"how must be 'inner' or 'left' (found: {how})")
+    for key in on:
+        if left[key].data_type is not right[key].data_type:
+            raise ValueError(
+                f"key columns must have the same data type (found {left[key].data_type} and {right[key].data_type} for {key})"
+            )
+
+    if how == "inner" and len(left[on[0]]) < len(right[on[0]]):
+        # build on the smaller side and restore the order of the left rows afterwards
+        table, unique = _build(left, on)
+        right_positions, left_positions = _probe(
+            *_probe_rows(right, on, table), unique, False
+        )
+        order = sorted(range(len(left_positions)), key=left_positions.__getitem__)
+        left_positions = array(INT_TYPECODE, map(left_positions.__getitem__, order))
+        right_positions = array(INT_TYPECODE, map(right_positions.__getitem__, order))
+    else:
+        table, unique = _build(right, on)
+        left_positions, right_positions = _probe(
+            *_probe_rows(left, on, table), unique, how == "left"
+        )
+
+    # every row of the left DataFrame is kept once and in order, its columns can be
+    # reused
+    keep_left = how == "left" and unique
+    overlap = (set(left.data) & set(right.data)) - set(on)
+    result: dict[str, Series] = {}
+    for name, series in left.data.items():
+        output = name + suffixes[0] if name in overlap else name
+        if output in result:
+            raise ValueError(f"duplicate result column {output}")
+        result[output] = series if keep_left else series._take(left_positions)
+    for name, series in right.data.items():
+        if name in on:
+            continue
+        output = name + suffixes[1] if name in overlap else name
+        if output in result:
+            raise ValueError(f"duplicate result column {output}")
+        result[output] = series._take(right_positions)
+    return DataFrame._from_trusted(result)
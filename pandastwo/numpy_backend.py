@@ -0,0 +1,591 @@
+"""
+Optional vectorized kernels for Series, used when numpy is installed.
+
+Every function returns None if it cannot compute the exact same result as the pure
+Python kernels of `Series` (e.g. if int arithmetic could overflow 64 bits), the caller
+then falls back to the pure Python implementation. numpy is never required to use
+pandastwo.
+"""
+
+import operator
+from array import array
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from pandastwo.buffers import FLOAT_DTYPES, INT_DTYPES, Bitmap, Selection, typecode_of
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from pandastwo.series import Series
+
+# set to False to always use the pure Python kernels
+ENABLED = np is not None
+# below this length converting the buffers costs more than vectorizing saves
+MIN_LENGTH = 1024
+
+_INT64_LIMIT = 2**63
+# ints with a larger absolute value are not exactly representable as float64
+_FLOAT64_EXACT_INT_LIMIT = 2**53
+
+if np is not None:
+    _UFUNCS: dict[Callable, Callable] = {
+        operator.add: np.add,
+        operator.sub: np.subtract,
+        operator.mul: np.multiply,
+        operator.truediv: np.true_divide,
+        operator.lt: np.less,
+        operator.le: np.less_equal,
+        operator.gt: np.greater,
+        operator.ge: np.greater_equal,
+        operator.ne: np.not_equal,
+        operator.eq: np.equal,
+    }
+
+
+def is_used(*series: "Series") -> bool:
+    """
+    Checks whether the numpy kernels should be used for the given Series.
+
+    Only Series stored in typed buffers (int, float, bool) that are long enough are
+    supported.
+
+    Parameters
+    ----------
+    *series : Series
+        The operands of the operation.
+
+    Returns
+    -------
+    bool
+        True if the numpy kernels should be used.
+    """
+    if not ENABLED or len(series[0]) < MIN_LENGTH:
+        return False
+    return all(isinstance(s._values, (array, memoryview, Bitmap)) for s in series)
+
+
+def values_array(series: "Series", widen: bool = True) -> "np.ndarray":
+    """
+    Returns the values of a Series as an ndarray without copying 64-bit buffers.
+
+    Parameters
+    ----------
+    series : Series
+        The Series, must be stored in a typed buffer.
+    widen : bool, optional
+        Whether narrow int and float32 values are converted to 64 bits, by default True.
+        The kernels then compute like the pure Python kernels, without wrapping around.
+
+    Returns
+    -------
+    np.ndarray
+        int64, float64 or bool array (of the width of the Series if not `widen`).
+        Missing values hold a placeholder.
+    """
+    buffer = series._values
+    if isinstance(buffer, Bitmap):
+        return bitmap_array(buffer)
+    if not isinstance(buffer, (array, memoryview)):
+        raise ValueError(
+            f"only Series stored in a typed buffer can be vectorized (found: {type(buffer)})"
+        )
+    values = np.frombuffer(buffer, dtype=typecode_of(buffer))
+    if not widen:
+        return values
+    return values.astype(
+        np.float64 if values.dtype.kind == "f" else np.int64, copy=False
+    )
+
+
+def bitmap_array(bitmap: Bitmap) -> "np.ndarray":
+    """
+    Unpacks a Bitmap into a boolean ndarray.
+
+    Parameters
+    ----------
+    bitmap : Bitmap
+        The packed bits.
+
+    Returns
+    -------
+    np.ndarray
+        One bool per bit.
+    """
+    packed = np.frombuffer(bitmap.buffer, dtype=np.uint8)
+    return np.unpackbits(packed, count=bitmap.length, bitorder="little").view(bool)
+
+
+def array_bitmap(values: "np.ndarray") -> Bitmap:
+    """
+    Packs a boolean ndarray into a Bitmap.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        One bool per bit.
+
+    Returns
+    -------
+    Bitmap
+        The packed bits.
+    """
+    return Bitmap(np.packbits(values, bitorder="little").tobytes(), len(values))
+
+
+def null_mask(*series: "Series") -> "np.ndarray | None":
+    """
+    Returns a boolean ndarray that is True wherever any of the Series is None.
+
+    Parameters
+    ----------
+    *series : Series
+        The Series to combine.
+
+    Returns
+    -------
+    np.ndarray or None
+        The null mask (None if no Series has None values).
+    """
+    mask = None
+    for s in series:
+        if s._validity is not None:
+            invalid = ~bitmap_array(s._validity)
+            mask = invalid if mask is None else mask | invalid
+    return mask
+
+
+def _to_buffer(values: "np.ndarray") -> array | Bitmap:
+    """
+    Converts an ndarray result into the storage used by Series.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        int, float or bool array.
+
+    Returns
+    -------
+    array or Bitmap
+        The values buffer, of the width of the ndarray.
+    """
+    if values.dtype == np.bool_:
+        return array_bitmap(values)
+    return _to_array(values)
+
+
+def _to_array(values: "np.ndarray") -> array:
+    """
+    Converts an int or float ndarray into an array of the same width.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        int or float array.
+
+    Returns
+    -------
+    array
+        The values.
+    """
+    widths = FLOAT_DTYPES if values.dtype.kind == "f" else INT_DTYPES
+    buffer = array(widths[values.dtype.name])
+    buffer.frombytes(memoryview(np.ascontiguousarray(values)).cast("B"))
+    return buffer
+
+
+def _result(
+    data_type: type, values: "np.ndarray", mask: "np.ndarray | None"
+) -> "Series":
+    """
+    Creates the result Series of a kernel.
+
+    Parameters
+    ----------
+    data_type : type
+        The type of the result.
+    values : np.ndarray
+        The computed values (values at masked positions are ignored).
+    mask : np.ndarray or None
+        The null mask of the result.
+
+    Returns
+    -------
+    Series
+        The result.
+    """
+    from pandastwo.series import Series
+
+    null_count = 0 if mask is None else int(np.count_nonzero(mask))
+    if mask is None or not null_count:
+        return Series._from_storage(data_type, _to_buffer(values), None, 0)
+    values[mask] = 0
+    return Series._from_storage(
+        data_type, _to_buffer(values), array_bitmap(~mask), null_count
+    )
+
+
+def _max_abs(values: "np.ndarray") -> int:
+    """
+    Returns the largest absolute value of an int64 array as a Python int.
+    """
+    return max(int(values.max()), -int(values.min()))
+
+
+def math(
+    left: "Series", right: "Series", operation: Callable, force_float: bool
+) -> "Series | None":
+    """
+    Vectorized version of `Series._math_series_function`.
+
+    Parameters
+    ----------
+    left : Series
+        The left operand.
+    right : Series
+        The right operand.
+    operation : Callable
+        The arithmetic operation (one of the `operator` functions).
+    force_float : bool
+        Whether to cast results to float.
+
+    Returns
+    -------
+    Series or None
+        The result, or None if the Python kernel has to be used.
+    """
+    ufunc = _UFUNCS.get(operation)
+    if ufunc is None:
+        return None
+    x, y = values_array(left), values_array(right)
+    mask = null_mask(left, right)
+
+    if left.data_type is float or right.data_type is float or force_float:
+        x, y = x.astype(np.float64, copy=False), y.astype(np.float64, copy=False)
+        if operation is operator.truediv:
+            zero = y == 0
+            if mask is not None:
+                zero &= ~mask
+            if zero.any():
+                return None  # the Python kernel raises ZeroDivisionError
+        with np.errstate(all="ignore"):
+            return _result(float, ufunc(x, y), mask)
+
+    # python ints never overflow, only vectorize if the result fits into 64 bits
+    bound_x, bound_y = _max_abs(x), _max_abs(y)
+    bound = bound_x * bound_y if operation is operator.mul else bound_x + bound_y
+    if bound >= _INT64_LIMIT:
+        return None
+    return _result(int, ufunc(x, y), mask)
+
+
+def math_scalar(
+    series: "Series",
+    scalar: int | float,
+    operation: Callable,
+    force_float: bool,
+    reflected: bool,
+) -> "Series | None":
+    """
+    Vectorized version of `Series._math_scalar_function`.
+
+    Parameters
+    ----------
+    series : Series
+        The Series operand.
+    scalar : int or float
+        The scalar operand.
+    operation : Callable
+        The arithmetic operation (one of the `operator` functions).
+    force_float : bool
+        Whether to cast results to float.
+    reflected : bool
+        Whether the scalar is the left operand.
+
+    Returns
+    -------
+    Series or None
+        The result, or None if the Python kernel has to be used.
+    """
+    ufunc = _UFUNCS.get(operation)
+    if ufunc is None:
+        return None
+    x = values_array(series)
+    mask = null_mask(series)
+
+    if series.data_type is float or type(scalar) is float or force_float:
+        try:
+            y = float(scalar)
+        except OverflowError:
+            return None  # the Python kernel raises OverflowError
+        x = x.astype(np.float64, copy=False)
+        if operation is operator.truediv:
+            if reflected:
+                zero = x == 0
+                if mask is not None:
+                    zero &= ~mask
+                if zero.any():
+                    return None  # the Python kernel raises ZeroDivisionError
+            elif y == 0:
+                return None
+        with np.errstate(all="ignore"):
+            return _result(float, ufunc(y, x) if reflected else ufunc(x, y), mask)
+
+    # python ints never overflow, only vectorize if the result fits into 64 bits
+    bound_x, bound_y = _max_abs(x), abs(scalar)
+    bound = bound_x * bound_y if operation is operator.mul else bound_x + bound_y
+    if bound >= _INT64_LIMIT:
+        return None
+    return _result(int, ufunc(scalar, x) if reflected else ufunc(x, scalar), mask)
+
+
+def compare(left: "Series", right: "Series", operation: Callable) -> "Series | None":
+    """
+    Vectorized version of `Series._eq_helper_function`.
+
+    Parameters
+    ----------
+    left : Series
+        The left operand.
+    right : Series
+        The right operand.
+    operation : Callable
+        The comparison operation (one of the `operator` functions).
+
+    Returns
+    -------
+    Series or None
+        The result, or None if the Python kernel has to be used.
+    """
+    ufunc = _UFUNCS.get(operation)
+    if ufunc is None:
+        return None
+    x, y = values_array(left), values_array(right)
+    if left.data_type is not right.data_type:
+        # python compares ints and floats exactly, numpy casts the ints to float64
+        ints = x if left.data_type is int else y
+        if _max_abs(ints) > _FLOAT64_EXACT_INT_LIMIT:
+            return None
+    return _result(bool, ufunc(x, y), null_mask(left, right))
+
+
+def compare_scalar(
+    series: "Series", scalar: int | float, operation: Callable
+) -> "Series | None":
+    """
+    Vectorized version of `Series._eq_scalar_helper_function`.
+
+    Parameters
+    ----------
+    series : Series
+        The Series operand.
+    scalar : int or float
+        The scalar operand (right hand side).
+    operation : Callable
+        The comparison operation (one of the `operator` functions).
+
+    Returns
+    -------
+    Series or None
+        The result, or None if the Python kernel has to be used.
+    """
+    ufunc = _UFUNCS.get(operation)
+    if ufunc is None or not _scalar_comparable(series, scalar):
+        return None
+    return _result(bool, ufunc(values_array(series), scalar), null_mask(series))
+
+
+def _scalar_comparable(series: "Series", scalar: int | float) -> bool:
+    """
+    Checks whether numpy compares the Series with the scalar exactly like Python does.
+
+    Parameters
+    ----------
+    series : Series
+        The int or float Series.
+    scalar : int or float
+        The scalar.
+
+    Returns
+    -------
+    bool
+        False if an int would be rounded when numpy casts it to float64 or does not fit
+        into 64 bits.
+    """
+    if type(scalar) is int:
+        limit = _INT64_LIMIT if series.data_type is int else _FLOAT64_EXACT_INT_LIMIT
+        return abs(scalar) < limit
+    if series.data_type is int:
+        return _max_abs(values_array(series)) <= _FLOAT64_EXACT_INT_LIMIT
+    return True
+
+
+def equal(left: "Series", right: "Series") -> "Series":
+    """
+    Vectorized version of `Series.__eq__` for Series of the same type.
+
+    None is equal to None and not equal to any other value, the result has no None
+    values.
+
+    Parameters
+    ----------
+    left : Series
+        The left operand.
+    right : Series
+        The right operand.
+
+    Returns
+    -------
+    Series
+        The result.
+    """
+    from pandastwo.series import Series
+
+    result = values_array(left) == values_array(right)
+    if left._validity is not None or right._validity is not None:
+        no_nulls = np.zeros(len(left), dtype=bool)
+        invalid_x = (
+            no_nulls if left._validity is None else ~bitmap_array(left._validity)
+        )
+        invalid_y = (
+            no_nulls if right._validity is None else ~bitmap_array(right._validity)
+        )
+        result = (result & ~invalid_x & ~invalid_y) | (invalid_x & invalid_y)
+    return Series._from_storage(bool, array_bitmap(result), None, 0)
+
+
+def equal_scalar(series: "Series", scalar: int | float) -> "Series | None":
+    """
+    Vectorized version of `Series._eq_scalar_function` for int and float Series.
+
+    Parameters
+    ----------
+    series : Series
+        The Series operand.
+    scalar : int or float
+        The scalar of the same type as the Series.
+
+    Returns
+    -------
+    Series or None
+        The result (None is never equal), or None if the Python kernel has to be used.
+    """
+    from pandastwo.series import Series
+
+    if not _scalar_comparable(series, scalar):
+        return None
+    result = values_array(series) == scalar
+    if series._validity is not None:
+        result &= bitmap_array(series._validity)
+    return Series._from_storage(bool, array_bitmap(result), None, 0)
+
+
+def select_series(series: "Series", selection: Selection) -> "Series":
+    """
+    Vectorized version of `Series._select`.
+
+    Parameters
+    ----------
+    series : Series
+        The Series to select from, must be stored in a typed buffer.
+    selection : Selection
+        The selected rows.
+
+    Returns
+    -------
+    Series
+        The selected elements.
+    """
+    from pandastwo.series import Series
+
+    if selection.is_sparse:
+        indices = np.frombuffer(selection.positions, dtype=np.int64)
+    else:
+        # the selectors hold one 0x00 or 0x01 byte per row, which is a valid bool array
+        indices = np.frombuffer(selection.selectors, dtype=bool)
+    values = _to_buffer(values_array(series, widen=False)[indices])
+    validity = None
+    if series._validity is not None:
+        validity = array_bitmap(bitmap_array(series._validity)[indices])
+    return Series._from_storage(series.data_type, values, validity)
+
+
+def take_series(series: "Series", positions: array) -> "Series":
+    """
+    Vectorized version of `Series._take`.
+
+    Parameters
+    ----------
+    series : Series
+        The Series to take from, must be stored in a typed buffer.
+    positions : array
+        The positions to gather as `array('q')`, -1 for a missing value.
+
+    Returns
+    -------
+    Series
+        The gathered elements.
+    """
+    indices = np.frombuffer(positions, dtype=np.int64)
+    missing = indices < 0
+    mask = (
+        None if series._validity is None else ~bitmap_array(series._validity)[indices]
+    )
+    if missing.any():
+        # -1 would take the last value, the masked values are zeroed by _result
+        mask = missing if mask is None else mask | missing
+    return _result(series.data_type, values_array(series, widen=False)[indices], mask)
+
+
+# LSD radix sort is used for int keys of up to this many bits (three passes of 16 bit
+# digits), wider keys are sorted with the stable comparison sort of numpy
+RADIX_MAX_BITS = 48
+_RADIX_DIGIT_BITS = 16
+
+
+def sort_positions(series: "Series", positions: array, ascending: bool) -> array:
+    """
+    Vectorized version of `pandastwo.sorting.sort_valid` for int and float Series.
+
+    Parameters
+    ----------
+    series : Series
+        The Series whose values are sorted, must be stored in a typed buffer.
+    positions : array
+        The positions to sort as `array('q')`, must not refer to None values.
+    ascending : bool
+        The sort direction.
+
+    Returns
+    -------
+    array
+        The positions, stably sorted by value (NaN last).
+    """
+    indices = np.frombuffer(positions, dtype=np.int64)
+    values = values_array(series)[indices]
+    if values.dtype == np.float64:
+        # argsort places NaN last, negating keeps it there for descending order
+        order = np.argsort(values if ascending else -values, kind="stable")
+        return _to_array(indices[order])
+
+    # flipping the sign bit maps int64 to uint64 preserving the order
+    keys = values.view(np.uint64) ^ np.uint64(1 << 63)
+    if ascending:
+        keys = keys - keys.min()
+    else:
+        keys = keys.max() - keys
+    bits = int(keys.max()).bit_length()
+    if bits > RADIX_MAX_BITS:
+        return _to_array(indices[np.argsort(keys, kind="stable")])
+
+    # LSD radix sort: stable passes over the 16 bit digits, from the least significant
+    # one (the stable argsort of uint16 values is a counting sort)
+    order = np.arange(len(keys))
+    mask = np.uint64((1 << _RADIX_DIGIT_BITS) - 1)
+    for shift in range(0, bits, _RADIX_DIGIT_BITS):
+        digits = ((keys[order] >> np.uint64(shift)) & mask).astype(np.uint16)
+        order = order[np.argsort(digits, kind="stable")]
+    return _to_array(indices[order])
@@ -0,0 +1,224 @@
+"""
+Parallel execution of partitioned pipelines in worker processes.
+
+A `ParallelExecutor` owns a pool of worker processes. `ParallelExecutor.share()` copies
+a DataFrame once into shared memory and splits its rows into ranges, the workers attach
+the shared buffers instead of receiving the values, only the (picklable) pipeline of a
+`PartitionedDataFrame` and the row range are sent to them. Every worker computes the
+result of its partitions: the accumulators of aggregations are merged by the calling
+process, result DataFrames and Series are sent back in the binary format of
+`DataFrame.save()`.
+
+Pipelines over partitions on disk can be processed by the workers as well (see
+`PartitionedDataFrame.parallel()`), every worker then memory maps the files of its
+partitions.
+"""
+
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Self
+
+from pandastwo import shared
+from pandastwo.dataframe import DataFrame
+from pandastwo.io import _from_view, _layout, _write_into
+from pandastwo.partitioned import Partition, PartitionedDataFrame, load_partition
+from pandastwo.series import Series
+
+
+class _Packed:
+    """
+    A DataFrame or Series in the binary format, sent from a worker to the calling
+    process.
+
+    Parameters
+    ----------
+    result : DataFrame or Series
+        The result of a partition.
+    """
+
+    __slots__ = ("data", "series")
+
+    def __init__(self, result: DataFrame | Series) -> None:
+        self.series = isinstance(result, Series)
+        df = (
+            result
+            if isinstance(result, DataFrame)
+            else DataFrame._from_trusted({"values": result})
+        )
+        layout = _layout(df)
+        self.data = bytearray(layout[2])
+        _write_into(layout, memoryview(self.data))
+
+    def unpack(self) -> DataFrame | Series:
+        """
+        Creates the DataFrame or Series on top of the received buffers.
+
+        Returns
+        -------
+        DataFrame or Series
+            The result of the partition.
+        """
+        df = _from_view(memoryview(self.data).toreadonly(), "a worker result")
+        return df["values"] if self.series else df
+
+
+def _run(
+    partition: Partition,
+    steps: Sequence[Callable],
+    function: Callable[[DataFrame], object],
+) -> object:
+    """
+    Computes the result of a partition in a worker.
+
+    Parameters
+    ----------
+    partition : Partition
+        The partition (see `load_partition()`).
+    steps : Sequence[Callable]
+        The pipeline.
+    function : Callable[[DataFrame], object]
+        Applied to the result of the pipeline.
+
+    Returns
+    -------
+    object
+        The result of the function, DataFrames and Series packed into the binary format.
+    """
+    df = load_partition(partition)
+    for step in steps:
+        df = step(df)
+    result = function(df)
+    if isinstance(result, (DataFrame, Series)):
+        return _Packed(result)
+    return result
+
+
+class ParallelExecutor:
+    """
+    Processes the partitions of partitioned pipelines in worker processes.
+
+    Use it as a context manager (or call `shutdown()`) to stop the workers and free the
+    shared memory.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        The number of worker processes, by default the number of CPUs.
+    mp_context : BaseContext, optional
+        The multiprocessing context that starts the workers, by default the default
+        context.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not a positive integer.
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, mp_context: BaseContext | None = None
+    ) -> None:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if type(max_workers) is not int or max_workers < 1:
+            raise ValueError(
+                f"max_workers must be a positive integer (found: {max_workers})"
+            )
+        self.max_workers = max_workers
+        self._pool = ProcessPoolExecutor(max_workers, mp_context=mp_context)
+        self._segments: list[SharedMemory] = []
+
+    def share(
+        self, df: DataFrame, partitions: int | None = None
+    ) -> PartitionedDataFrame:
+        """
+        Copies a DataFrame into shared memory and splits its rows into partitions
+        processed by the workers.
+
+        Parameters
+        ----------
+        df : DataFrame
+            The DataFrame.
+        partitions : int, optional
+            The number of partitions (ranges of rows of the same size), by default the
+            number of workers.
+
+        Returns
+        -------
+        PartitionedDataFrame
+            The partitions, processed by this executor.
+
+        Raises
+        ------
+        ValueError
+            If `partitions` is not a positive integer.
+        """
+        if partitions is None:
+            partitions = self.max_workers
+        if type(partitions) is not int or partitions < 1:
+            raise ValueError(
+                f"partitions must be a positive integer (found: {partitions})"
+            )
+        segment = shared.create(df)
+        self._segments.append(segment)
+        length = len(next(iter(df.data.values())))
+        rows = max(-(-length // partitions), 1)
+        return PartitionedDataFrame(
+            shared.SharedRows(segment.name, start, min(start + rows, length))
+            for start in range(0, max(length, 1), rows)
+        ).parallel(self)
+
+    def map(
+        self,
+        function: Callable[[DataFrame], object],
+        partitions: Sequence[Partition],
+        steps: Sequence[Callable],
+    ) -> Iterator:
+        """
+        Runs a pipeline on all partitions in the workers and applies a function to every
+        result.
+
+        Parameters
+        ----------
+        function : Callable[[DataFrame], object]
+            Applied to the result of the pipeline of every partition, must be picklable.
+        partitions : Sequence[Partition]
+            The partitions (see `load_partition()`).
+        steps : Sequence[Callable]
+            The pipeline, all steps must be picklable.
+
+        Returns
+        -------
+        Iterator
+            The results of the function in the order of the partitions.
+        """
+        # all partitions are submitted at once, the results are collected in order
+        futures = [
+            self._pool.submit(_run, partition, steps, function)
+            for partition in partitions
+        ]
+        return (
+            result.unpack() if isinstance(result, _Packed) else result
+            for result in (future.result() for future in futures)
+        )
+
+    def shutdown(self) -> None:
+        """
+        Stops the workers and frees the shared memory of the shared DataFrames.
+        """
+        self._pool.shutdown()
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments.clear()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.shutdown()
+
+    def __repr__(self) -> str:
+        return f"ParallelExecutor(max_workers={self.max_workers})"
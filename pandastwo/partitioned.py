@@ -0,0 +1,1047 @@
+"""
+DataFrames split into partitions of rows that are processed one partition at a time.
+
+A `PartitionedDataFrame` is a list of partitions, each either a DataFrame in memory or a
+file written by `DataFrame.save()` that is memory mapped when the partition is
+processed. Selecting columns, element-wise operations, filters and new columns do not
+compute anything, they add a step to a pipeline that is run partition by partition when
+the result is consumed (by an aggregation, `to_dataframe()`, `save()` or by iterating
+over `partitions()`). Only the current partition and the results computed from it are
+held in memory, so the peak memory depends on the size of the partitions and not on the
+number of rows.
+
+Aggregations reduce every partition with its own accumulator and merge the accumulators,
+so the result is the same as the aggregation of the whole column. The pipeline is built
+from picklable steps, so the partitions can also be processed by the worker processes of
+a `ParallelExecutor` (see `pandastwo.parallel`).
+"""
+
+import operator
+import os
+from collections.abc import Callable, Iterable, Iterator
+from os import PathLike
+from typing import TYPE_CHECKING, Any, Self
+
+from pandastwo import aggregations
+from pandastwo.buffers import (
+    FLOAT_DTYPES,
+    INT_DTYPES,
+    Bitmap,
+    DictionaryArray,
+    StringArray,
+)
+from pandastwo.dataframe import DataFrame
+from pandastwo.io import load, read_csv, save
+from pandastwo.series import Series
+from pandastwo.shared import SharedRows
+
+if TYPE_CHECKING:
+    from pandastwo.parallel import ParallelExecutor
+
+# the name of the file of a partition in a directory, by position
+PARTITION_FILE = "part-{:05d}.p2"
+
+# a partition: a DataFrame in memory, a file written by `DataFrame.save()` or rows of a
+# DataFrame in shared memory
+type Partition = DataFrame | str | PathLike | SharedRows
+
+
+def partial_aggregate(
+    series: Series, name: str, ddof: int = 1
+) -> aggregations.Accumulator:
+    """
+    Reduces the valid values of a Series into the accumulator of an aggregation without
+    taking its result.
+
+    The accumulators of the partitions of a column can be merged into the aggregation of
+    the whole column.
+
+    Parameters
+    ----------
+    series : Series
+        The Series.
+    name : str
+        The name of the aggregation (count, sum, mean, min, max, var, std, any, all).
+    ddof : int, optional
+        Delta degrees of freedom of var and std, by default 1.
+
+    Returns
+    -------
+    Accumulator
+        The accumulator updated with all valid values.
+
+    Raises
+    ------
+    ValueError
+        If the aggregation is unknown or cannot be applied to the data type of the
+        Series.
+    """
+    accumulator = aggregations.create(name, series.data_type)
+    if name == "var":
+        accumulator = aggregations.Var(ddof)
+    elif name == "std":
+        accumulator = aggregations.Std(ddof)
+    values = series._values
+    if isinstance(values, Bitmap):
+        # the value bits of None values are cleared, the validity selects the valid ones
+        values = list(map(bool, values.to_bytes01()))
+    elif isinstance(values, (DictionaryArray, StringArray)):
+        values = values.to_list()
+    for chunk in aggregations.iter_chunks(values, series._validity):
+        accumulator.update(chunk)
+    return accumulator
+
+
+def concat(parts: Iterable[Series]) -> Series:
+    """
+    Concatenates Series of the same data type.
+
+    Parameters
+    ----------
+    parts : Iterable[Series]
+        The Series, at least one.
+
+    Returns
+    -------
+    Series
+        The values of all Series in order.
+
+    Raises
+    ------
+    ValueError
+        If there are no Series or they have different data types.
+    """
+    values: list = []
+    data_type = None
+    dtypes = set()
+    for part in parts:
+        if data_type is None:
+            data_type = part.data_type
+        elif part.data_type is not data_type:
+            raise ValueError(
+                f"partitions must have the same data type (found {data_type} and {part.data_type})"
+            )
+        values.extend(part.data)
+        dtypes.add(part.dtype)
+    if data_type is None:
+        raise ValueError("at least one Series is needed")
+    result = Series._from_trusted(values, data_type, values.count(None))
+    # keeps the widest width of the partitions, the values of every partition fit into
+    # it
+    widths = [dtype for dtype in INT_DTYPES | FLOAT_DTYPES if dtype in dtypes]
+    if "object" in dtypes or not widths or widths[-1] == result.dtype:
+        return result
+    return Series._from_storage(
+        data_type,
+        result._convert_width(widths[-1]),
+        result._validity,
+        result.null_count,
+    )
+
+
+def _save_partitions(
+    frames: Iterable[DataFrame], directory: str | PathLike
+) -> list[str]:
+    """
+    Writes DataFrames into one file per partition.
+
+    Parameters
+    ----------
+    frames : Iterable[DataFrame]
+        The partitions, consumed one after the other.
+    directory : str or PathLike
+        The directory of the files, created if it does not exist. Existing partition
+        files are overwritten.
+
+    Returns
+    -------
+    list[str]
+        The paths of the files in the order of the partitions.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for position, df in enumerate(frames):
+        path = os.path.join(directory, PARTITION_FILE.format(position))
+        save(df, path)
+        paths.append(path)
+    return paths
+
+
+def load_partition(partition: Partition) -> DataFrame:
+    """
+    Creates the DataFrame of a partition.
+
+    Parameters
+    ----------
+    partition : DataFrame or str or PathLike or SharedRows
+        A DataFrame in memory, a file written by `DataFrame.save()` (memory mapped)
+        or rows of a DataFrame in shared memory.
+
+    Returns
+    -------
+    DataFrame
+        The rows of the partition.
+    """
+    if isinstance(partition, DataFrame):
+        return partition
+    if isinstance(partition, SharedRows):
+        return partition.load()
+    return load(partition)
+
+
+def _identity(df: DataFrame) -> DataFrame:
+    return df
+
+
+def _row_count(df: DataFrame) -> int:
+    return len(next(iter(df.data.values())))
+
+
+class _Column:
+    """
+    Selects a column of a partition.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __call__(self, df: DataFrame) -> Series:
+        return df[self.name]
+
+
+class _Scalar:
+    """
+    A scalar operand, the same for every partition.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __call__(self, df: DataFrame) -> object:
+        return self.value
+
+
+class _Binary:
+    """
+    Applies an operation to two operands computed from a partition.
+    """
+
+    __slots__ = ("operation", "left", "right")
+
+    def __init__(self, operation: Callable, left: Callable, right: Callable) -> None:
+        self.operation = operation
+        self.left = left
+        self.right = right
+
+    def __call__(self, df: DataFrame) -> Series:
+        return self.operation(self.left(df), self.right(df))
+
+
+class _Invert:
+    """
+    Inverts a boolean column computed from a partition.
+    """
+
+    __slots__ = ("function",)
+
+    def __init__(self, function: Callable) -> None:
+        self.function = function
+
+    def __call__(self, df: DataFrame) -> Series:
+        return ~self.function(df)
+
+
+class _Filter:
+    """
+    Keeps the rows of a partition where a boolean column is True.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask: Callable) -> None:
+        self.mask = mask
+
+    def __call__(self, df: DataFrame) -> DataFrame:
+        return df[self.mask(df)]
+
+
+class _WithColumn:
+    """
+    Adds a column computed from a partition.
+    """
+
+    __slots__ = ("name", "function")
+
+    def __init__(self, name: str, function: Callable) -> None:
+        self.name = name
+        self.function = function
+
+    def __call__(self, df: DataFrame) -> DataFrame:
+        return DataFrame._from_trusted({**df.data, self.name: self.function(df)})
+
+
+class _Reduce:
+    """
+    Reduces a column computed from a partition into the accumulator of an aggregation.
+    """
+
+    __slots__ = ("function", "name", "ddof")
+
+    def __init__(self, function: Callable, name: str, ddof: int) -> None:
+        self.function = function
+        self.name = name
+        self.ddof = ddof
+
+    def __call__(self, df: DataFrame) -> aggregations.Accumulator:
+        return partial_aggregate(self.function(df), self.name, self.ddof)
+
+
+class _Aggregate:
+    """
+    Reduces columns of a partition into the accumulators of aggregations.
+    """
+
+    __slots__ = ("outputs",)
+
+    def __init__(self, outputs: dict[str, tuple[str, str]]) -> None:
+        self.outputs = outputs
+
+    def __call__(
+        self, df: DataFrame
+    ) -> dict[str, tuple[aggregations.Accumulator, type]]:
+        return {
+            output: (
+                partial_aggregate(df[column], name),
+                aggregations.result_type(name, df[column].data_type),
+            )
+            for output, (column, name) in self.outputs.items()
+        }
+
+
+def _merge[R](
+    accumulators: Iterable[aggregations.Accumulator[R]],
+) -> aggregations.Accumulator[R]:
+    """
+    Merges the accumulators of the partitions of a column.
+
+    Parameters
+    ----------
+    accumulators : Iterable[Accumulator]
+        The accumulators, at least one.
+
+    Returns
+    -------
+    Accumulator
+        The first accumulator, updated with the others.
+    """
+    accumulators = iter(accumulators)
+    total = next(accumulators)
+    for accumulator in accumulators:
+        total.merge(accumulator)
+    return total
+
+
+class PartitionedDataFrame:
+    """
+    A DataFrame split into partitions of rows that are processed one partition at a
+    time.
+
+    Parameters
+    ----------
+    partitions : Iterable[DataFrame | str | PathLike]
+        The partitions in the order of their rows, DataFrames in memory or files written
+        by `DataFrame.save()` (memory mapped while the partition is processed). All
+        partitions must have the same columns. Partitions in shared memory are created
+        by `ParallelExecutor.share()`.
+
+    Raises
+    ------
+    ValueError
+        If there are no partitions or a partition is neither a DataFrame nor a path.
+    """
+
+    def __init__(self, partitions: Iterable[Partition]) -> None:
+        partitions = list(partitions)
+        if not partitions:
+            raise ValueError("at least one partition is needed")
+        for partition in partitions:
+            if not isinstance(partition, (DataFrame, str, PathLike, SharedRows)):
+                raise ValueError(
+                    f"partitions must be DataFrames or paths of saved DataFrames (found: {type(partition)})"
+                )
+        self._partitions = partitions
+        self._steps: tuple[Callable[[DataFrame], DataFrame], ...] = ()
+        self._executor: "ParallelExecutor | None" = None
+
+    @classmethod
+    def from_dataframe(cls, df: DataFrame, rows: int) -> Self:
+        """
+        Splits a DataFrame in memory into partitions.
+
+        Parameters
+        ----------
+        df : DataFrame
+            The DataFrame.
+        rows : int
+            The number of rows per partition (the last partition may have fewer rows).
+
+        Returns
+        -------
+        PartitionedDataFrame
+            The partitions.
+
+        Raises
+        ------
+        ValueError
+            If `rows` is not a positive integer.
+        """
+        if type(rows) is not int or rows < 1:
+            raise ValueError(f"rows must be a positive integer (found: {rows})")
+        length = len(next(iter(df.data.values())))
+        return cls(
+            DataFrame._from_trusted(
+                {name: series[start : start + rows] for name, series in df.data.items()}
+            )
+            for start in range(0, max(length, 1), rows)
+        )
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str | PathLike,
+        directory: str | PathLike,
+        chunksize: int,
+        dtypes: dict[str, type] | None = None,
+        delimiter: str = ",",
+    ) -> Self:
+        """
+        Reads a CSV file chunk by chunk and writes every chunk into a partition file.
+
+        Only one chunk is held in memory at a time, so the file can be larger than the
+        memory.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            The CSV file (see `read_csv()`).
+        directory : str or PathLike
+            The directory of the partition files, created if it does not exist.
+        chunksize : int
+            The number of rows per partition.
+        dtypes : dict[str, type], optional
+            The data types of columns by name, the other data types are inferred from
+            the first chunk.
+        delimiter : str, optional
+            The field delimiter, by default ",".
+
+        Returns
+        -------
+        PartitionedDataFrame
+            The partitions on disk.
+
+        Raises
+        ------
+        ValueError
+            If the file is invalid (see `read_csv()`).
+        """
+        chunks = read_csv(path, chunksize=chunksize, dtypes=dtypes, delimiter=delimiter)
+        return cls(_save_partitions(chunks, directory))
+
+    def _derive(
+        self,
+        steps: tuple[Callable[[DataFrame], DataFrame], ...],
+        executor: "ParallelExecutor | None",
+    ) -> Self:
+        """
+        Creates a PartitionedDataFrame with the same partitions.
+
+        Parameters
+        ----------
+        steps : tuple[Callable[[DataFrame], DataFrame], ...]
+            The pipeline, every step computes the result partition from a partition.
+        executor : ParallelExecutor or None
+            The executor that processes the partitions.
+
+        Returns
+        -------
+        PartitionedDataFrame
+            The new PartitionedDataFrame.
+        """
+        result = self.__class__.__new__(self.__class__)
+        result._partitions = self._partitions
+        result._steps = steps
+        result._executor = executor
+        return result
+
+    def _with_step(self, step: Callable[[DataFrame], DataFrame]) -> Self:
+        """
+        Creates a PartitionedDataFrame with the same partitions and an additional step.
+
+        Parameters
+        ----------
+        step : Callable[[DataFrame], DataFrame]
+            Computes the result partition from a partition.
+
+        Returns
+        -------
+        PartitionedDataFrame
+            The new PartitionedDataFrame.
+        """
+        return self._derive((*self._steps, step), self._executor)
+
+    def parallel(self, executor: "ParallelExecutor | None") -> Self:
+        """
+        Processes the partitions with the worker processes of an executor.
+
+        Parameters
+        ----------
+        executor : ParallelExecutor or None
+            The executor, None to process the partitions in this process. Partitions in
+            memory are pickled to send them to the workers, `ParallelExecutor.share()`
+            creates partitions that the workers attach.
+
+        Returns
+        -------
+        PartitionedDataFrame
+            The same partitions and pipeline, processed by the executor.
+        """
+        return self._derive(self._steps, executor)
+
+    @property
+    def npartitions(self) -> int:
+        """
+        Returns the number of partitions.
+
+        Returns
+        -------
+        int
+            The number of partitions.
+        """
+        return len(self._partitions)
+
+    def _run(self) -> Iterator[DataFrame]:
+        """
+        Runs the pipeline partition by partition in this process.
+
+        Returns
+        -------
+        Iterator[DataFrame]
+            The result of every partition, computed when it is requested.
+        """
+        for partition in self._partitions:
+            df = load_partition(partition)
+            for step in self._steps:
+                df = step(df)
+            yield df
+
+    def _map(self, function: Callable[[DataFrame], object]) -> Iterator:
+        """
+        Runs the pipeline and applies a function to the result of every partition.
+
+        Parameters
+        ----------
+        function : Callable[[DataFrame], object]
+            The function, must be picklable if the partitions are processed by an
+            executor.
+
+        Returns
+        -------
+        Iterator
+            The results of the function in the order of the partitions.
+        """
+        if self._executor is None:
+            return map(function, self._run())
+        return self._executor.map(function, self._partitions, self._steps)
+
+    def partitions(self) -> Iterator[DataFrame]:
+        """
+        Runs the pipeline partition by partition.
+
+        Returns
+        -------
+        Iterator[DataFrame]
+            The result of every partition, computed when it is requested
+            (computed by the workers in parallel if an executor is used).
+        """
+        return self._map(_identity)
+
+    def __getitem__(
+        self, index: "str | PartitionedSeries"
+    ) -> "PartitionedSeries | Self":
+        """
+        Selects a column by name or filters rows with a boolean PartitionedSeries.
+
+        Parameters
+        ----------
+        index : str or PartitionedSeries
+            The column name, or a boolean PartitionedSeries created from this
+            PartitionedDataFrame.
+
+        Returns
+        -------
+        PartitionedSeries or PartitionedDataFrame
+            The column or the filtered rows, computed partition by partition when they
+            are used.
+
+        Raises
+        ------
+        ValueError
+            If the index is neither a string nor a PartitionedSeries of this
+            PartitionedDataFrame.
+        """
+        if isinstance(index, str):
+            return PartitionedSeries(self, _Column(index))
+        if isinstance(index, PartitionedSeries):
+            self._check_owner(index)
+            return self._with_step(_Filter(index._function))
+        raise ValueError(
+            f"a partitioned dataframe index must be a string or a PartitionedSeries (found: {type(index)})"
+        )
+
+    def _check_owner(self, series: "PartitionedSeries") -> None:
+        """
+        Validates that a PartitionedSeries is computed from the partitions of this
+        PartitionedDataFrame.
+
+        Parameters
+        ----------
+        series : PartitionedSeries
+            The PartitionedSeries.
+
+        Raises
+        ------
+        ValueError
+            If the PartitionedSeries was created from another PartitionedDataFrame.
+        """
+        if series._frame is not self:
+            raise ValueError(
+                "the PartitionedSeries must be created from the same PartitionedDataFrame"
+            )
+
+    def with_column(self, name: str, series: "PartitionedSeries") -> Self:
+        """
+        Adds a column (or replaces the column with the same name).
+
+        Parameters
+        ----------
+        name : str
+            The name of the column.
+        series : PartitionedSeries
+            The values, created from this PartitionedDataFrame.
+
+        Returns
+        -------
+        PartitionedDataFrame
+            The PartitionedDataFrame with the column.
+
+        Raises
+        ------
+        ValueError
+            If the name is not a string or the PartitionedSeries was created from
+            another PartitionedDataFrame.
+        """
+        if not isinstance(name, str):
+            raise ValueError(f"column names must be strings (found: {type(name)})")
+        self._check_owner(series)
+        return self._with_step(_WithColumn(name, series._function))
+
+    def __len__(self) -> int:
+        """
+        Counts the rows, which runs the pipeline.
+
+        Returns
+        -------
+        int
+            The number of rows of all partitions.
+        """
+        return sum(self._map(_row_count))
+
+    def agg(self, aggregations_by_column: dict[str, str | list[str]]) -> DataFrame:
+        """
+        Aggregates columns in a single pass over the partitions.
+
+        Parameters
+        ----------
+        aggregations_by_column : dict[str, str | list[str]]
+            The aggregations (count, sum, mean, min, max, var, std, any, all) by column
+            name. A single aggregation keeps the name of the column, for a list of
+            aggregations the result columns are named `<column>_<aggregation>`.
+
+        Returns
+        -------
+        DataFrame
+            One row with the aggregated columns. None values are skipped like in the
+            aggregations of a Series.
+
+        Raises
+        ------
+        ValueError
+            If an aggregation is unknown or cannot be applied to the data type of the
+            column, or two result columns have the same name.
+        KeyError
+            If a column does not exist.
+        """
+        if not isinstance(aggregations_by_column, dict) or not aggregations_by_column:
+            raise ValueError(
+                "aggregations must be a non-empty dictionary of column names and aggregations"
+            )
+        outputs: dict[str, tuple[str, str]] = {}
+        for column, names in aggregations_by_column.items():
+            single = isinstance(names, str)
+            for name in [names] if isinstance(names, str) else names:
+                output = column if single else f"{column}_{name}"
+                if output in outputs:
+                    raise ValueError(f"duplicate result column {output}")
+                outputs[output] = (column, name)
+
+        partials = list(self._map(_Aggregate(outputs)))
+        result = {}
+        for output in outputs:
+            value = _merge(partial[output][0] for partial in partials).result()
+            result[output] = Series._from_trusted(
+                [value], partials[0][output][1], int(value is None)
+            )
+        return DataFrame._from_trusted(result)
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Runs the pipeline and concatenates the partitions into a DataFrame in memory.
+
+        Returns
+        -------
+        DataFrame
+            All rows of the result.
+
+        Raises
+        ------
+        ValueError
+            If a column has different data types in different partitions.
+        """
+        frames = list(self.partitions())
+        return DataFrame._from_trusted(
+            {name: concat(df[name] for df in frames) for name in frames[0].data}
+        )
+
+    def save(self, directory: str | PathLike) -> Self:
+        """
+        Runs the pipeline and writes the result of every partition into a file.
+
+        Parameters
+        ----------
+        directory : str or PathLike
+            The directory of the partition files, created if it does not exist.
+
+        Returns
+        -------
+        PartitionedDataFrame
+            The result partitions on disk.
+        """
+        return self.__class__(_save_partitions(self.partitions(), directory))
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the PartitionedDataFrame.
+
+        Returns
+        -------
+        str
+            The number of partitions and pending steps.
+        """
+        return f"PartitionedDataFrame(npartitions={self.npartitions}, steps={len(self._steps)}, parallel={self._executor is not None})"
+
+
+class PartitionedSeries:
+    """
+    A column of a PartitionedDataFrame, computed partition by partition when it is used.
+
+    Created by selecting a column of a PartitionedDataFrame and combined with the same
+    operators as Series. Operands must be scalars or PartitionedSeries of the same
+    PartitionedDataFrame.
+
+    Parameters
+    ----------
+    frame : PartitionedDataFrame
+        The PartitionedDataFrame the column is computed from.
+    function : Callable[[DataFrame], Series]
+        Computes the column of a partition.
+    """
+
+    def __init__(
+        self, frame: PartitionedDataFrame, function: Callable[[DataFrame], Series]
+    ) -> None:
+        self._frame = frame
+        self._function = function
+
+    def _binary(
+        self, other: object, operation: Callable, reflected: bool = False
+    ) -> Self:
+        """
+        Creates the PartitionedSeries of an operation with two operands.
+
+        Parameters
+        ----------
+        other : object
+            The other operand, a scalar or a PartitionedSeries of the same
+            PartitionedDataFrame.
+        operation : Callable
+            The operation on the Series of a partition (e.g. `operator.add`).
+        reflected : bool, optional
+            Whether `other` is the left operand, by default False.
+
+        Returns
+        -------
+        PartitionedSeries
+            The result.
+
+        Raises
+        ------
+        ValueError
+            If the other operand is a PartitionedSeries of another PartitionedDataFrame.
+        """
+        other_function: Callable[[DataFrame], object]
+        if isinstance(other, PartitionedSeries):
+            self._frame._check_owner(other)
+            other_function = other._function
+        else:
+            other_function = _Scalar(other)
+        if reflected:
+            return self.__class__(
+                self._frame, _Binary(operation, other_function, self._function)
+            )
+        return self.__class__(
+            self._frame, _Binary(operation, self._function, other_function)
+        )
+
+    def __add__(self, other: object) -> Self:
+        return self._binary(other, operator.add)
+
+    def __radd__(self, other: object) -> Self:
+        return self._binary(other, operator.add, reflected=True)
+
+    def __sub__(self, other: object) -> Self:
+        return self._binary(other, operator.sub)
+
+    def __rsub__(self, other: object) -> Self:
+        return self._binary(other, operator.sub, reflected=True)
+
+    def __mul__(self, other: object) -> Self:
+        return self._binary(other, operator.mul)
+
+    def __rmul__(self, other: object) -> Self:
+        return self._binary(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other: object) -> Self:
+        return self._binary(other, operator.truediv)
+
+    def __rtruediv__(self, other: object) -> Self:
+        return self._binary(other, operator.truediv, reflected=True)
+
+    def __lt__(self, other: object) -> Self:
+        return self._binary(other, operator.lt)
+
+    def __le__(self, other: object) -> Self:
+        return self._binary(other, operator.le)
+
+    def __gt__(self, other: object) -> Self:
+        return self._binary(other, operator.gt)
+
+    def __ge__(self, other: object) -> Self:
+        return self._binary(other, operator.ge)
+
+    def __eq__(self, other: object) -> Self:  # type: ignore[override]
+        return self._binary(other, operator.eq)
+
+    def __ne__(self, other: object) -> Self:  # type: ignore[override]
+        return self._binary(other, operator.ne)
+
+    def __and__(self, other: object) -> Self:
+        return self._binary(other, operator.and_)
+
+    def __rand__(self, other: object) -> Self:
+        return self._binary(other, operator.and_, reflected=True)
+
+    def __or__(self, other: object) -> Self:
+        return self._binary(other, operator.or_)
+
+    def __ror__(self, other: object) -> Self:
+        return self._binary(other, operator.or_, reflected=True)
+
+    def __xor__(self, other: object) -> Self:
+        return self._binary(other, operator.xor)
+
+    def __rxor__(self, other: object) -> Self:
+        return self._binary(other, operator.xor, reflected=True)
+
+    def __invert__(self) -> Self:
+        return self.__class__(self._frame, _Invert(self._function))
+
+    def partitions(self) -> Iterator[Series]:
+        """
+        Computes the column partition by partition.
+
+        Returns
+        -------
+        Iterator[Series]
+            The column of every partition, computed when it is requested.
+        """
+        return self._frame._map(self._function)
+
+    def collect(self) -> Series:
+        """
+        Computes the column of all partitions and concatenates them into a Series in
+        memory.
+
+        Returns
+        -------
+        Series
+            All values of the column.
+        """
+        return concat(self.partitions())
+
+    def _reduce(self, name: str, ddof: int = 1) -> Any:
+        """
+        Aggregates the column partition by partition and merges the results.
+
+        Parameters
+        ----------
+        name : str
+            The name of the aggregation.
+        ddof : int, optional
+            Delta degrees of freedom of var and std, by default 1.
+
+        Returns
+        -------
+        Any
+            The result of the aggregation of the whole column, its type depends on the
+            aggregation.
+
+        Raises
+        ------
+        ValueError
+            If the aggregation cannot be applied to the data type of the column.
+        """
+        return _merge(self._frame._map(_Reduce(self._function, name, ddof))).result()
+
+    def count(self) -> int:
+        """
+        Counts the values that are not None.
+
+        Returns
+        -------
+        int
+            The number of values that are not None.
+        """
+        return self._reduce("count")
+
+    def sum(self) -> int | float:
+        """
+        Sums the values, skipping None (see `Series.sum()`).
+
+        Returns
+        -------
+        int or float
+            The sum.
+        """
+        return self._reduce("sum")
+
+    def mean(self) -> float | None:
+        """
+        Computes the arithmetic mean of the values, skipping None.
+
+        Returns
+        -------
+        float or None
+            The mean, None if there are no values.
+        """
+        return self._reduce("mean")
+
+    def var(self, ddof: int = 1) -> float | None:
+        """
+        Computes the variance of the values, skipping None.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom, by default 1 (sample variance).
+
+        Returns
+        -------
+        float or None
+            The variance, None if there are not more than `ddof` values.
+        """
+        return self._reduce("var", ddof)
+
+    def std(self, ddof: int = 1) -> float | None:
+        """
+        Computes the standard deviation of the values, skipping None.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom, by default 1 (sample standard deviation).
+
+        Returns
+        -------
+        float or None
+            The standard deviation, None if there are not more than `ddof` values.
+        """
+        return self._reduce("std", ddof)
+
+    def min(self) -> object:
+        """
+        Finds the smallest value, skipping None.
+
+        Returns
+        -------
+        object
+            The smallest value, None if there are no values.
+        """
+        return self._reduce("min")
+
+    def max(self) -> object:
+        """
+        Finds the largest value, skipping None.
+
+        Returns
+        -------
+        object
+            The largest value, None if there are no values.
+        """
+        return self._reduce("max")
+
+    def any(self) -> bool:
+        """
+        Checks whether any value is True, skipping None.
+
+        Returns
+        -------
+        bool
+            True if at least one value is True.
+        """
+        return self._reduce("any")
+
+    def all(self) -> bool:
+        """
+        Checks whether all values are True, skipping None.
+
+        Returns
+        -------
+        bool
+            True if no value is False (also if there are no values).
+        """
+        return self._reduce("all")
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the PartitionedSeries.
+
+        Returns
+        -------
+        str
+            The PartitionedDataFrame it is computed from.
+        """
+        return f"PartitionedSeries(frame={self._frame!r})"
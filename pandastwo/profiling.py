@@ -0,0 +1,392 @@
+"""
+Opt-in profiling of Series and DataFrame operations.
+
+`profile()` replaces the operators and methods of Series, DataFrame, GroupBy, Expr and
+the string functions with instrumented versions while a profile is active and restores
+the originals afterwards, so there is no overhead at all when no profile is active.
+Every call records the rows of its input, the wall time and the bytes of the buffers its
+result allocated (the intermediate it creates: buffers shared with the receiver or the
+arguments, e.g. of a selected column, and filtered views that are not created yet count
+as 0). Only the outermost instrumented call is recorded, the operations it calls
+internally are part of its time, so the time of a query is attributed to the operations
+called by the user. Indexing is recorded per kind of index, e.g.
+"DataFrame.__getitem__[mask]" for filters and "DataFrame.__getitem__[column]".
+
+Instrumenting replaces class attributes of the library, so profiles are meant for
+investigating a query in one thread at a time.
+"""
+
+from collections.abc import Callable, Iterator
+from functools import wraps
+from time import perf_counter_ns
+from typing import Self
+
+from pandastwo.buffers import (
+    Bitmap,
+    DictionaryArray,
+    Numeric,
+    StringArray,
+    storage_bytes,
+)
+
+# the methods that are instrumented by name, per class (the classes are imported when a
+# profile starts)
+_SERIES_METHODS = (
+    "__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__", "__truediv__", "__rtruediv__",
+    "__lt__", "__le__", "__gt__", "__ge__", "__eq__", "__ne__",
+    "__and__", "__rand__", "__or__", "__ror__", "__xor__", "__rxor__", "__invert__",
+    "__getitem__", "view", "copy", "dictionary_encode", "utf8_encode", "argsort", "sort_values",
+    "count", "sum", "mean", "var", "std", "min", "max", "any", "all",
+)  # fmt: skip
+_DATAFRAME_METHODS = (
+    "__getitem__",
+    "view",
+    "copy",
+    "groupby",
+    "merge",
+    "sort_values",
+    "save",
+)
+_STRING_METHODS = (
+    "contains",
+    "startswith",
+    "endswith",
+    "lower",
+    "upper",
+    "len",
+    "slice",
+)
+
+# the active profiles, every call is recorded by all of them
+_ACTIVE: list["Profile"] = []
+# the original functions of the instrumented methods by class and name
+_ORIGINALS: dict[tuple[type, str], Callable] = {}
+# the number of instrumented calls in progress
+_depth = 0
+# the operation of indexing by the type of the index, e.g. "DataFrame.__getitem__[mask]"
+_INDEX_KINDS = {str: "column", int: "element", slice: "slice"}
+
+
+class OperationStats:
+    """
+    The recorded calls of an operation.
+
+    Attributes
+    ----------
+    count : int
+        The number of calls.
+    rows : int
+        The number of input rows of all calls.
+    seconds : float
+        The wall time of all calls.
+    bytes : int
+        The bytes of the buffers of all results.
+    """
+
+    __slots__ = ("count", "rows", "seconds", "bytes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.bytes = 0
+
+    def __repr__(self) -> str:
+        return f"OperationStats(count={self.count}, rows={self.rows}, seconds={self.seconds:.6f}, bytes={self.bytes})"
+
+
+class Profile:
+    """
+    Records the operations called while it is active, created by `profile()`.
+
+    Parameters
+    ----------
+    callback : Callable[[str, int, float, int], None], optional
+        Called after every recorded call with the operation, the input rows, the wall
+        time in seconds and the bytes of the result.
+
+    Attributes
+    ----------
+    operations : dict[str, OperationStats]
+        The statistics by operation (e.g. "Series.__add__"), in the order of the first
+        call.
+    """
+
+    def __init__(
+        self, callback: Callable[[str, int, float, int], None] | None = None
+    ) -> None:
+        self.callback = callback
+        self.operations: dict[str, OperationStats] = {}
+
+    def record(self, operation: str, rows: int, seconds: float, nbytes: int) -> None:
+        """
+        Adds a call of an operation.
+
+        Parameters
+        ----------
+        operation : str
+            The name of the operation.
+        rows : int
+            The number of input rows.
+        seconds : float
+            The wall time.
+        nbytes : int
+            The bytes of the buffers of the result.
+        """
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = self.operations[operation] = OperationStats()
+        stats.count += 1
+        stats.rows += rows
+        stats.seconds += seconds
+        stats.bytes += nbytes
+        if self.callback is not None:
+            self.callback(operation, rows, seconds, nbytes)
+
+    def summary(self) -> str:
+        """
+        Formats the statistics as a table, the operation with the longest total time
+        first.
+
+        Returns
+        -------
+        str
+            The table.
+        """
+        lines = [
+            f"{'operation':<28} {'calls':>8} {'rows':>14} {'seconds':>12} {'bytes':>14}"
+        ]
+        for operation, stats in sorted(
+            self.operations.items(), key=lambda item: -item[1].seconds
+        ):
+            lines.append(
+                f"{operation:<28} {stats.count:>8} {stats.rows:>14} {stats.seconds:>12.6f} {stats.bytes:>14}"
+            )
+        return "\n".join(lines)
+
+    def __enter__(self) -> Self:
+        if not _ACTIVE:
+            _install()
+        _ACTIVE.append(self)
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        _ACTIVE.remove(self)
+        if not _ACTIVE:
+            _uninstall()
+
+
+def profile(callback: Callable[[str, int, float, int], None] | None = None) -> Profile:
+    """
+    Records the Series and DataFrame operations called inside a `with` block.
+
+    Parameters
+    ----------
+    callback : Callable[[str, int, float, int], None], optional
+        Called after every recorded call with the operation, the input rows, the wall
+        time in seconds and the bytes of the result (e.g. to send them to a metrics
+        pipeline).
+
+    Returns
+    -------
+    Profile
+        The profile, a context manager. `Profile.operations` holds the statistics of
+        every operation, `Profile.summary()` formats them as a table.
+    """
+    return Profile(callback)
+
+
+def _unwrap(target: object) -> object:
+    """
+    Returns the Series or DataFrame a string function or a GroupBy works on.
+
+    Parameters
+    ----------
+    target : object
+        The object a method is called on or an argument.
+
+    Returns
+    -------
+    object
+        The Series or DataFrame, other objects as they are.
+    """
+    from pandastwo.groupby import GroupBy
+    from pandastwo.strings import StringMethods
+
+    if isinstance(target, StringMethods):
+        return target._series
+    if isinstance(target, GroupBy):
+        return target.df
+    return target
+
+
+def _rows(target: object) -> int:
+    """
+    Returns the number of input rows of an instrumented call.
+
+    Parameters
+    ----------
+    target : object
+        The object the method is called on.
+
+    Returns
+    -------
+    int
+        The number of rows.
+    """
+    from pandastwo.dataframe import DataFrame
+    from pandastwo.expressions import Expr
+    from pandastwo.series import Series
+
+    target = _unwrap(target)
+    if isinstance(target, Series):
+        return len(target)
+    if isinstance(target, DataFrame):
+        return len(next(iter(target.data.values())))
+    if isinstance(target, Expr):
+        return target.length or 0
+    return 0
+
+
+def _buffers(target: object) -> Iterator[Numeric | list | bytes | memoryview]:
+    """
+    Yields the innermost buffers of a Series, the columns of a DataFrame or the Series of
+    an expression.
+
+    Parameters
+    ----------
+    target : object
+        The object.
+
+    Returns
+    -------
+    Iterator[Numeric | list | bytes | memoryview]
+        The buffers (arrays, lists, bytes, memoryviews), nothing for other objects and
+        views whose buffers are not created yet.
+    """
+    from pandastwo.dataframe import DataFrame
+    from pandastwo.expressions import Expr
+    from pandastwo.series import Series
+
+    target = _unwrap(target)
+    if isinstance(target, DataFrame):
+        for series in target.data.values():
+            yield from _buffers(series)
+    elif isinstance(target, Expr):
+        for series in target._series_leaves():
+            yield from _buffers(series)
+    elif isinstance(target, Series) and "_values" in target.__dict__:
+        for buffer in (target._values, target._validity):
+            if isinstance(buffer, Bitmap):
+                yield buffer.buffer
+            elif isinstance(buffer, DictionaryArray):
+                yield from (buffer.codes, buffer.dictionary)
+            elif isinstance(buffer, StringArray):
+                yield from (buffer.offsets, buffer.buffer)
+            elif buffer is not None:
+                yield buffer
+
+
+def _result_bytes(result: object, inputs: tuple) -> int:
+    """
+    Returns the bytes of the buffers allocated for the result of an instrumented call.
+
+    Parameters
+    ----------
+    result : object
+        The result.
+    inputs : tuple
+        The object the method is called on and the arguments, their buffers are not
+        allocated by the call.
+
+    Returns
+    -------
+    int
+        The bytes of the new buffers of a Series or the columns of a DataFrame, 0 for
+        other results.
+    """
+    existing = {id(buffer) for target in inputs for buffer in _buffers(target)}
+    # every buffer is counted once, memoryviews share the memory of another buffer
+    allocated = {
+        id(buffer): buffer
+        for buffer in _buffers(result)
+        if id(buffer) not in existing and not isinstance(buffer, memoryview)
+    }
+    return sum(storage_bytes(buffer)[0] for buffer in allocated.values())
+
+
+def _instrument(operation: str, function: Callable) -> Callable:
+    """
+    Wraps a method so that its calls are recorded by the active profiles.
+
+    Parameters
+    ----------
+    operation : str
+        The name of the operation.
+    function : Callable
+        The method.
+
+    Returns
+    -------
+    Callable
+        The instrumented method.
+    """
+    # selecting a column and filtering rows are recorded as different operations
+    indexing = operation.endswith("__getitem__")
+
+    @wraps(function)
+    def instrumented(self: object, *args: object, **kwargs: object) -> object:
+        global _depth
+        if _depth:
+            # called by another instrumented operation, part of its time
+            return function(self, *args, **kwargs)
+        _depth += 1
+        start = perf_counter_ns()
+        try:
+            result = function(self, *args, **kwargs)
+        finally:
+            _depth -= 1
+        seconds = (perf_counter_ns() - start) / 1e9
+        rows = _rows(self)
+        nbytes = _result_bytes(result, (self, *args, *kwargs.values()))
+        name = operation
+        if indexing:
+            name = f"{operation}[{_INDEX_KINDS.get(type(args[0]), 'mask')}]"
+        for active in _ACTIVE:
+            active.record(name, rows, seconds, nbytes)
+        return result
+
+    return instrumented
+
+
+def _install() -> None:
+    """
+    Replaces the instrumented methods with recording versions.
+    """
+    from pandastwo.dataframe import DataFrame
+    from pandastwo.expressions import Expr
+    from pandastwo.groupby import GroupBy
+    from pandastwo.series import Series
+    from pandastwo.strings import StringMethods
+
+    targets = [
+        (Series, "Series", _SERIES_METHODS),
+        (DataFrame, "DataFrame", _DATAFRAME_METHODS),
+        (GroupBy, "GroupBy", ("agg",)),
+        (Expr, "Expr", ("collect",)),
+        (StringMethods, "Series.str", _STRING_METHODS),
+    ]
+    for cls, prefix, names in targets:
+        for name in names:
+            original = cls.__dict__[name]
+            _ORIGINALS[(cls, name)] = original
+            setattr(cls, name, _instrument(f"{prefix}.{name}", original))
+
+
+def _uninstall() -> None:
+    """
+    Restores the original methods.
+    """
+    for (cls, name), original in _ORIGINALS.items():
+        setattr(cls, name, original)
+    _ORIGINALS.clear()
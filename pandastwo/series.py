@@ -1,7 +1,41 @@
 # %%
-from collections.abc import Callable
+import operator
+from array import array
+from collections.abc import Buffer, Callable, Iterable
+from itertools import repeat
+from types import NoneType
 from typing import Self, Type, overload
 
+from pandastwo import aggregations, numpy_backend, sorting
+from pandastwo.buffers import (
+    FLOAT_DTYPES,
+    INT_DTYPES,
+    INT_TYPECODE,
+    Bitmap,
+    DictionaryArray,
+    Numeric,
+    Selection,
+    StringArray,
+    Values,
+    as_array,
+    build_storage,
+    combine_validity,
+    convert_width,
+    count_nulls,
+    dtype_of,
+    float32_or_none,
+    narrow_ints,
+    numeric_buffer,
+    slice_values,
+    storage_bytes,
+    take_nullable,
+    to_pylist,
+    typecode_of,
+    validity_buffer,
+)
+from pandastwo.expressions import Expr
+from pandastwo.strings import StringMethods
+
 
 class Series[ST]:  # ST is a Generic Type for Series type
     """
@@ -9,33 +43,563 @@ class Series[ST]:  # ST is a Generic Type for Series type
 
     Parameters
     ----------
-    data : list[ST]
-        The data to store in the series. Must be non-empty and of a single data type.
+    data : list[ST] or buffer
+        The data to store in the series. Must be non-empty and of a single data type. An
+        object supporting the buffer protocol with signed integers, floats or doubles
+        (e.g. an array or a numpy array) is used as the values of an int or float Series
+        of the matching dtype without copying, see `from_buffers()`.
+    dtype : str, optional
+        The physical width of the values of an int or float Series: "int8", "int16",
+        "int32", "int64", "float32" or "float64", or "auto" for the narrowest width that
+        holds the values exactly. By default int values are stored with 64 bits (or as
+        objects if they do not fit) and float values as doubles. The data type of the
+        Series stays int or float, see `dtype`.
 
     Raises
     ------
     ValueError
-        If the data is empty or contains unsupported types.
+        If the data is empty or contains unsupported types, or the values do not fit
+        into the dtype.
+
+    Notes
+    -----
+    The values are not kept as a list of Python objects. int and float values are stored
+    in contiguous typed arrays, bool values in a packed bitmap and str values in a list.
+    None values are tracked in a separate validity bitmap (see `pandastwo.buffers`). int
+    and float Series export their values with the buffer protocol
+    (`memoryview(series)`).
+
+    Arithmetic on Series of narrow widths never wraps around: the result has the width
+    of the widest Series operand, or a wider one if its values do not fit.
     """
 
-    def __init__(self, data: list[ST]) -> None:
+    data_type: type[ST]
+    # the physical storage, see `pandastwo.buffers.build_storage`
+    _values: Values
+    _validity: Bitmap | None
+    _null_count: int
+    # (parent Series, Selection) of a filtered view whose buffers are not created yet
+    _view: "tuple[Series[ST], Selection] | None" = None
+
+    def __init__(
+        self, data: list[ST | None] | Buffer, dtype: str | None = None
+    ) -> None:
+        if not isinstance(data, list):
+            # shares the buffer of the data, raises ValueError if it is not supported
+            values = numeric_buffer(data)
+            if not values:
+                raise ValueError("data cannot be empty")
+            data_type: type = float if values.format in FLOAT_DTYPES.values() else int
+            self.data_type = data_type
+            self._values, self._validity, self._null_count = values, None, 0
+            if dtype is not None:
+                self._values = self._convert_width(dtype)
+            return
         # currently data cannot be empty because there is no way to add data and an empty DataFrame is not useful
         # this should be changed in the future when adding data is implemented
         if not data:
             raise ValueError("data cannot be empty")
-        if not isinstance(data, list):
-            raise ValueError(f"data must be of type list (found {type(data)})")
 
         data_type = self._find_data_type(data)
-        self.data_type: type[ST] = data_type
+        self.data_type = data_type
         self._check_data_type_allowed(data_type)
         self._check_data_type(data, data_type)
-        # If performance is to be increased, data could be stored in a numpy array
-        # All operations would then be done using numpy functions
-        # This would increase performance significantly especially for large Series
-        self.data: list[ST] = data
+        self._null_count = data.count(None)
+        self._values, self._validity = build_storage(data, data_type, self._null_count)
+        if dtype is not None:
+            self._values = self._convert_width(dtype)
+
+    def _convert_width(self, dtype: str) -> Numeric | list:
+        """
+        Returns the values of the Series stored in a physical width.
+
+        Parameters
+        ----------
+        dtype : str
+            The dtype name, or "auto" for the narrowest width that holds the values
+            exactly.
+
+        Returns
+        -------
+        Numeric or list
+            The values buffer.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not numeric, the dtype is not a width of its data type, or
+            the values do not fit into it.
+        """
+        values = self._values
+        widths = {int: INT_DTYPES, float: FLOAT_DTYPES}.get(self.data_type)
+        if widths is None or isinstance(values, (Bitmap, DictionaryArray, StringArray)):
+            raise ValueError(
+                f"only int and float Series have a dtype (found: {self.data_type})"
+            )
+        if dtype != "auto" and dtype not in widths:
+            raise ValueError(
+                f"dtype must be 'auto' or one of {list(widths)} for Series of type {self.data_type.__name__} "
+                f"(found: {dtype!r})"
+            )
+        return convert_width(values, dtype)
+
+    @property
+    def dtype(self) -> str:
+        """
+        The physical storage of the values.
+
+        Returns
+        -------
+        str
+            "int8", "int16", "int32", "int64", "float32" or "float64" for int and float
+            Series, "object" for int values that do not fit into 64 bits, "bool" or
+            "str" otherwise.
+        """
+        dtype = dtype_of(self._values)
+        if dtype is not None:
+            return dtype
+        return "object" if self.data_type is int else self.data_type.__name__
+
+    @staticmethod
+    def _from_storage[T](
+        data_type: Type[T],
+        values: Values,
+        validity: Bitmap | None,
+        null_count: int | None = None,
+    ) -> "Series[T]":
+        """
+        Creates a Series directly from its physical storage without any validation.
+
+        Parameters
+        ----------
+        data_type : Type[T]
+            The type of the values.
+        values : Values
+            The values buffer (see `pandastwo.buffers.build_storage`).
+        validity : Bitmap or None
+            The validity bitmap (None if there are no None values).
+        null_count : int, optional
+            The number of None values if already known, otherwise it is counted in the
+            validity bitmap.
+
+        Returns
+        -------
+        Series[T]
+            The new Series.
+        """
+        if null_count is None:
+            null_count = count_nulls(validity)
+        series: Series[T] = Series.__new__(Series)
+        series.data_type = data_type
+        series._values = values
+        # a validity bitmap without cleared bits is dropped, so null-free Series never
+        # carry one
+        series._validity = validity if null_count else None
+        series._null_count = null_count
+        return series
+
+    @classmethod
+    def from_buffers(cls, values: Buffer, validity: Buffer | None = None) -> "Series":
+        """
+        Creates an int or float Series on top of buffers of other libraries without
+        copying them.
+
+        Parameters
+        ----------
+        values : object
+            The values, an object supporting the buffer protocol (e.g. an array, a numpy
+            array or a memoryview) that is one-dimensional and contiguous with 8, 16, 32
+            or 64-bit signed integers (int Series) or floats or doubles (float Series) in
+            native byte order, which give the dtype of the Series. The values at None
+            positions are ignored.
+        validity : object, optional
+            The packed validity bits as an object supporting the buffer protocol, least
+            significant bit first and a set bit for every valid value (like the validity
+            bitmaps of Arrow). By default all values are valid.
 
-    def _find_data_type(self, data: list[ST]) -> Type[ST]:
+        Returns
+        -------
+        Series
+            The Series. It reads the buffers of the objects, which must not be changed
+            while it is used.
+
+        Raises
+        ------
+        ValueError
+            If a buffer is not supported or the validity has fewer bits than there are
+            values.
+        """
+        if isinstance(values, list):
+            raise ValueError(
+                "values must support the buffer protocol, lists are passed to Series()"
+            )
+        series = cls(values)
+        if validity is None:
+            return series
+        return cls._from_storage(
+            series.data_type, series._values, validity_buffer(validity, len(series))
+        )
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Exports the values of an int or float Series with the buffer protocol, without
+        copying.
+
+        Values at None positions hold a placeholder (0 or 0.0), see `validity_buffer()`.
+
+        Parameters
+        ----------
+        flags : int
+            The requested buffer flags, the buffer is read-only.
+
+        Returns
+        -------
+        memoryview
+            A read-only view of the values in their width (64-bit integers or doubles by
+            default, see `dtype`).
+
+        Raises
+        ------
+        TypeError
+            If the Series is not of type int or float, or has ints that do not fit into
+            64 bits.
+        """
+        if not isinstance(self._values, (array, memoryview)):
+            raise TypeError(
+                "only int and float Series with 64-bit values support the buffer protocol "
+                f"(found {self.data_type})"
+            )
+        return memoryview(self._values).toreadonly()
+
+    def validity_buffer(self) -> memoryview | None:
+        """
+        Exports the validity bitmap without copying.
+
+        Returns
+        -------
+        memoryview or None
+            A read-only view of the packed bits, least significant bit first and a set
+            bit for every valid value (like the validity bitmaps of Arrow). None if
+            there are no None values.
+        """
+        if self._validity is None:
+            return None
+        return memoryview(self._validity.buffer).toreadonly()
+
+    @staticmethod
+    def _from_trusted[T](
+        data: list, data_type: Type[T], null_count: int
+    ) -> "Series[T]":
+        """
+        Creates a Series from data produced by the library itself, skipping all
+        validation.
+
+        Unlike `__init__` the data type is not inferred and the values are not type
+        checked, the data may be empty or consist of only None values.
+
+        Parameters
+        ----------
+        data : list
+            The values, must all be of `data_type` or None.
+        data_type : Type[T]
+            The type of the values.
+        null_count : int
+            The number of None values in the data.
+
+        Returns
+        -------
+        Series[T]
+            The new Series.
+        """
+        return Series._from_storage(
+            data_type, *build_storage(data, data_type, null_count), null_count
+        )
+
+    @property
+    def null_count(self) -> int:
+        """
+        The number of None values in the Series.
+
+        The count is known from construction and passed on by the operations, it is not
+        recomputed.
+
+        Returns
+        -------
+        int
+            The number of None values.
+        """
+        return self._null_count
+
+    @property
+    def has_nulls(self) -> bool:
+        """
+        Whether the Series contains any None values.
+
+        Operations on Series without None values skip all checks for None.
+
+        Returns
+        -------
+        bool
+            True if there is at least one None value.
+        """
+        return self._null_count > 0
+
+    @property
+    def data(self) -> list[ST]:
+        """
+        The values of the Series as a list (None for missing values).
+
+        The list is created from the underlying buffers on every access,
+        changing it does not change the Series.
+
+        Returns
+        -------
+        list[ST]
+            The values of the Series.
+        """
+        return to_pylist(self._values, self._validity)
+
+    def _bits(self) -> Bitmap:
+        """
+        Returns the packed values of a bool Series.
+
+        Returns
+        -------
+        Bitmap
+            The value bits, cleared for None values.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not of type bool.
+        """
+        if not isinstance(self._values, Bitmap):
+            raise ValueError(
+                f"only Series of type bool have value bits (found: {self.data_type})"
+            )
+        return self._values
+
+    def _selection(self) -> Selection:
+        """
+        Converts a bool Series into the selection of the rows where it is True.
+
+        The mask is not validated, the caller must check that the Series is of type
+        bool.
+
+        Returns
+        -------
+        Selection
+            The selected rows (None and False are not selected).
+        """
+        # None values of a bool Series are stored as cleared bits,
+        # so the value bits select exactly the elements that are True
+        return Selection(self._bits().to_bytes01())
+
+    def dictionary_encode(self) -> "Series[ST]":
+        """
+        Returns the Series with dictionary encoded storage.
+
+        The distinct values are stored once and every element as an integer code, so
+        that equality comparisons, grouping and joins work on the codes. str data with
+        few distinct values is dictionary encoded automatically on construction.
+
+        Returns
+        -------
+        Series[str]
+            The dictionary encoded Series.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not of type str.
+        """
+        if self.data_type is not str:
+            raise ValueError(
+                f"only Series of type str can be dictionary encoded (found: {self.data_type})"
+            )
+        if isinstance(self._values, DictionaryArray):
+            return self
+        return Series._from_storage(
+            self.data_type,
+            DictionaryArray.from_values(self.data),
+            self._validity,
+            self._null_count,
+        )
+
+    def utf8_encode(self) -> "Series[ST]":
+        """
+        Returns the Series with its str values stored in one contiguous UTF-8 buffer.
+
+        The values are concatenated into a bytes buffer with an array of offsets (the
+        layout of Arrow strings), which saves the object overhead of every str and suits
+        columns with many distinct values. Equality comparisons, filtering and slicing
+        work directly on the buffers.
+
+        Returns
+        -------
+        Series[str]
+            The UTF-8 encoded Series.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not of type str.
+        """
+        if self.data_type is not str:
+            raise ValueError(
+                f"only Series of type str can be UTF-8 encoded (found: {self.data_type})"
+            )
+        if isinstance(self._values, StringArray):
+            return self
+        return Series._from_storage(
+            self.data_type,
+            StringArray.from_values(self._value_list()),
+            self._validity,
+            self._null_count,
+        )
+
+    def memory_usage(self, deep: bool = False) -> dict[str, int]:
+        """
+        Returns the memory used by the buffers of the Series in bytes.
+
+        Buffers that are shared with other Series (e.g. a dictionary or a mapped file)
+        are counted in full.
+
+        Parameters
+        ----------
+        deep : bool, optional
+            Whether the Python objects referenced by the values are measured as well
+            (the str objects of a str Series stored as a list or a dictionary, int
+            values too large for 64 bits), by default False.
+
+        Returns
+        -------
+        dict[str, int]
+            "values" (the values buffer, the pointers of a list), "validity" (the
+            validity bitmap), "objects" (the referenced Python objects, 0 if not `deep`)
+            and their "total".
+        """
+        values, objects = storage_bytes(self._values, deep)
+        validity = storage_bytes(self._validity)[0]
+        return {
+            "values": values,
+            "validity": validity,
+            "objects": objects,
+            "total": values + validity + objects,
+        }
+
+    def compact(self) -> "Series[ST]":
+        """
+        Returns the Series in its most compact storage.
+
+        A view gets its own buffers. int values are stored in the narrowest width that
+        holds them, float values as float32 if no value is rounded (see `dtype`). str
+        values are stored as a list, dictionary encoded or UTF-8 encoded, whichever uses
+        the least memory including the str objects. Values on top of a memoryview (e.g.
+        of a mapped file or shared memory) are kept, copying them would use more memory
+        of the process.
+
+        Returns
+        -------
+        Series[ST]
+            The compact Series (the Series itself if its storage is already the most
+            compact).
+        """
+        series = self.copy() if self._view is not None else self
+        if isinstance(series._values, array):
+            values = convert_width(series._values, "auto")
+            if values is series._values:
+                return series
+            return Series._from_storage(
+                series.data_type, values, series._validity, series._null_count
+            )
+        if series.data_type is not str:
+            return series
+        candidates = [series, series.dictionary_encode(), series.utf8_encode()]
+        return min(
+            candidates, key=lambda candidate: candidate.memory_usage(deep=True)["total"]
+        )
+
+    def lazy(self) -> Expr:
+        """
+        Returns a lazily evaluated expression of the Series.
+
+        Operators on the expression build an expression tree instead of computing
+        intermediate Series. The tree is evaluated in a single pass by `Expr.collect()`
+        or when it is used to filter a DataFrame.
+
+        Returns
+        -------
+        Expr
+            The expression.
+        """
+        return Expr._wrap(self)
+
+    def _value_list(self) -> list:
+        """
+        Returns the raw values of the Series as a list, ignoring the validity bitmap.
+
+        Missing values hold a placeholder (0, 0.0, False or None) and must be masked by
+        the caller.
+
+        Returns
+        -------
+        list
+            The raw values.
+        """
+        if isinstance(self._values, list):
+            return self._values
+        if isinstance(self._values, (Bitmap, DictionaryArray, StringArray)):
+            return self._values.to_list()
+        return self._values.tolist()
+
+    def _select(self, selection: Selection) -> "Series[ST]":
+        """
+        Keeps only the selected elements.
+
+        Parameters
+        ----------
+        selection : Selection
+            The selected rows, must have the same length as the Series.
+
+        Returns
+        -------
+        Series[ST]
+            The selected elements.
+        """
+        if numpy_backend.is_used(self):
+            return numpy_backend.select_series(self, selection)
+        if self._validity is None:
+            return Series._from_storage(
+                self.data_type, selection.apply(self._values), None, 0
+            )
+        return Series._from_storage(
+            self.data_type,
+            selection.apply(self._values),
+            selection.apply(self._validity),
+        )
+
+    def _take(self, positions: array) -> "Series[ST]":
+        """
+        Gathers the elements at the given positions.
+
+        Parameters
+        ----------
+        positions : array
+            The positions as `array('q')`, -1 gives None.
+
+        Returns
+        -------
+        Series[ST]
+            The gathered elements.
+        """
+        if numpy_backend.is_used(self):
+            return numpy_backend.take_series(self, positions)
+        return Series._from_storage(
+            self.data_type, *take_nullable(self._values, self._validity, positions)
+        )
+
+    def _find_data_type(self, data: list[ST | None]) -> Type[ST]:
         """
         Determines the type of the first non-None element in the data.
 
@@ -78,7 +642,7 @@ class Series[ST]:  # ST is a Generic Type for Series type
                 f"Data type not allowed. (currently: {data_type}), allowed are: int, float, bool, str"
             )
 
-    def _check_data_type(self, data: list[ST], expected_type: Type[ST]) -> None:
+    def _check_data_type(self, data: list[ST | None], expected_type: Type[ST]) -> None:
         """
         Checks that all elements in the data are of the expected type or None.
 
@@ -94,26 +658,29 @@ class Series[ST]:  # ST is a Generic Type for Series type
         ValueError
             If any element is not of the expected type or None.
         """
-        if not all(isinstance(x, expected_type) or x is None for x in data):
+        if not all(map(isinstance, data, repeat((expected_type, NoneType)))):
             raise ValueError(
                 f"The data must be of a single type or None. (currently: {expected_type} or None)"
             )
 
     @overload
-    def __getitem__(self, index: int) -> ST: ...
+    def __getitem__(self, index: int) -> ST | None: ...
 
     @overload
-    def __getitem__(self, index: Self) -> Self: ...
+    def __getitem__(self, index: Self) -> "Series[ST]": ...
 
-    def __getitem__(self, index: int | Self) -> ST | Self:
-        # TODO: add support for numpy arrays for performance (boolean masking is more efficient with numpy)
+    @overload
+    def __getitem__(self, index: slice) -> "Series[ST]": ...
+
+    def __getitem__(self, index: int | Self | slice) -> "ST | Series[ST] | None":
         """
-        Retrieves elements from the Series based on an integer index or a boolean Series.
+        Retrieves elements from the Series based on an integer index, a boolean Series
+        or a slice.
 
         Parameters
         ----------
-        index : int or Series
-            The index or mask for selecting elements.
+        index : int or Series or slice
+            The index, mask or range for selecting elements.
 
         Returns
         -------
@@ -127,31 +694,177 @@ class Series[ST]:  # ST is a Generic Type for Series type
         IndexError
             If the integer index is out of range.
         """
+        if isinstance(index, slice):
+            return self._slice(index)
         if not isinstance(index, int) and not isinstance(index, Series):
             raise ValueError(
-                f"index must be an integer or a Series of booleans (found {type(index)})"
+                f"index must be an integer, a Series of booleans or a slice (found {type(index)})"
             )
 
         if isinstance(index, int):
-            if index < 0 or index >= len(self.data):
+            if index < 0 or index >= len(self):
                 raise IndexError(
-                    f"index out of range (index: {index}, length: {len(self.data)})"
+                    f"index out of range (index: {index}, length: {len(self)})"
                 )
-            return self.data[index]
+            if self._view is not None:
+                # read through to the parent instead of creating the buffers of the view
+                parent, selection = self._view
+                return parent[selection.positions[index]]
+            if self._validity is not None and not self._validity[index]:
+                return None
+            # the values are of the data type ST of the Series
+            return self._values[index]  # type: ignore[return-value]
+
+        return self._select(self._mask_selection(index))
+
+    def _slice(self, index: slice) -> "Series[ST]":
+        """
+        Selects a range of elements.
 
-        if isinstance(index, Series):
-            if len(index) != len(self.data):
-                raise ValueError(
-                    f"index must have the same length as the data (index length: {len(index)}, data length: {len(self.data)})"
-                )
-            for i in index.data:
-                if i is not None and not isinstance(
-                    i, bool
-                ):  # if i is neither None nor bool
-                    raise ValueError(
-                        f"Series must contain only booleans or None (found: {type(i)})"
-                    )
-            return Series([self.data[i] for i in range(len(index)) if index[i] is True])
+        Parameters
+        ----------
+        index : slice
+            The range, with the semantics of slicing a list.
+
+        Returns
+        -------
+        Series[ST]
+            The selected elements.
+        """
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            return self._take(array(INT_TYPECODE, range(start, stop, step)))
+        stop = max(start, stop)
+        validity = (
+            None
+            if self._validity is None
+            else slice_values(self._validity, start, stop)
+        )
+        return Series._from_storage(
+            self.data_type, slice_values(self._values, start, stop), validity
+        )
+
+    def _mask_selection(self, index: Self) -> Selection:
+        """
+        Validates a boolean mask and converts it into a selection.
+
+        Parameters
+        ----------
+        index : Series
+            The mask, True selects the element.
+
+        Returns
+        -------
+        Selection
+            The selected rows.
+
+        Raises
+        ------
+        ValueError
+            If the mask is mismatched in size or not of type bool.
+        """
+        if len(index) != len(self):
+            raise ValueError(
+                f"index must have the same length as the data (index length: {len(index)}, data length: {len(self)})"
+            )
+        if index.data_type is not bool:
+            raise ValueError(
+                f"Series must contain only booleans or None (found: {index.data_type})"
+            )
+        return index._selection()
+
+    def view(self, index: Self) -> "Series[ST]":
+        """
+        Filters the Series with a boolean Series like `series[index]`, but without
+        copying.
+
+        The view only references this Series and the selected positions. Its buffers are
+        created the first time they are needed (e.g. for an operation or `data`); single
+        elements are read directly from this Series. Use `copy()` to create the buffers
+        explicitly.
+
+        Parameters
+        ----------
+        index : Series
+            The mask for selecting elements.
+
+        Returns
+        -------
+        Series[ST]
+            A view of the selected elements.
+
+        Raises
+        ------
+        ValueError
+            If the index is not a boolean Series of the same length.
+        """
+        if not isinstance(index, Series):
+            raise ValueError(
+                f"index must be a Series of booleans (found {type(index)})"
+            )
+        return self._view_of(self._mask_selection(index))
+
+    def _view_of(self, selection: Selection) -> "Series[ST]":
+        """
+        Creates a view of the selected elements.
+
+        Parameters
+        ----------
+        selection : Selection
+            The selected rows, must have the same length as the Series.
+
+        Returns
+        -------
+        Series[ST]
+            The view.
+        """
+        series = Series.__new__(Series)
+        series.data_type = self.data_type
+        series._view = (self, selection)
+        return series
+
+    def __getattr__(self, name: str) -> object:
+        """
+        Creates the buffers of a view the first time they are accessed.
+
+        Only called for attributes that are not set, so Series that are not views are
+        not affected.
+        """
+        if name in ("_values", "_validity", "_null_count") and self._view is not None:
+            parent, selection = self._view
+            materialized = parent._select(selection)
+            self._values, self._validity = materialized._values, materialized._validity
+            self._null_count = materialized._null_count
+            self._view = None  # release the parent
+            return getattr(self, name)
+        raise AttributeError(f"'Series' object has no attribute '{name}'")
+
+    def copy(self) -> "Series[ST]":
+        """
+        Returns a copy of the Series with its own buffers.
+
+        For a view this creates the buffers of the selected elements without keeping a
+        reference to the parent.
+
+        Returns
+        -------
+        Series[ST]
+            The copy.
+        """
+        if self._view is not None:
+            parent, selection = self._view
+            return parent._select(selection)
+        # bitmaps, dictionaries and UTF-8 buffers are not changed after creation and can
+        # be shared, lists and arrays are copied by slicing, memoryviews (e.g. of a
+        # mapped file) into an array
+        values = self._values
+        if isinstance(values, memoryview):
+            values = as_array(values)
+        elif isinstance(values, (list, array)):
+            values = values[:]
+        return Series._from_storage(
+            self.data_type, values, self._validity, self._null_count
+        )
 
     def __len__(self) -> int:
         """
@@ -162,17 +875,18 @@ class Series[ST]:  # ST is a Generic Type for Series type
         int
             The length of the Series.
         """
-        return len(self.data)
+        if self._view is not None:
+            return self._view[1].count
+        return len(self._values)
 
-    def __eq__(self, other: object) -> Self:
-        # TODO: add support for numpy arrays for performance
+    def __eq__(self, other: object) -> "Series[bool]":  # type: ignore[override]
         """
-        Compares the Series for equality with another Series element-wise.
+        Compares the Series for equality with another Series or a scalar element-wise.
 
         Parameters
         ----------
         other : object
-            The Series to compare against.
+            The Series or scalar to compare against.
 
         Returns
         -------
@@ -184,9 +898,13 @@ class Series[ST]:  # ST is a Generic Type for Series type
         ValueError
             If the Series are of different lengths or types.
         """
+        if isinstance(other, Expr):
+            return NotImplemented  # evaluated lazily by Expr.__eq__
+        if isinstance(other, (int, float, str)):
+            return self._eq_scalar_function(other)
         if not isinstance(other, Series):
             raise ValueError(
-                f"Only Series can be compared using equality operations (found {type(other)})"
+                f"Only Series or scalars can be compared using equality operations (found {type(other)})"
             )
         if len(self) != len(other):
             raise ValueError(
@@ -197,15 +915,152 @@ class Series[ST]:  # ST is a Generic Type for Series type
                 f"Series must have the same data type for equality operations (found {self.data_type} and {other.data_type})"
             )
 
-        return Series([x == y for x, y in zip(self.data, other.data)])
+        if self.data_type is bool:
+            # compare the packed bits directly
+            return self._eq_valid_function(other, ~(self._bits() ^ other._bits()))
+        if numpy_backend.is_used(self, other):
+            return numpy_backend.equal(self, other)
+        left, right = self._values, other._values
+        if isinstance(left, DictionaryArray) and isinstance(right, DictionaryArray):
+            return self._eq_dictionary_function(left, right)
+        if isinstance(left, StringArray) and isinstance(right, StringArray):
+            # compare the encoded bytes of the values without decoding them
+            return self._eq_valid_function(
+                other, Bitmap.from_bytes01(left.equal(right))
+            )
+
+        return Series._from_storage(
+            bool,
+            Bitmap.from_bools(x == y for x, y in zip(self.data, other.data)),
+            None,
+            0,
+        )
+
+    def _eq_valid_function(self, other: "Series", equal: Bitmap) -> "Series[bool]":
+        """
+        Applies the validity of both Series to the element-wise equality of their stored
+        values.
+
+        Parameters
+        ----------
+        other : Series
+            The Series compared against, of the same length.
+        equal : Bitmap
+            The equality of the stored values, including the placeholders of None
+            values.
+
+        Returns
+        -------
+        Series[bool]
+            A Series of booleans representing equality element-wise (None is equal to
+            None but to no other value).
+        """
+        if not self.has_nulls and not other.has_nulls:
+            return Series._from_storage(bool, equal, None, 0)
+        full = (1 << len(self)) - 1
+        vx = full if self._validity is None else self._validity.to_int()
+        vy = full if other._validity is None else other._validity.to_int()
+        bits = (vx & vy & equal.to_int()) | (~vx & ~vy & full)
+        return Series._from_storage(bool, Bitmap.from_int(bits, len(self)), None, 0)
+
+    @staticmethod
+    def _eq_dictionary_function(
+        left: DictionaryArray, right: DictionaryArray
+    ) -> "Series[bool]":
+        """
+        Compares two dictionary encoded str Series for equality element-wise on their
+        codes.
+
+        Parameters
+        ----------
+        left : DictionaryArray
+            The values of the Series.
+        right : DictionaryArray
+            The values of the Series to compare against, of the same length.
+
+        Returns
+        -------
+        Series[bool]
+            A Series of booleans representing equality element-wise (None is equal to
+            None).
+        """
+        codes: Iterable[int]
+        if left.dictionary is right.dictionary:
+            codes = right.codes
+        else:
+            # translate the codes of other into codes of this dictionary,
+            # -2 for values that are not in this dictionary and -1 stays -1 for None
+            translation = [left.code_of(value) for value in right.dictionary]
+            translation = [-2 if code < 0 else code for code in translation] + [-1]
+            codes = map(translation.__getitem__, right.codes)
+        equal = bytes(map(operator.eq, left.codes, codes))
+        return Series._from_storage(bool, Bitmap.from_bytes01(equal), None, 0)
+
+    def _eq_scalar_function(self, other: int | float | str) -> "Series[bool]":
+        """
+        Compares every element of the Series for equality with a scalar.
+
+        Parameters
+        ----------
+        other : int or float or bool or str
+            The scalar to compare against. Must be of the same type as the Series.
+
+        Returns
+        -------
+        Series[bool]
+            A Series of booleans representing equality element-wise (None is never
+            equal).
+
+        Raises
+        ------
+        ValueError
+            If the scalar is not of the data type of the Series.
+        """
+        if self.data_type is not type(other):
+            raise ValueError(
+                f"Series must have the same data type for equality operations (found {self.data_type} and {type(other)})"
+            )
+
+        if self.data_type is bool:
+            # value bits of None elements are cleared
+            bits = self._bits()
+            if other:
+                return Series._from_storage(bool, bits, None, 0)
+            if self._validity is None:
+                return Series._from_storage(bool, ~bits, None, 0)
+            return Series._from_storage(bool, ~bits & self._validity, None, 0)
+        if numpy_backend.is_used(self) and not isinstance(other, str):
+            result = numpy_backend.equal_scalar(self, other)
+            if result is not None:
+                return result
+        if isinstance(self._values, DictionaryArray) and isinstance(other, str):
+            # the scalar is looked up once, then only the codes are compared (None has
+            # code -1)
+            code = self._values.code_of(other)
+            equal = (
+                bytes(len(self))
+                if code < 0
+                else bytes(map(operator.eq, self._values.codes, repeat(code)))
+            )
+            return Series._from_storage(bool, Bitmap.from_bytes01(equal), None, 0)
+        if isinstance(self._values, StringArray) and isinstance(other, str):
+            # None values are stored as empty strings and masked by the validity
+            bits = Bitmap.from_bytes01(self._values.equal_scalar(other))
+            if self._validity is not None:
+                bits &= self._validity
+            return Series._from_storage(bool, bits, None, 0)
+
+        return Series._from_storage(
+            bool, Bitmap.from_bools(map(operator.eq, self.data, repeat(other))), None, 0
+        )
 
     def _math_helper_function(
         self,
-        other: Self,
+        other: Self | int | float,
         operation: Callable,  # Callable[[float, float], float] | Callable[[int, int], int]
         force_float: bool = False,
-    ) -> Self:
-        # TODO: add support for numpy arrays for performance (thus for all mathematical operations)
+        reflected: bool = False,
+    ) -> "Series":
         """
         Helper function to perform element-wise arithmetic operations.
 
@@ -217,20 +1072,61 @@ class Series[ST]:  # ST is a Generic Type for Series type
             The arithmetic operation to perform.
         force_float : bool, optional
             Whether to cast results to float, by default False.
+        reflected : bool, optional
+            Whether `other` is the left operand, by default False. Only used for
+            scalars.
 
         Returns
         -------
         Series
-            The result of the operation.
+            The result of the operation, in the width of the widest Series operand or a
+            wider one if its values do not fit (scalars do not widen the result).
 
         Raises
         ------
         ValueError
             If the operation is not valid for the data types or lengths.
         """
+        if isinstance(other, Expr):
+            return NotImplemented  # evaluated lazily by the reflected operator of Expr
         if isinstance(other, int) or isinstance(other, float):
-            # if other is a scalar, make it a Series and continue operation
-            other = Series([other for _ in self.data])
+            # scalars are applied directly instead of being broadcast to a full Series
+            result = self._math_scalar_function(
+                other, operation, force_float, reflected
+            )
+            return _in_operand_width(result, self)
+        result = self._math_series_function(other, operation, force_float)
+        return _in_operand_width(result, self, other)
+
+    def _math_series_function(
+        self,
+        other: Self,
+        operation: Callable,  # Callable[[float, float], float] | Callable[[int, int], int]
+        force_float: bool = False,
+    ) -> "Series":
+        """
+        Helper function to perform an element-wise arithmetic operation between two
+        Series.
+
+        Parameters
+        ----------
+        other : Series
+            The right operand.
+        operation : Callable
+            The arithmetic operation to perform.
+        force_float : bool, optional
+            Whether to cast results to float, by default False.
+
+        Returns
+        -------
+        Series
+            The result of the operation, int results with 64 bits.
+
+        Raises
+        ------
+        ValueError
+            If the operation is not valid for the data types or lengths.
+        """
         if not isinstance(other, Series):
             raise ValueError(
                 f"Only Series can be operated with another Series (found {type(other)})"
@@ -244,91 +1140,265 @@ class Series[ST]:  # ST is a Generic Type for Series type
                 f"Series must have numeric data types to do math operations (found {self.data_type} and {other.data_type})"
             )
 
+        if numpy_backend.is_used(self, other):
+            result = numpy_backend.math(self, other, operation, force_float)
+            if result is not None:
+                return result
+
+        # cast to float if any of the data types is float
+        result_type = (
+            float
+            if self.data_type is float or other.data_type is float or force_float
+            else int
+        )
+        validity = combine_validity(self._validity, other._validity)
+        if validity is None:
+            # no None values, apply the operation without any checks
+            operands: tuple[Iterable, ...] = (self._value_list(), other._value_list())
+            if result_type is float:
+                operands = tuple(map(_as_floats, operands, (self, other)))
+            return Series._from_trusted(list(map(operation, *operands)), result_type, 0)
+
+        valids = validity.to_bytes01()
+        null_count = count_nulls(validity)
+
+        if result_type is float:
+            data_float: list[float | None] = []
+            for x, y, valid in zip(self._value_list(), other._value_list(), valids):
+                if not valid:
+                    data_float.append(None)
+                else:
+                    data_float.append(operation(float(x), float(y)))
+            return Series._from_trusted(data_float, float, null_count)
+
+        else:  # return int Series
+            data_int: list[int | None] = []
+            for x, y, valid in zip(self._value_list(), other._value_list(), valids):
+                if not valid:
+                    data_int.append(None)
+                else:
+                    data_int.append(operation(x, y))
+            return Series._from_trusted(data_int, int, null_count)
+
+    def _math_scalar_function(
+        self,
+        other: int | float,
+        operation: Callable,
+        force_float: bool = False,
+        reflected: bool = False,
+    ) -> "Series":
+        """
+        Helper function to perform an arithmetic operation between every element and a
+        scalar.
+
+        Parameters
+        ----------
+        other : int or float
+            The scalar value to operate with.
+        operation : Callable
+            The arithmetic operation to perform.
+        force_float : bool, optional
+            Whether to cast results to float, by default False.
+        reflected : bool, optional
+            Whether the scalar is the left operand, by default False.
+
+        Returns
+        -------
+        Series
+            The result of the operation.
+
+        Raises
+        ------
+        ValueError
+            If the Series or the scalar is not numeric.
+        """
+        # bool is a subclass of int but not a numeric data type of a Series
+        if self.data_type not in {int, float} or type(other) not in {int, float}:
+            raise ValueError(
+                f"Series must have numeric data types to do math operations (found {self.data_type} and {type(other)})"
+            )
+
+        if numpy_backend.is_used(self):
+            result = numpy_backend.math_scalar(
+                self, other, operation, force_float, reflected
+            )
+            if result is not None:
+                return result
+
         # cast to float if any of the data types is float
-        if self.data_type is float or other.data_type is float or force_float:
+        result_type = (
+            float
+            if self.data_type is float or type(other) is float or force_float
+            else int
+        )
+        if self._validity is None:
+            # no None values, apply the operation without any checks
+            values: Iterable = self._value_list()
+            scalar: int | float = other
+            if result_type is float:
+                values, scalar = _as_floats(values, self), float(other)
+            scalars = repeat(scalar)
+            operands = (scalars, values) if reflected else (values, scalars)
+            return Series._from_trusted(list(map(operation, *operands)), result_type, 0)
+
+        valids = self._validity.to_bytes01()
+        null_count = self._null_count
+        scalars = repeat(other)
+        operands = (
+            (scalars, self._value_list())
+            if reflected
+            else (self._value_list(), scalars)
+        )
+
+        if result_type is float:
             data_float: list[float | None] = []
-            for x, y in zip(self.data, other.data):
-                if x is None or y is None:
+            for x, y, valid in zip(*operands, valids):
+                if not valid:
                     data_float.append(None)
                 else:
                     data_float.append(operation(float(x), float(y)))
-            return Series[float | None](data_float)
+            return Series._from_trusted(data_float, float, null_count)
 
         else:  # return int Series
             data_int: list[int | None] = []
-            for x, y in zip(self.data, other.data):
-                if x is None or y is None:
+            for x, y, valid in zip(*operands, valids):
+                if not valid:
                     data_int.append(None)
                 else:
                     data_int.append(operation(x, y))
-            return Series[int | None](data_int)
+            return Series._from_trusted(data_int, int, null_count)
 
-    def __add__(self, other: Self) -> Self:
+    def __add__(self, other: Self | int | float) -> "Series":
         """
         Performs element-wise addition with another Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to add.
+        other : Series or int or float
+            The Series or scalar to add.
+
+        Returns
+        -------
+        Series
+            The result of the addition.
+        """
+        return self._math_helper_function(other, operator.add)
+
+    def __radd__(self, other: int | float) -> "Series":
+        """
+        Performs element-wise addition with a scalar as the left operand.
+
+        Parameters
+        ----------
+        other : int or float
+            The scalar left operand.
 
         Returns
         -------
         Series
             The result of the addition.
         """
-        return self._math_helper_function(other, lambda x, y: x + y)
+        return self._math_helper_function(other, operator.add, reflected=True)
 
-    def __sub__(self, other: Self) -> Self:
+    def __sub__(self, other: Self | int | float) -> "Series":
         """
         Performs element-wise subtraction with another Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to subtract.
+        other : Series or int or float
+            The Series or scalar to subtract.
+
+        Returns
+        -------
+        Series
+            The result of the subtraction.
+        """
+        return self._math_helper_function(other, operator.sub)
+
+    def __rsub__(self, other: int | float) -> "Series":
+        """
+        Performs element-wise subtraction with a scalar as the left operand.
+
+        Parameters
+        ----------
+        other : int or float
+            The scalar left operand.
 
         Returns
         -------
         Series
             The result of the subtraction.
         """
-        return self._math_helper_function(other, lambda x, y: x - y)
+        return self._math_helper_function(other, operator.sub, reflected=True)
 
-    def __mul__(self, other: Self) -> Self:
+    def __mul__(self, other: Self | int | float) -> "Series":
         """
         Performs element-wise multiplication with another Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to multiply.
+        other : Series or int or float
+            The Series or scalar to multiply.
+
+        Returns
+        -------
+        Series
+            The result of the multiplication.
+        """
+        return self._math_helper_function(other, operator.mul)
+
+    def __rmul__(self, other: int | float) -> "Series":
+        """
+        Performs element-wise multiplication with a scalar as the left operand.
+
+        Parameters
+        ----------
+        other : int or float
+            The scalar left operand.
 
         Returns
         -------
         Series
             The result of the multiplication.
         """
-        return self._math_helper_function(other, lambda x, y: x * y)
+        return self._math_helper_function(other, operator.mul, reflected=True)
 
-    def __truediv__(self, other: Self) -> Self:
+    def __truediv__(self, other: Self | int | float) -> "Series":
         """
         Performs element-wise true division with another Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to divide.
+        other : Series or int or float
+            The Series or scalar to divide.
 
         Returns
         -------
         Series
             The result of the division.
         """
-        return self._math_helper_function(other, lambda x, y: x / y, force_float=True)
+        return self._math_helper_function(other, operator.truediv, force_float=True)
+
+    def __rtruediv__(self, other: int | float) -> "Series":
+        """
+        Performs element-wise true division with a scalar as the left operand.
+
+        Parameters
+        ----------
+        other : int or float
+            The scalar left operand.
+
+        Returns
+        -------
+        Series
+            The result of the true division.
+        """
+        return self._math_helper_function(
+            other, operator.truediv, force_float=True, reflected=True
+        )
 
-    def _eq_helper_function(self, other: Self, operation: Callable) -> Self:
-        # TODO: add support for numpy arrays for performance (thus for all comparison operations)
+    def _eq_helper_function(self, other: object, operation: Callable) -> "Series[bool]":
         """
         Helper function for element-wise comparison operations.
 
@@ -349,9 +1419,11 @@ class Series[ST]:  # ST is a Generic Type for Series type
         ValueError
             If the comparison is not valid for the data types or lengths.
         """
-        if isinstance(other, int) or isinstance(other, float):
-            # if other is a scalar, make it a Series and continue add operation
-            other = Series([other for _ in self.data])
+        if isinstance(other, Expr):
+            return NotImplemented  # evaluated lazily by the reflected operator of Expr
+        if isinstance(other, (int, float, str)):
+            # scalars are applied directly instead of being broadcast to a full Series
+            return self._eq_scalar_helper_function(other, operation)
         if not isinstance(other, Series):
             raise ValueError(
                 f"Only Series can be compared using equality operations (found {type(other)})"
@@ -360,98 +1432,186 @@ class Series[ST]:  # ST is a Generic Type for Series type
             raise ValueError(
                 f"Series must have the same length for equality operations (found {len(self)} and {len(other)})"
             )
-        if self.data_type not in {int, float} or other.data_type not in {int, float}:
+        numeric = {int, float}
+        if not (
+            {self.data_type, other.data_type} <= numeric
+            or self.data_type is other.data_type is str
+        ):
             raise ValueError(
-                f"Series must have numeric data types to be added (found {self.data_type} and {other.data_type})"
+                f"Series must both be numeric or both be of type str to be compared (found {self.data_type} and {other.data_type})"
+            )
+
+        if numpy_backend.is_used(self, other):
+            result = numpy_backend.compare(self, other, operation)
+            if result is not None:
+                return result
+
+        validity = combine_validity(self._validity, other._validity)
+        if validity is None:
+            # no None values, the results can be packed directly
+            return Series._from_storage(
+                bool,
+                Bitmap.from_bytes01(
+                    bytes(map(operation, self._value_list(), other._value_list()))
+                ),
+                None,
+                0,
             )
 
+        valids = validity.to_bytes01()
+        null_count = count_nulls(validity)
+
         data: list[bool | None] = []
-        for x, y in zip(self.data, other.data):
-            if x is None or y is None:
+        for x, y, valid in zip(self._value_list(), other._value_list(), valids):
+            if not valid:
                 data.append(None)
             else:
                 data.append(operation(x, y))
-        return Series[bool | None](data)
+        return Series._from_trusted(data, bool, null_count)
+
+    def _eq_scalar_helper_function(
+        self, other: int | float | str, operation: Callable
+    ) -> "Series[bool]":
+        """
+        Helper function to compare every element with a scalar.
+
+        Parameters
+        ----------
+        other : int or float or str
+            The scalar to compare with, str Series are compared lexicographically with a
+            str.
+        operation : Callable
+            The comparison operation to perform.
+
+        Returns
+        -------
+        Series
+            A boolean Series representing the comparison results.
+
+        Raises
+        ------
+        ValueError
+            If the Series or the scalar is not numeric (or not both str).
+        """
+        if self.data_type is str and type(other) is str:
+            return self.str.compare(other, operation)
+        # bool is a subclass of int but not a numeric data type of a Series
+        if (
+            isinstance(other, str)
+            or self.data_type not in {int, float}
+            or type(other) not in {int, float}
+        ):
+            raise ValueError(
+                f"Series must have numeric data types to be added (found {self.data_type} and {type(other)})"
+            )
 
-    def __lt__(self, other: Self) -> Self:
+        if numpy_backend.is_used(self):
+            result = numpy_backend.compare_scalar(self, other, operation)
+            if result is not None:
+                return result
+
+        if self._validity is None:
+            # no None values, the results can be packed directly
+            return Series._from_storage(
+                bool,
+                Bitmap.from_bytes01(
+                    bytes(map(operation, self._value_list(), repeat(other)))
+                ),
+                None,
+                0,
+            )
+
+        valids = self._validity.to_bytes01()
+        null_count = self._null_count
+
+        data: list[bool | None] = []
+        for x, valid in zip(self._value_list(), valids):
+            if not valid:
+                data.append(None)
+            else:
+                data.append(operation(x, other))
+        return Series._from_trusted(data, bool, null_count)
+
+    def __lt__(self, other: Self | int | float | str) -> "Series[bool]":
         """
         Perform element-wise less-than comparison between two Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to compare with.
+        other : Series or int or float
+            The Series or scalar to compare with.
 
         Returns
         -------
         Series
             A Series of boolean values representing the comparison results.
         """
-        return self._eq_helper_function(other, lambda x, y: x < y)
+        return self._eq_helper_function(other, operator.lt)
 
-    def __le__(self, other: Self) -> Self:
+    def __le__(self, other: Self | int | float | str) -> "Series[bool]":
         """
         Perform element-wise less-than-or-equal-to comparison between two Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to compare with.
+        other : Series or int or float
+            The Series or scalar to compare with.
 
         Returns
         -------
         Series
             A Series of boolean values representing the comparison results.
         """
-        return self._eq_helper_function(other, lambda x, y: x <= y)
+        return self._eq_helper_function(other, operator.le)
 
-    def __gt__(self, other: Self) -> Self:
+    def __gt__(self, other: Self | int | float | str) -> "Series[bool]":
         """
         Perform element-wise greater-than comparison between two Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to compare with.
+        other : Series or int or float
+            The Series or scalar to compare with.
 
         Returns
         -------
         Series
             A Series of boolean values representing the comparison results.
         """
-        return self._eq_helper_function(other, lambda x, y: x > y)
+        return self._eq_helper_function(other, operator.gt)
 
-    def __ge__(self, other: Self) -> Self:
+    def __ge__(self, other: Self | int | float | str) -> "Series[bool]":
         """
         Perform element-wise greater-than-or-equal-to comparison between two Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to compare with.
+        other : Series or int or float
+            The Series or scalar to compare with.
 
         Returns
         -------
         Series
             A Series of boolean values representing the comparison results.
         """
-        return self._eq_helper_function(other, lambda x, y: x >= y)
+        return self._eq_helper_function(other, operator.ge)
 
-    def __ne__(self, other: object) -> Self:
+    def __ne__(self, other: object) -> "Series[bool]":  # type: ignore[override]
         """
         Perform element-wise not-equal-to comparison between the Series and another object.
 
         Parameters
         ----------
         other : object
-            The object to compare with. Must be a Series for element-wise comparison.
+            The object to compare with. Must be a Series or a number for element-wise
+            comparison.
 
         Returns
         -------
         Series
             A Series of boolean values representing the comparison results.
         """
-        return self._eq_helper_function(other, lambda x, y: x != y)
+        return self._eq_helper_function(other, operator.ne)
 
     def __repr__(self) -> str:
         """
@@ -465,18 +1625,22 @@ class Series[ST]:  # ST is a Generic Type for Series type
         return f"Series({self.data})"
 
     def _element_wise_bool_helper_function(
-        self, other: Self, operation: Callable
-    ) -> Self:
-        # TODO: add support for numpy arrays for performance
+        self, other: Self | bool, operation: Callable, reflected: bool = False
+    ) -> "Series[bool]":
         """
         Perform element-wise boolean operation between two Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to perform the operation with.
+        other : Series or bool
+            The Series or scalar to perform the operation with.
         operation : Callable
-            A function defining the boolean operation to apply.
+            A function defining the boolean operation to apply. It is called once with
+            the packed value and validity bits of both Series as Python ints (`x, vx, y,
+            vy`) and returns the value and validity bits of the result. Value bits of
+            None elements are always cleared.
+        reflected : bool, optional
+            Whether `other` is the left operand, by default False.
 
         Returns
         -------
@@ -486,71 +1650,166 @@ class Series[ST]:  # ST is a Generic Type for Series type
         Raises
         ------
         ValueError
-            If `other` is not a Series, the lengths differ, or the data types are not boolean.
+            If `other` is not a Series or bool, the lengths differ, or the data types
+            are not boolean.
         """
-        if not isinstance(other, Series):
+        if isinstance(other, Expr):
+            return NotImplemented  # evaluated lazily by the reflected operator of Expr
+        if isinstance(other, bool):
+            if self.data_type is not bool:
+                raise ValueError(
+                    f"Series must have the same data type bool, currently: {self.data_type} and {type(other)}"
+                )
+        elif not isinstance(other, Series):
             raise ValueError(
-                f"Only Series can be compared using equality operations (found {type(other)})"
+                f"Only Series or bools can be used in boolean operations (found {type(other)})"
             )
-        if len(self) != len(other):
+        elif len(self) != len(other):
             raise ValueError(
                 f"Series must have the same length to do boolean operations (found {len(self)} and {len(other)})"
             )
-        if self.data_type is not bool or other.data_type is not bool:
+        elif self.data_type is not bool or other.data_type is not bool:
             raise ValueError(
                 f"Series must have the same data type bool, currently: {self.data_type} and {other.data_type}"
             )
-        return Series([operation(x, y) for x, y in zip(self.data, other.data)])
-
-    def __and__(self, other: Self) -> Self:
+        # all elements are processed at once as bits of a Python int
+        full = (1 << len(self)) - 1
+        x = self._bits().to_int()
+        vx = full if self._validity is None else self._validity.to_int()
+        if isinstance(other, bool):
+            # a scalar is broadcast as a bitmap with all bits set or cleared
+            y, vy = (full if other else 0), full
+        else:
+            y = other._bits().to_int()
+            vy = full if other._validity is None else other._validity.to_int()
+        if reflected:
+            x, vx, y, vy = y, vy, x, vx
+        if not self.has_nulls and (isinstance(other, bool) or not other.has_nulls):
+            # all three operations are valid everywhere if both operands are
+            values, _ = operation(x, full, y, full)
+            return Series._from_storage(
+                bool, Bitmap.from_int(values & full, len(self)), None, 0
+            )
+        values, validity = operation(x, vx, y, vy)
+        validity &= full
+        return Series._from_storage(
+            bool,
+            Bitmap.from_int(values & validity, len(self)),
+            None if validity == full else Bitmap.from_int(validity, len(self)),
+        )
+
+    def __and__(self, other: Self | bool) -> "Series[bool]":
         """
         Perform element-wise logical AND operation between two Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to perform the operation with.
+        other : Series or bool
+            The Series or scalar to perform the operation with.
+
+        Returns
+        -------
+        Series
+            A Series of boolean values representing the logical AND results. Same as
+            Python's `x and y`: None if x is None, False if x is False, y otherwise.
+        """
+        return self._element_wise_bool_helper_function(
+            other, lambda x, vx, y, vy: (x & y, vx & (~x | vy))
+        )
+
+    def __rand__(self, other: bool) -> "Series[bool]":
+        """
+        Perform element-wise logical AND operation with a bool as the left operand.
+
+        Parameters
+        ----------
+        other : bool
+            The scalar left operand.
 
         Returns
         -------
         Series
             A Series of boolean values representing the logical AND results.
         """
-        return self._element_wise_bool_helper_function(other, lambda x, y: x and y)
+        return self._element_wise_bool_helper_function(
+            other, lambda x, vx, y, vy: (x & y, vx & (~x | vy)), reflected=True
+        )
 
-    def __or__(self, other: Self) -> Self:
+    def __or__(self, other: Self | bool) -> "Series[bool]":
         """
         Perform element-wise logical OR operation between two Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to perform the operation with.
+        other : Series or bool
+            The Series or scalar to perform the operation with.
+
+        Returns
+        -------
+        Series
+            A Series of boolean values representing the logical OR results.
+            Same as Python's `x or y`: True if x is True, y otherwise.
+        """
+        return self._element_wise_bool_helper_function(
+            other, lambda x, vx, y, vy: (x | y, x | vy)
+        )
+
+    def __ror__(self, other: bool) -> "Series[bool]":
+        """
+        Perform element-wise logical OR operation with a bool as the left operand.
+
+        Parameters
+        ----------
+        other : bool
+            The scalar left operand.
 
         Returns
         -------
         Series
             A Series of boolean values representing the logical OR results.
         """
-        return self._element_wise_bool_helper_function(other, lambda x, y: x or y)
+        return self._element_wise_bool_helper_function(
+            other, lambda x, vx, y, vy: (x | y, x | vy), reflected=True
+        )
 
-    def __xor__(self, other: Self) -> Self:
+    def __xor__(self, other: Self | bool) -> "Series[bool]":
         """
         Perform element-wise logical XOR operation between two Series.
 
         Parameters
         ----------
-        other : Series
-            The Series to perform the operation with.
+        other : Series or bool
+            The Series or scalar to perform the operation with.
+
+        Returns
+        -------
+        Series
+            A Series of boolean values representing the logical XOR results.
+            None if x or y is None.
+        """
+        return self._element_wise_bool_helper_function(
+            other, lambda x, vx, y, vy: (x ^ y, vx & vy)
+        )
+
+    def __rxor__(self, other: bool) -> "Series[bool]":
+        """
+        Perform element-wise logical XOR operation with a bool as the left operand.
+
+        Parameters
+        ----------
+        other : bool
+            The scalar left operand.
 
         Returns
         -------
         Series
             A Series of boolean values representing the logical XOR results.
         """
-        return self._element_wise_bool_helper_function(other, lambda x, y: x ^ y)
+        return self._element_wise_bool_helper_function(
+            other, lambda x, vx, y, vy: (x ^ y, vx & vy), reflected=True
+        )
 
-    def __invert__(self) -> Self:
+    def __invert__(self) -> "Series[bool]":
         """
         Perform element-wise logical NOT operation on the Series.
 
@@ -568,4 +1827,369 @@ class Series[ST]:  # ST is a Generic Type for Series type
             raise ValueError(
                 f"Series must have the data type bool to be inverted (found: {self.data_type})"
             )
-        return Series([not x if x is not None else None for x in self.data])
+        bits = self._bits()
+        if self._validity is None:
+            return Series._from_storage(bool, ~bits, None, 0)
+        return Series._from_storage(
+            bool, ~bits & self._validity, self._validity, self._null_count
+        )
+
+    def _aggregate[R](self, accumulator: aggregations.Accumulator[R]) -> R:
+        """
+        Reduces the valid values of the Series with an accumulator.
+
+        Parameters
+        ----------
+        accumulator : Accumulator
+            The new accumulator of the aggregation.
+
+        Returns
+        -------
+        R
+            The result of the aggregation.
+        """
+        values = self._values
+        if isinstance(values, (Bitmap, DictionaryArray, StringArray)):
+            values = values.to_list()
+        return aggregations.aggregate(accumulator, values, self._validity)
+
+    def _check_numeric(self, aggregation: str) -> None:
+        """
+        Validates that the Series can be used in a numeric aggregation.
+
+        Parameters
+        ----------
+        aggregation : str
+            The name of the aggregation for the error message.
+
+        Raises
+        ------
+        ValueError
+            If the data type is not int or float.
+        """
+        if self.data_type not in {int, float}:
+            raise ValueError(
+                f"Series must have a numeric data type for {aggregation} (found: {self.data_type})"
+            )
+
+    def count(self) -> int:
+        """
+        Counts the values that are not None.
+
+        Returns
+        -------
+        int
+            The number of values that are not None.
+        """
+        return len(self) - self.null_count
+
+    def sum(self) -> int | float:
+        """
+        Sums the values, skipping None.
+
+        int values are summed exactly, float values with compensated summation.
+
+        Returns
+        -------
+        int or float
+            The sum (0 if there are no values), of the data type of the Series.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not numeric.
+        """
+        self._check_numeric("sum")
+        return self._aggregate(aggregations.Sum(self.data_type))
+
+    def mean(self) -> float | None:
+        """
+        Computes the arithmetic mean of the values, skipping None.
+
+        Returns
+        -------
+        float or None
+            The mean, None if there are no values.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not numeric.
+        """
+        self._check_numeric("mean")
+        return self._aggregate(aggregations.Mean(self.data_type))
+
+    def var(self, ddof: int = 1) -> float | None:
+        """
+        Computes the variance of the values, skipping None.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom, the divisor is `count - ddof`. By default 1
+            (sample variance).
+
+        Returns
+        -------
+        float or None
+            The variance, None if there are not more than `ddof` values.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not numeric.
+        """
+        self._check_numeric("var")
+        return self._aggregate(aggregations.Var(ddof))
+
+    def std(self, ddof: int = 1) -> float | None:
+        """
+        Computes the standard deviation of the values, skipping None.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom, the divisor is `count - ddof`. By default 1
+            (sample standard deviation).
+
+        Returns
+        -------
+        float or None
+            The standard deviation, None if there are not more than `ddof` values.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not numeric.
+        """
+        self._check_numeric("std")
+        return self._aggregate(aggregations.Std(ddof))
+
+    def min(self) -> ST | None:
+        """
+        Finds the smallest value, skipping None.
+
+        Strings are compared lexicographically, NaN is not skipped (the result is NaN).
+
+        Returns
+        -------
+        ST or None
+            The smallest value, None if there are no values.
+        """
+        if self.data_type is bool:
+            # False is the minimum as soon as there is a valid value that is not True
+            minimum = self._bits().count() == self.count()
+            return None if not self.count() else minimum  # type: ignore[return-value]
+        extreme: aggregations.Extreme[ST] = aggregations.Extreme(min)
+        return self._aggregate(extreme)
+
+    def max(self) -> ST | None:
+        """
+        Finds the largest value, skipping None.
+
+        Strings are compared lexicographically, NaN is not skipped (the result is NaN).
+
+        Returns
+        -------
+        ST or None
+            The largest value, None if there are no values.
+        """
+        if self.data_type is bool:
+            maximum = self._bits().count() > 0
+            return None if not self.count() else maximum  # type: ignore[return-value]
+        extreme: aggregations.Extreme[ST] = aggregations.Extreme(max)
+        return self._aggregate(extreme)
+
+    def any(self) -> bool:
+        """
+        Checks whether any value is True, skipping None.
+
+        Returns
+        -------
+        bool
+            True if at least one value is True.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not of type bool.
+        """
+        if self.data_type is not bool:
+            raise ValueError(
+                f"Series must have the data type bool for any (found: {self.data_type})"
+            )
+        # value bits of None elements are cleared
+        return self._bits().count() > 0
+
+    def all(self) -> bool:
+        """
+        Checks whether all values are True, skipping None.
+
+        Returns
+        -------
+        bool
+            True if no value is False (also if there are no values).
+
+        Raises
+        ------
+        ValueError
+            If the Series is not of type bool.
+        """
+        if self.data_type is not bool:
+            raise ValueError(
+                f"Series must have the data type bool for all (found: {self.data_type})"
+            )
+        return self._bits().count() == self.count()
+
+    def argsort(
+        self, ascending: bool = True, na_position: str = "last"
+    ) -> "Series[int]":
+        """
+        Computes the positions that stably sort the Series.
+
+        int and bool values are sorted with a radix sort (int only if numpy is
+        installed), float and str values with a stable comparison sort. NaN values are
+        placed after all other values.
+
+        Parameters
+        ----------
+        ascending : bool, optional
+            The sort direction, by default True.
+        na_position : str, optional
+            "last" or "first", where None values are placed. By default "last".
+
+        Returns
+        -------
+        Series[int]
+            The positions of the elements in sorted order.
+
+        Raises
+        ------
+        ValueError
+            If an argument is invalid.
+        """
+        return Series._from_storage(
+            int, self._sort_positions(ascending, na_position), None, 0
+        )
+
+    def _sort_positions(self, ascending: bool, na_position: str) -> array:
+        """
+        Computes the positions that stably sort the Series, see `argsort()`.
+
+        Returns
+        -------
+        array
+            The positions as `array('q')`.
+        """
+        if not isinstance(ascending, bool):
+            raise ValueError(f"ascending must be a bool (found: {ascending})")
+        sorting.check_sort_arguments(ascending, na_position, 1)
+        return sorting.argsort([self], [ascending], na_position)
+
+    def sort_values(
+        self, ascending: bool = True, na_position: str = "last"
+    ) -> "Series[ST]":
+        """
+        Sorts the Series stably, see `argsort()`.
+
+        Parameters
+        ----------
+        ascending : bool, optional
+            The sort direction, by default True.
+        na_position : str, optional
+            "last" or "first", where None values are placed. By default "last".
+
+        Returns
+        -------
+        Series[ST]
+            The sorted Series.
+
+        Raises
+        ------
+        ValueError
+            If an argument is invalid.
+        """
+        return self._take(self._sort_positions(ascending, na_position))
+
+    # defined last, the name shadows the builtin str in the class body
+    @property
+    def str(self) -> StringMethods:
+        """
+        String functions of a str Series (contains, startswith, endswith, lower, upper,
+        len, slice).
+
+        Returns
+        -------
+        StringMethods
+            The string functions.
+
+        Raises
+        ------
+        ValueError
+            If the Series is not of type str.
+        """
+        return StringMethods(self)
+
+
+def _as_floats(values: Iterable, series: Series) -> Iterable[float]:
+    """
+    Casts the raw values of a numeric Series to float for an operation with a float
+    result.
+
+    Parameters
+    ----------
+    values : Iterable
+        The raw values of the Series.
+    series : Series
+        The Series the values belong to.
+
+    Returns
+    -------
+    Iterable[float]
+        The values as floats.
+    """
+    # the values of float Series are floats already
+    return values if series.data_type is float else map(float, values)
+
+
+def _in_operand_width(result: Series, *operands: Series) -> Series:
+    """
+    Stores the result of an arithmetic operation in the width of its widest operand.
+
+    The kernels compute with Python ints and doubles and store int results with 64 bits,
+    so narrow operands never wrap around: an int result is narrowed only as far as its
+    values fit, a float result is stored as float32 only if all operands are float32 and
+    no value overflows it.
+
+    Parameters
+    ----------
+    result : Series
+        The result with 64-bit (or object) values.
+    *operands : Series
+        The Series operands.
+
+    Returns
+    -------
+    Series
+        The result.
+    """
+    buffers = [series._values for series in operands]
+    numeric = [buffer for buffer in buffers if isinstance(buffer, (array, memoryview))]
+    if not isinstance(result._values, array) or len(numeric) < len(buffers):
+        return result  # ints that do not fit into 64 bits are involved
+    typecodes = set(map(typecode_of, numeric))
+    values: Numeric | None
+    if result.data_type is int:
+        if INT_TYPECODE in typecodes:
+            return result
+        widest = max(typecodes, key=list(INT_DTYPES.values()).index)
+        values = narrow_ints(result._values, widest)
+    elif typecodes == {FLOAT_DTYPES["float32"]}:
+        values = float32_or_none(result._values)
+        if values is None:
+            return result
+    else:
+        return result
+    return Series._from_storage(
+        result.data_type, values, result._validity, result._null_count
+    )
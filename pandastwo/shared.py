@@ -0,0 +1,170 @@
+"""
+DataFrames in shared memory.
+
+A DataFrame is copied once into a `multiprocessing.shared_memory` segment in the binary
+format of `DataFrame.save()` (the JSON header at the start of the segment describes
+where the buffers of every column are). Other processes attach the segment by name and
+create the columns on top of the shared buffers, without copying or parsing them (see
+`DataFrame.to_shared()` and `DataFrame.attach_shared()`).
+"""
+
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+from pandastwo.dataframe import DataFrame
+from pandastwo.io import _from_view, _layout, _write_into
+
+# the DataFrames of the segments attached by the workers of a `ParallelExecutor`, by
+# segment name
+_ATTACHED: dict[str, DataFrame] = {}
+# the names of the segments created by this process (or the process it was forked from)
+_CREATED: set[str] = set()
+
+
+class _Segment(shared_memory.SharedMemory):
+    """
+    A shared memory segment that can be dropped while Series still use its buffers.
+    """
+
+    # the buffer is None only after `close()`, the descriptor and name are private
+    # attributes of `SharedMemory`
+    buf: memoryview
+    _fd: int
+    _name: str
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except BufferError:
+            # columns still use the buffers, the mapping (which has its own descriptor)
+            # is released together with the last of them
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+
+
+def create(df: DataFrame, name: str | None = None) -> shared_memory.SharedMemory:
+    """
+    Copies a DataFrame into a new shared memory segment.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The DataFrame.
+    name : str, optional
+        The name of the segment, by default a unique name is generated.
+
+    Returns
+    -------
+    SharedMemory
+        The segment. The caller is responsible for unlinking it.
+
+    Raises
+    ------
+    FileExistsError
+        If a segment with the name already exists.
+    """
+    layout = _layout(df)
+    segment = _Segment(name, create=True, size=max(layout[2], 1))
+    _write_into(layout, segment.buf)
+    _CREATED.add(segment.name)
+    return segment
+
+
+def attach(name: str, track: bool = False) -> DataFrame:
+    """
+    Creates a DataFrame on top of the buffers of a shared memory segment created by
+    `create()`.
+
+    Parameters
+    ----------
+    name : str
+        The name of the segment.
+    track : bool, optional
+        Whether the resource tracker of this process may unlink the segment when the
+        process exits, by default False. Only processes that share the resource tracker
+        of the creating process (e.g. the workers of a `ParallelExecutor`) can leave it
+        tracked.
+
+    Returns
+    -------
+    DataFrame
+        The DataFrame on top of the shared buffers (read only), it keeps the segment
+        mapped.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the segment does not exist.
+    ValueError
+        If the segment does not contain a DataFrame.
+    """
+    if sys.version_info >= (3, 13):
+        segment = _Segment(name, track=track)
+    else:
+        segment = _Segment(name)
+        if not track and segment.name not in _CREATED:
+            # attaching registers the segment like creating it, it would be unlinked
+            # when this process exits
+            resource_tracker.unregister(segment._name, "shared_memory")
+    return _from_view(segment.buf.toreadonly(), f"shared memory {name}")
+
+
+def _attached(name: str) -> DataFrame:
+    """
+    Returns the DataFrame of a shared memory segment attached once per worker process.
+
+    Parameters
+    ----------
+    name : str
+        The name of the segment.
+
+    Returns
+    -------
+    DataFrame
+        The DataFrame on top of the shared buffers (read only).
+    """
+    if name not in _ATTACHED:
+        _ATTACHED[name] = attach(name, track=True)
+    return _ATTACHED[name]
+
+
+class SharedRows:
+    """
+    A range of rows of a DataFrame in shared memory, a partition that can be sent to
+    other processes.
+
+    Parameters
+    ----------
+    name : str
+        The name of the segment.
+    start : int
+        The first row.
+    stop : int
+        The end of the range (excluded).
+    """
+
+    __slots__ = ("name", "start", "stop")
+
+    def __init__(self, name: str, start: int, stop: int) -> None:
+        self.name = name
+        self.start = start
+        self.stop = stop
+
+    def load(self) -> DataFrame:
+        """
+        Creates the rows from the shared buffers.
+
+        Returns
+        -------
+        DataFrame
+            The rows, numeric columns without copying.
+        """
+        df = _attached(self.name)
+        return DataFrame._from_trusted(
+            {name: series[self.start : self.stop] for name, series in df.data.items()}
+        )
+
+    def __repr__(self) -> str:
+        return f"SharedRows({self.name!r}, {self.start}, {self.stop})"
@@ -0,0 +1,201 @@
+"""
+Stable sorting of Series and DataFrames.
+
+Sorting produces a permutation of row positions, the sorted Series and DataFrames are
+created from it with a take. Several keys are sorted from the last key to the first one,
+every key stably sorts the permutation of the keys after it (like an LSD radix sort over
+the keys), so equal values keep the order given by the later keys.
+
+bool keys are sorted by partitioning the positions of False and True values. int keys
+are sorted with an LSD radix sort if numpy is available (see
+`numpy_backend.sort_positions`), pure Python uses the stable sort of `sorted()`, which
+is faster than any radix sort written in Python.
+"""
+
+import math
+from array import array
+from itertools import compress
+from typing import TYPE_CHECKING
+
+from pandastwo import numpy_backend
+from pandastwo.buffers import INT_TYPECODE, DictionaryArray
+
+if TYPE_CHECKING:
+    from pandastwo.series import Series
+
+# swaps 0x00 and 0x01 bytes of selectors
+_INVERT = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
+def _split(positions: array, selectors: bytes) -> tuple[array, array]:
+    """
+    Splits positions into the selected and the other ones, keeping their order.
+
+    Parameters
+    ----------
+    positions : array
+        The positions.
+    selectors : bytes
+        One 0x00 or 0x01 byte per position.
+
+    Returns
+    -------
+    tuple[array, array]
+        The selected positions and the other positions.
+    """
+    return (
+        array(INT_TYPECODE, compress(positions, selectors)),
+        array(INT_TYPECODE, compress(positions, selectors.translate(_INVERT))),
+    )
+
+
+def sort_valid(series: "Series", positions: array, ascending: bool) -> array:
+    """
+    Stably sorts positions of values that are not None.
+
+    Parameters
+    ----------
+    series : Series
+        The Series whose values are sorted.
+    positions : array
+        The positions to sort as `array('q')`.
+    ascending : bool
+        The sort direction.
+
+    Returns
+    -------
+    array
+        The sorted positions. NaN values are placed after all other values in both
+        directions.
+    """
+    if not positions:
+        return positions
+    values = series._values
+    if series.data_type is bool:
+        bits = series._bits().to_bytes01()
+        true, false = _split(positions, bytes(map(bits.__getitem__, positions)))
+        return false + true if ascending else true + false
+    if numpy_backend.is_used(series):
+        return numpy_backend.sort_positions(series, positions, ascending)
+
+    if isinstance(values, DictionaryArray):
+        # sort the distinct values once and the rows by the rank of their value
+        ranks = array(INT_TYPECODE, [0]) * len(values.dictionary)
+        for rank, code in enumerate(
+            sorted(range(len(values.dictionary)), key=values.dictionary.__getitem__)
+        ):
+            ranks[code] = rank
+        values = array(INT_TYPECODE, map(ranks.__getitem__, values.codes))
+        # positions of None values are not sorted, their code -1 picks any rank
+
+    nan = array(INT_TYPECODE)
+    if series.data_type is float:
+        nan, positions = _split(
+            positions, bytes(map(math.isnan, map(values.__getitem__, positions)))
+        )
+    # reverse keeps the order of equal values, the sort stays stable
+    ordered = sorted(positions, key=values.__getitem__, reverse=not ascending)
+    return array(INT_TYPECODE, ordered) + nan
+
+
+def sort_positions(
+    series: "Series",
+    positions: array,
+    ascending: bool = True,
+    na_position: str = "last",
+) -> array:
+    """
+    Stably sorts positions by the values of a Series.
+
+    Parameters
+    ----------
+    series : Series
+        The Series whose values are sorted.
+    positions : array
+        The positions to sort as `array('q')`.
+    ascending : bool, optional
+        The sort direction, by default True.
+    na_position : str, optional
+        "last" or "first", where the positions of None values are placed. By default
+        "last".
+
+    Returns
+    -------
+    array
+        The sorted positions.
+    """
+    if series._validity is None:
+        return sort_valid(series, positions, ascending)
+    valids = series._validity.to_bytes01()
+    valid, null = _split(positions, bytes(map(valids.__getitem__, positions)))
+    valid = sort_valid(series, valid, ascending)
+    return null + valid if na_position == "first" else valid + null
+
+
+def argsort(
+    keys: list["Series"], ascending: list[bool], na_position: str = "last"
+) -> array:
+    """
+    Computes the permutation that stably sorts rows by several keys.
+
+    Parameters
+    ----------
+    keys : list[Series]
+        The key columns, all of the same length, the first key is the most significant
+        one.
+    ascending : list[bool]
+        The sort direction of every key.
+    na_position : str, optional
+        "last" or "first", where None values are placed. By default "last".
+
+    Returns
+    -------
+    array
+        The positions of the rows in sorted order as `array('q')`.
+    """
+    positions = array(INT_TYPECODE, range(len(keys[0])))
+    for key, key_ascending in zip(reversed(keys), reversed(ascending)):
+        positions = sort_positions(key, positions, key_ascending, na_position)
+    return positions
+
+
+def check_sort_arguments(
+    ascending: object, na_position: object, count: int
+) -> list[bool]:
+    """
+    Validates the arguments of a sort.
+
+    Parameters
+    ----------
+    ascending : object
+        A bool or a list of one bool per key.
+    na_position : object
+        Must be "last" or "first".
+    count : int
+        The number of keys.
+
+    Returns
+    -------
+    list[bool]
+        The sort direction of every key.
+
+    Raises
+    ------
+    ValueError
+        If an argument is invalid.
+    """
+    if na_position not in {"last", "first"}:
+        raise ValueError(
+            f"na_position must be 'last' or 'first' (found: {na_position})"
+        )
+    if isinstance(ascending, bool):
+        return [ascending] * count
+    if (
+        not isinstance(ascending, list)
+        or len(ascending) != count
+        or not all(isinstance(x, bool) for x in ascending)
+    ):
+        raise ValueError(
+            f"ascending must be a bool or a list of one bool per key (found: {ascending})"
+        )
+    return ascending
@@ -0,0 +1,329 @@
+"""
+String functions of str Series, available as `Series.str`.
+
+Every function is applied to the valid values only, None values stay None. For
+dictionary encoded Series the function is computed once per distinct value and the
+results are gathered by code, for Series stored in a UTF-8 buffer the prefix, suffix and
+substring tests work on the encoded bytes without decoding them.
+"""
+
+import operator
+from array import array
+from collections.abc import Callable
+from itertools import repeat
+from typing import TYPE_CHECKING
+
+from pandastwo.buffers import (
+    CODE_TYPECODE,
+    INT_TYPECODE,
+    Bitmap,
+    DictionaryArray,
+    StringArray,
+)
+
+if TYPE_CHECKING:
+    from pandastwo.series import Series
+
+# the result of the None values in the buffers of the result types
+_PLACEHOLDERS: dict[type, object] = {bool: False, int: 0, str: None}
+
+
+class StringMethods:
+    """
+    String functions of a str Series, created by `Series.str`.
+
+    Parameters
+    ----------
+    series : Series
+        The str Series.
+
+    Raises
+    ------
+    ValueError
+        If the Series is not of type str.
+    """
+
+    def __init__(self, series: "Series") -> None:
+        if series.data_type is not str:
+            raise ValueError(
+                f"string functions need a Series of type str (found: {series.data_type})"
+            )
+        self._series = series
+
+    def _apply(
+        self,
+        function: Callable,
+        data_type: type,
+        *args: object,
+        bytes_function: Callable | None = None,
+    ) -> "Series":
+        """
+        Applies a function to every valid value.
+
+        Parameters
+        ----------
+        function : Callable
+            Called with the value and the arguments.
+        data_type : type
+            The type of the results (bool, int or str).
+        *args : object
+            The arguments passed to the function after the value.
+        bytes_function : Callable, optional
+            Gives the same result as `function` when called with the UTF-8 encoded value
+            and the encoded str arguments, used for Series stored in a UTF-8 buffer.
+
+        Returns
+        -------
+        Series
+            The results, None where the value is None.
+        """
+        from pandastwo.series import Series
+
+        series = self._series
+        values = series._values
+        placeholder = _PLACEHOLDERS[data_type]
+        if isinstance(values, DictionaryArray):
+            # once per distinct value, code -1 of None refers to the appended
+            # placeholder
+            mapped = list(map(function, values.dictionary, *map(repeat, args)))
+            if data_type is str:
+                # distinct values can map to the same result, the results are encoded
+                # again
+                encoded = DictionaryArray.from_values(mapped)
+                translation = encoded.codes + array(CODE_TYPECODE, [-1])
+                codes = array(CODE_TYPECODE, map(translation.__getitem__, values.codes))
+                return Series._from_storage(
+                    str, encoded.with_codes(codes), series._validity, series.null_count
+                )
+            results = list(map((mapped + [placeholder]).__getitem__, values.codes))
+        else:
+            if isinstance(values, StringArray) and bytes_function is not None:
+                function = bytes_function
+                args = tuple(
+                    arg.encode() if isinstance(arg, str) else arg for arg in args
+                )
+                values = list(values._slices(values.offsets, values.offsets[1:]))
+            else:
+                values = series._value_list()
+            if series._validity is None:
+                results = list(map(function, values, *map(repeat, args)))
+            else:
+                results = [
+                    function(value, *args) if valid else placeholder
+                    for value, valid in zip(values, series._validity.to_bytes01())
+                ]
+
+        return self._result(results, data_type)
+
+    def _result(self, results: list | bytes, data_type: type) -> "Series":
+        """
+        Creates the result Series with the validity of the Series.
+
+        Parameters
+        ----------
+        results : list or bytes
+            The result of every value, None for the None values of str results.
+            Boolean results as a list of bools or as bytes of 0x00 and 0x01.
+        data_type : type
+            The type of the results (bool, int or str).
+
+        Returns
+        -------
+        Series
+            The results, None where the value is None.
+        """
+        from pandastwo.series import Series
+
+        series = self._series
+        buffer: Bitmap | array
+        if isinstance(results, bytes):
+            # bool results
+            buffer = Bitmap.from_bytes01(results)
+        elif data_type is str:
+            return Series._from_trusted(results, str, series.null_count)
+        elif data_type is bool:
+            buffer = Bitmap.from_bools(results)
+        else:
+            buffer = array(INT_TYPECODE, results)
+        if isinstance(buffer, Bitmap) and series._validity is not None:
+            # the value bits of None values must be cleared
+            buffer &= series._validity
+        return Series._from_storage(
+            data_type, buffer, series._validity, series.null_count
+        )
+
+    @staticmethod
+    def _check_pattern(pattern: object) -> None:
+        """
+        Validates the pattern of a search.
+
+        Parameters
+        ----------
+        pattern : object
+            The pattern.
+
+        Raises
+        ------
+        ValueError
+            If the pattern is not a str.
+        """
+        if not isinstance(pattern, str):
+            raise ValueError(f"pattern must be a string (found: {type(pattern)})")
+
+    def contains(self, pattern: str) -> "Series[bool]":
+        """
+        Tests if every value contains a substring.
+
+        Parameters
+        ----------
+        pattern : str
+            The substring (not a regular expression).
+
+        Returns
+        -------
+        Series[bool]
+            True where the value contains the substring, None where the value is None.
+
+        Raises
+        ------
+        ValueError
+            If the pattern is not a str.
+        """
+        self._check_pattern(pattern)
+        if isinstance(self._series._values, StringArray):
+            return self._result(self._series._values.contains(pattern.encode()), bool)
+        return self._apply(operator.contains, bool, pattern)
+
+    def startswith(self, pattern: str) -> "Series[bool]":
+        """
+        Tests if every value starts with a prefix.
+
+        Parameters
+        ----------
+        pattern : str
+            The prefix.
+
+        Returns
+        -------
+        Series[bool]
+            True where the value starts with the prefix, None where the value is None.
+
+        Raises
+        ------
+        ValueError
+            If the pattern is not a str.
+        """
+        self._check_pattern(pattern)
+        return self._apply(
+            str.startswith, bool, pattern, bytes_function=bytes.startswith
+        )
+
+    def endswith(self, pattern: str) -> "Series[bool]":
+        """
+        Tests if every value ends with a suffix.
+
+        Parameters
+        ----------
+        pattern : str
+            The suffix.
+
+        Returns
+        -------
+        Series[bool]
+            True where the value ends with the suffix, None where the value is None.
+
+        Raises
+        ------
+        ValueError
+            If the pattern is not a str.
+        """
+        self._check_pattern(pattern)
+        return self._apply(str.endswith, bool, pattern, bytes_function=bytes.endswith)
+
+    def lower(self) -> "Series[str]":
+        """
+        Converts every value to lowercase.
+
+        Returns
+        -------
+        Series[str]
+            The lowercase values, None where the value is None.
+        """
+        return self._apply(str.lower, str)
+
+    def upper(self) -> "Series[str]":
+        """
+        Converts every value to uppercase.
+
+        Returns
+        -------
+        Series[str]
+            The uppercase values, None where the value is None.
+        """
+        return self._apply(str.upper, str)
+
+    def len(self) -> "Series[int]":
+        """
+        Counts the characters of every value.
+
+        Returns
+        -------
+        Series[int]
+            The number of characters, None where the value is None.
+        """
+        return self._apply(len, int)
+
+    def slice(
+        self, start: int | None = None, stop: int | None = None, step: int | None = None
+    ) -> "Series[str]":
+        """
+        Extracts characters from every value like slicing a str.
+
+        Parameters
+        ----------
+        start : int, optional
+            The first character, by default the start of the value.
+        stop : int, optional
+            The end of the range (excluded), by default the end of the value.
+        step : int, optional
+            The step between characters, by default 1.
+
+        Returns
+        -------
+        Series[str]
+            The extracted characters, None where the value is None.
+
+        Raises
+        ------
+        ValueError
+            If an argument is not an int or None, or the step is 0.
+        """
+        for argument in (start, stop, step):
+            if argument is not None and type(argument) is not int:
+                raise ValueError(
+                    f"slice arguments must be integers or None (found: {type(argument)})"
+                )
+        if step == 0:
+            raise ValueError("slice step must not be zero")
+        return self._apply(operator.getitem, str, slice(start, stop, step))
+
+    def compare(self, other: str, operation: Callable) -> "Series[bool]":
+        """
+        Compares every value lexicographically with a str, used by the comparison
+        operators of Series.
+
+        Parameters
+        ----------
+        other : str
+            The str to compare with.
+        operation : Callable
+            The comparison operation (e.g. `operator.lt`).
+
+        Returns
+        -------
+        Series[bool]
+            The comparison results, None where the value is None.
+        """
+        # UTF-8 keeps the order of the code points, so the encoded values compare like
+        # the strings
+        return self._apply(operation, bool, other, bytes_function=operation)
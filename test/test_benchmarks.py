@@ -0,0 +1,58 @@
+import json
+
+from benchmarks import run
+from benchmarks.cases import CASES
+
+
+def test_benchmark_cases_run():
+    results = run.run(list(CASES), [10], [False, True], repeat=1, min_time=0)
+    assert len(results["results"]) == 2 * len(CASES)
+    assert all(seconds > 0 for seconds in results["results"].values())
+
+
+def test_benchmark_comparison(tmp_path):
+    baseline = {"results": {"series.add/10/nulls": 1.0, "series.sub/10/nulls": 1.0}}
+    results = {
+        "results": {
+            "series.add/10/nulls": 1.05,
+            "series.sub/10/nulls": 1.2,
+            "new/10/nulls": 9.0,
+        }
+    }
+    assert run.compare(results, baseline, 0.1) == [("series.sub/10/nulls", 1.0, 1.2)]
+
+    file = tmp_path / "baseline.json"
+    assert (
+        run.main(
+            [
+                "--sizes",
+                "10",
+                "--filter",
+                "series.invert",
+                "--repeat",
+                "1",
+                "--min-time",
+                "0",
+                "--output",
+                str(file),
+            ]
+        )
+        == 0
+    )
+    assert set(json.loads(file.read_text())["results"]) == {
+        "series.invert/10/no-nulls",
+        "series.invert/10/nulls",
+    }
+    arguments = [
+        "--sizes",
+        "10",
+        "--filter",
+        "series.invert",
+        "--repeat",
+        "1",
+        "--min-time",
+        "0",
+        "--baseline",
+        str(file),
+    ]
+    assert run.main([*arguments, "--threshold", "1000"]) == 0
@@ -1,7 +1,9 @@
+import random
+
+import pytest
+
 from pandastwo.dataframe import DataFrame
 from pandastwo.series import Series
-import pytest
-import random
 
 
 def test_sanity_check():
@@ -262,3 +264,354 @@ def test_large_dataframe_access_non_bool_list():
     non_bool_list = Series([random.randint(0, 100) for _ in range(10000)])
     with pytest.raises(ValueError):
         df[non_bool_list]
+
+
+@pytest.mark.parametrize("fraction", [0.01, 0.2, 0.5, 0.9])
+def test_dataframe_access_bool_list_sparse_and_dense(fraction):
+    """checks whether filtering gives the same result for sparse (take) and dense (compress) selections"""
+    n = 3000
+    data = {
+        "int": Series([random.choice([1, 2, None]) for _ in range(n)]),
+        "float": Series([random.choice([1.5, None]) for _ in range(n)]),
+        "bool": Series([random.choice([True, False, None]) for _ in range(n)]),
+        "str": Series([random.choice(["a", "b", None]) for _ in range(n)]),
+    }
+    mask = [random.random() < fraction if i % 7 else None for i in range(n)]
+    df = DataFrame(data)[Series(mask)]
+    for key, series in data.items():
+        expected = [value for value, flag in zip(series.data, mask) if flag is True]
+        assert df[key].data == expected
+        assert series[Series(mask)].data == expected
+
+
+def test_dataframe_view():
+    """checks whether a view of a dataframe equals the filtered dataframe"""
+    df = DataFrame({"a": Series([1, 2, None, 4]), "b": Series(["w", None, "y", "z"])})
+    mask = df["a"] > 1
+    view = df.view(mask)
+    assert view["a"]._view[1] is view["b"]._view[1]
+    assert view["a"][1] == 4
+    assert view["b"].data == df[mask]["b"].data
+    assert view.copy()["a"].data == [2, 4]
+    assert df.view(df["a"].lazy() > 1)["b"].data == [None, "z"]
+    with pytest.raises(ValueError):
+        df.view("a")
+    with pytest.raises(ValueError):
+        df.view(Series([True]))
+
+
+def test_groupby_agg():
+    df = DataFrame(
+        {
+            "store": Series(["b", "a", "b", None, "a"]),
+            "sales": Series([1, 2, None, 4, 5]),
+            "price": Series([1.5, 2.5, 3.5, None, 0.5]),
+        }
+    )
+    result = df.groupby("store").agg({"sales": ["sum", "count"], "price": "mean"})
+    assert list(result.data) == ["store", "sales_sum", "sales_count", "price"]
+    assert result["store"].data == ["b", "a", None]
+    assert result["sales_sum"].data == [1, 7, 4]
+    assert result["sales_count"].data == [1, 2, 1]
+    assert result["price"].data == [2.5, 1.5, None]
+    assert result["price"].data_type is float
+
+
+def test_groupby_multiple_keys():
+    df = DataFrame(
+        {
+            "a": Series([1, 1, 2, 1]),
+            "b": Series([True, False, True, True]),
+            "c": Series(["x", "y", "z", "w"]),
+        }
+    )
+    result = df.groupby(["a", "b"]).agg({"c": ["min", "max"]})
+    assert result["a"].data == [1, 1, 2]
+    assert result["b"].data == [True, False, True]
+    assert result["c_min"].data == ["w", "y", "z"]
+    assert result["c_max"].data == ["x", "y", "z"]
+
+
+def test_groupby_nan_keys():
+    nan = float("nan")
+    df = DataFrame(
+        {
+            "a": Series([nan, float("nan"), 1.0, None, nan]),
+            "b": Series([1, 2, 3, 4, 5]),
+        }
+    )
+    result = df.groupby("a").agg({"b": "sum"})
+    first, *rest = result["a"].data
+    assert first != first and rest == [1.0, None]
+    assert result["b"].data == [8, 3, 4]
+    assert len(df.groupby(["a", "b"])) == 5
+
+
+def test_groupby_exceptions():
+    df = DataFrame({"a": Series([1, 2]), "b": Series(["x", "y"])})
+    with pytest.raises(KeyError):
+        df.groupby("c")
+    with pytest.raises(ValueError):
+        df.groupby([])
+    with pytest.raises(ValueError):
+        df.groupby("a").agg({"b": "sum"})
+    with pytest.raises(ValueError):
+        df.groupby("a").agg({"b": "median"})
+    with pytest.raises(ValueError):
+        df.groupby("a").agg({"a": "max"})
+    with pytest.raises(KeyError):
+        df.groupby("a").agg({"c": "max"})
+
+
+def test_large_groupby():
+    """checks the aggregations of many groups against the aggregations of the filtered Series"""
+    n = 20000
+    keys = [random.randrange(300) for _ in range(n)]
+    values = [random.choice([random.uniform(-10, 10), None]) for _ in range(n)]
+    df = DataFrame({"k": Series(keys), "v": Series(values)})
+    aggregations = ["count", "sum", "mean", "min", "max", "var", "std"]
+    result = df.groupby("k").agg({"v": aggregations})
+    assert len(result["k"]) == len(set(keys))
+    for i, key in enumerate(result["k"].data[:20]):
+        group = df["v"][df["k"] == key]
+        for name in aggregations:
+            expected = getattr(group, name)()
+            assert result[f"v_{name}"][i] == pytest.approx(expected)
+
+
+def test_merge_inner_and_left():
+    sales = DataFrame(
+        {"sku": Series(["a", "b", "c", None, "a"]), "n": Series([1, 2, 3, 4, 5])}
+    )
+    products = DataFrame(
+        {
+            "sku": Series(["a", "c", "d", None]),
+            "price": Series([1.5, None, 3.0, 4.0]),
+            "n": Series([9, 8, 7, 6]),
+        }
+    )
+    inner = sales.merge(products, on="sku")
+    assert list(inner.data) == ["sku", "n_x", "price", "n_y"]
+    assert inner["sku"].data == ["a", "c", "a"]
+    assert inner["n_x"].data == [1, 3, 5]
+    assert inner["price"].data == [1.5, None, 1.5]
+    left = sales.merge(products, on="sku", how="left")
+    assert left["sku"].data == ["a", "b", "c", None, "a"]
+    assert left["price"].data == [1.5, None, None, None, 1.5]
+    assert left["n_y"].data == [9, None, 8, None, 9]
+    # the smaller side is used to build the hash table, the rows stay in the order of
+    # the left side
+    assert products.merge(sales, on="sku")["n_y"].data == [1, 5, 3]
+
+
+def test_merge_duplicate_and_multiple_keys():
+    left = DataFrame(
+        {
+            "a": Series([1, 1, 2, 3]),
+            "b": Series([True, False, True, None]),
+            "x": Series(["p", "q", "r", "s"]),
+        }
+    )
+    right = DataFrame(
+        {
+            "a": Series([1, 1, 2, 3]),
+            "b": Series([True, True, False, None]),
+            "y": Series([10, 20, 30, 40]),
+        }
+    )
+    inner = left.merge(right, on=["a", "b"])
+    assert inner["x"].data == ["p", "p"]
+    assert inner["y"].data == [10, 20]
+    result = left.merge(right, on=["a", "b"], how="left")
+    assert result["x"].data == ["p", "p", "q", "r", "s"]
+    assert result["y"].data == [10, 20, None, None, None]
+    assert right.merge(left, on="a")["x"].data == ["p", "q", "p", "q", "r", "s"]
+
+
+def test_merge_exceptions():
+    df = DataFrame({"a": Series([1, 2]), "b": Series(["x", "y"])})
+    other = DataFrame({"a": Series([1.0, 2.0]), "b": Series(["x", "z"])})
+    with pytest.raises(ValueError):
+        df.merge(other, on="a")
+    with pytest.raises(ValueError):
+        df.merge(other, on="b", how="outer")
+    with pytest.raises(ValueError):
+        df.merge({"b": Series(["x"])}, on="b")
+    with pytest.raises(KeyError):
+        df.merge(other, on="c")
+    # a suffixed overlapping column must not replace another left column
+    left = DataFrame(
+        {"k": Series([1, 2]), "a": Series([10, 20]), "a_x": Series([100, 200])}
+    )
+    right = DataFrame({"k": Series([1, 2]), "a": Series([5, 6])})
+    for how in ["inner", "left"]:
+        with pytest.raises(ValueError, match="duplicate result column a_x"):
+            left.merge(right, on="k", how=how)
+    reordered = DataFrame({"a_x": Series([100, 200]), **left.data})
+    with pytest.raises(ValueError, match="duplicate result column a_x"):
+        reordered.merge(right, on="k")
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_large_merge(how):
+    n = 5000
+    left = DataFrame(
+        {
+            "k": Series(
+                [random.choice([random.randrange(300), None]) for _ in range(n)]
+            ),
+            "v": Series([random.random() for _ in range(n)]),
+        }
+    )
+    keys = list(range(0, 400, 2)) * 2
+    right = DataFrame({"k": Series(keys), "w": Series(list(range(len(keys))))})
+    result = left.merge(right, on="k", how=how)
+    expected = []
+    for k, v in zip(left["k"].data, left["v"].data):
+        matches = [
+            w for key, w in zip(keys, range(len(keys))) if k is not None and key == k
+        ]
+        if not matches and how == "left":
+            matches = [None]
+        expected.extend((k, v, w) for w in matches)
+    assert list(zip(result["k"].data, result["v"].data, result["w"].data)) == expected
+
+
+def test_dataframe_sort_values():
+    df = DataFrame(
+        {
+            "a": Series([1, 2, None, 2, 1]),
+            "b": Series(["x", "y", "z", "w", None]),
+            "c": Series([0.5, 1.5, 2.5, 3.5, 4.5]),
+        }
+    )
+    result = df.sort_values(["a", "b"], ascending=[False, True])
+    assert result["a"].data == [2, 2, 1, 1, None]
+    assert result["b"].data == ["w", "y", "x", None, "z"]
+    assert result["c"].data == [3.5, 1.5, 0.5, 4.5, 2.5]
+    assert df.sort_values("a", na_position="first")["c"].data == [
+        2.5,
+        0.5,
+        4.5,
+        1.5,
+        3.5,
+    ]
+    with pytest.raises(KeyError):
+        df.sort_values("d")
+    with pytest.raises(ValueError):
+        df.sort_values(["a", "b"], ascending=[True])
+
+
+def test_large_dataframe_sort_values():
+    n = 3000
+    rows = [
+        (random.randrange(20), random.choice([1.5, 2.5, None]), i) for i in range(n)
+    ]
+    df = DataFrame(
+        {
+            "a": Series([row[0] for row in rows]),
+            "b": Series([row[1] for row in rows]),
+            "i": Series([row[2] for row in rows]),
+        }
+    )
+    result = df.sort_values(["a", "b"], ascending=[True, False])
+    expected = sorted(
+        rows, key=lambda row: (row[0], -(row[1] if row[1] is not None else -1e9))
+    )
+    assert result["i"].data == [row[2] for row in expected]
+
+
+def test_groupby_and_merge_on_dictionary_encoded_keys():
+    """checks that grouping and joining on the codes gives the same results as on plain strings"""
+    n = 3000
+    stores = [random.choice(["north", "south", "east", None]) for _ in range(n)]
+    plain = DataFrame({"store": Series(stores), "sales": Series(list(range(n)))})
+    encoded = DataFrame(
+        {"store": plain["store"].dictionary_encode(), "sales": plain["sales"]}
+    )
+    for df in (plain, encoded):
+        result = df.groupby("store").agg({"sales": "sum"})
+        assert result["store"].data == list(dict.fromkeys(stores))
+        assert result["sales"].data == [
+            sum(i for i, s in enumerate(stores) if s == key)
+            for key in result["store"].data
+        ]
+    regions = DataFrame(
+        {"store": Series(["north", "south", "west"]), "region": Series(["N", "S", "W"])}
+    )
+    for how in ("inner", "left"):
+        expected = plain.merge(regions, on="store", how=how)
+        result = encoded.merge(regions, on="store", how=how)
+        assert result["region"].data == expected["region"].data
+        assert result["sales"].data == expected["sales"].data
+
+
+def test_shared_memory():
+    import os
+    import subprocess
+    import sys
+    import uuid
+
+    df = DataFrame(
+        {
+            "id": Series([1, None, 3]),
+            "price": Series([7.0, 3.5, None]),
+            "taxed": Series([True, None, False]),
+            "SKU": Series(["X4E", None, "C7X"]).utf8_encode(),
+            "city": Series(["A", "B", "A"]).dictionary_encode(),
+        }
+    )
+    name = f"pandastwo-{uuid.uuid4().hex[:12]}"
+    segment = df.to_shared(name)
+    try:
+        attached = DataFrame.attach_shared(name)
+        for column, series in df.data.items():
+            assert attached[column].data == series.data
+        assert memoryview(attached["id"]).readonly
+        with pytest.raises(FileExistsError):
+            df.to_shared(name)
+
+        # another process attaches without copying and must not unlink the segment when
+        # it exits
+        code = (
+            "from pandastwo import DataFrame\n"
+            f"print(DataFrame.attach_shared({name!r})['price'].sum())"
+        )
+        env = {**os.environ, "PYTHONPATH": os.getcwd()}
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env
+        )
+        assert output.stdout.strip() == "10.5"
+        assert DataFrame.attach_shared(name)["SKU"].data == ["X4E", None, "C7X"]
+        # filtering and comparing str columns reads the shared bytes without a private
+        # copy
+        sku = attached["SKU"]
+        assert (sku == "C7X").data == [False, False, True]
+        assert sku.str.contains("4").data == [True, None, False]
+        assert attached[attached["id"] > 1]["SKU"].data == ["C7X"]
+        assert isinstance(sku._values.buffer, memoryview)
+    finally:
+        segment.close()
+        segment.unlink()
+    with pytest.raises(FileNotFoundError):
+        DataFrame.attach_shared(name)
+    with pytest.raises(ValueError):
+        df.to_shared("")
+
+
+def test_memory_usage_and_compact():
+    df = DataFrame(
+        {"id": Series([1, 2, None]), "name": Series([f"name {i}" for i in range(3)])}
+    )
+    usage = df.memory_usage(deep=True)
+    assert usage["column"].data == ["id", "name"]
+    assert usage["values"][0] == 24 and usage["validity"].data == [1, 0]
+    assert usage["objects"][0] == 0 and usage["objects"][1] > 0
+    assert [usage["total"][i] for i in range(2)] == [
+        usage["values"][i] + usage["validity"][i] + usage["objects"][i]
+        for i in range(2)
+    ]
+    compact = df.compact()
+    assert compact["id"].dtype == "int8" and compact["id"].data == [1, 2, None]
+    assert compact["name"].data == df["name"].data
+    assert compact.memory_usage(deep=True)["total"][1] < usage["total"][1]
@@ -0,0 +1,97 @@
+import pytest
+
+from pandastwo.dataframe import DataFrame
+from pandastwo.expressions import Expr
+from pandastwo.series import Series
+
+TEST_DATA = {
+    "SKU": Series(["X4E", "T3B", "F8D", "C7X", None]),
+    "price": Series([7.0, 3.5, 8.0, 6.0, None]),
+    "sales": Series([5, 3, 1, 10, 4]),
+    "taxed": Series([False, False, True, False, None]),
+}
+
+
+def test_lazy_returns_expression():
+    a = Series([1, 2, 3]).lazy()
+    assert isinstance(a, Expr)
+    assert isinstance(a + 1, Expr)
+    assert isinstance(a + Series([1, 2, 3]), Expr)
+    assert isinstance(Series([1, 2, 3]) + a, Expr)
+    assert isinstance(1 - a, Expr)
+    assert (a > 1).data_type is bool
+    assert (a / 2).data_type is float
+    assert len(a * 2) == 3
+
+
+def test_collect_matches_eager():
+    a = Series([1, 2, None, 4])
+    b = Series([0.5, None, 1.5, 2.0])
+    c = Series([True, None, False, True])
+    assert (a.lazy() + b).collect().data == (a + b).data
+    assert (a.lazy() / 2).collect().data == (a / 2).data
+    assert (10 - a.lazy()).collect().data == (10 - a).data
+    assert ((a.lazy() > 1) & c).collect().data == ((a > 1) & c).data
+    assert ((a.lazy() > 1) | c).collect().data == ((a > 1) | c).data
+    assert (~c.lazy() ^ c).collect().data == (~c ^ c).data
+    assert (a.lazy() == a).collect().data == (a == a).data
+    assert (b.lazy() != 1.5).collect().data == (b != 1.5).data
+
+
+def test_collect_data_types():
+    a = Series([1, 2, None])
+    assert (a.lazy() + 1).collect().data_type is int
+    assert (a.lazy() + 1.0).collect().data_type is float
+    assert (a.lazy() / 1).collect().data_type is float
+    assert (a.lazy() > 1).collect().data_type is bool
+
+
+def test_lazy_type_checking():
+    a = Series([1, 2, 3]).lazy()
+    with pytest.raises(ValueError):
+        a + Series(["a", "b", "c"])
+    with pytest.raises(ValueError):
+        a & Series([True, False, True])
+    with pytest.raises(ValueError):
+        ~a
+    with pytest.raises(ValueError):
+        a + Series([1, 2])
+    with pytest.raises(ValueError):
+        a == 1.0
+    with pytest.raises(ValueError):
+        a + [1, 2, 3]
+
+
+def test_lazy_division_by_zero():
+    a = Series([1, 2, None]).lazy()
+    with pytest.raises(ZeroDivisionError):
+        (a / Series([1, 0, 1])).collect()
+    # None values are not divided
+    assert (a / Series([1, 1, 0])).collect().data == [1.0, 2.0, None]
+
+
+def test_dataframe_filter_with_expression():
+    df = DataFrame(TEST_DATA)
+    price, sales, taxed = df["price"].lazy(), df["sales"].lazy(), df["taxed"].lazy()
+    result = df[(price + 5.0 > 10.0) & (sales > 3) & ~taxed]["SKU"]
+    expected = df[(df["price"] + 5.0 > 10.0) & (df["sales"] > 3) & ~df["taxed"]]["SKU"]
+    assert result.data == expected.data == ["X4E", "C7X"]
+
+
+def test_dataframe_filter_with_expression_exceptions():
+    df = DataFrame(TEST_DATA)
+    with pytest.raises(ValueError):
+        df[df["sales"].lazy() + 1]
+    with pytest.raises(ValueError):
+        df[Series([1, 2]).lazy() > 1]
+
+
+def test_large_expression_matches_eager():
+    a = Series([[1, None, -2, 3][i % 4] for i in range(5000)])
+    b = Series([[0.5, 2.0, None][i % 3] for i in range(5000)])
+    c = Series([[True, False, None][i % 3] for i in range(5000)])
+    expression = ((a.lazy() * b + 1 > 0.5) | c) & (a != 3)
+    eager = ((a * b + 1 > 0.5) | c) & (a != 3)
+    assert expression.collect().data == eager.data
+    df = DataFrame({"a": a, "b": b})
+    assert df[expression]["b"].data == df[eager]["b"].data
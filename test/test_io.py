@@ -0,0 +1,162 @@
+import pytest
+
+from pandastwo import read_csv
+from pandastwo.dataframe import DataFrame
+
+CSV = 'id,price,taxed,SKU,note\n1,7.0,False,X4E,\n2,3.5,true,"T,3B",\n,,,,\n4,6,False,C7X,\n'
+
+
+@pytest.fixture
+def path(tmp_path):
+    file = tmp_path / "data.csv"
+    file.write_text(CSV)
+    return file
+
+
+def test_read_csv(path):
+    df = read_csv(path)
+    assert isinstance(df, DataFrame)
+    assert df["id"].data == [1, 2, None, 4]
+    assert df["price"].data == [7.0, 3.5, None, 6.0]
+    assert df["taxed"].data == [False, True, None, False]
+    assert df["SKU"].data == ["X4E", "T,3B", None, "C7X"]
+    assert df["note"].data == [None] * 4
+    assert [df[name].data_type for name in df.data] == [int, float, bool, str, str]
+    assert df["id"].null_count == 1
+
+
+def test_read_csv_dtypes(path):
+    df = read_csv(path, dtypes={"id": float, "SKU": str, "note": int})
+    assert df["id"].data == [1.0, 2.0, None, 4.0]
+    assert df["note"].data_type is int
+    with pytest.raises(ValueError):
+        read_csv(path, dtypes={"SKU": int})
+    with pytest.raises(ValueError):
+        read_csv(path, dtypes={"missing": int})
+    with pytest.raises(ValueError):
+        read_csv(path, dtypes={"id": list})
+
+
+def test_read_csv_chunks(path):
+    chunks = read_csv(path, chunksize=3)
+    first, second = chunks
+    assert first["id"].data == [1, 2, None] and second["id"].data == [4]
+    assert second["price"].data_type is float
+    with pytest.raises(ValueError):
+        read_csv(path, chunksize=0)
+
+
+def test_read_csv_promotes_int_to_float(tmp_path, monkeypatch):
+    from pandastwo import io
+
+    monkeypatch.setattr(io, "BLOCK_SIZE", 2)
+    file = tmp_path / "data.csv"
+    file.write_text("x,y\n1,a\n2,b\n2.5,c\n")
+    assert read_csv(file)["x"].data == [1.0, 2.0, 2.5]
+    # the type of the first chunk cannot change
+    with pytest.raises(ValueError):
+        list(read_csv(file, chunksize=2))
+
+
+def test_read_csv_infers_only_plain_numbers(tmp_path, monkeypatch):
+    from pandastwo import io
+
+    file = tmp_path / "data.csv"
+    for field in ["1_000", " 1", "2 ", "nan", "inf", "-Infinity", "1e", "+"]:
+        file.write_text(f"x\n{field}\n3\n")
+        assert read_csv(file)["x"].data == [field, "3"]
+    file.write_text("x,y\n-1,+.5\n+2,1e-3\n,-2.\n")
+    df = read_csv(file)
+    assert df["x"].data == [-1, 2, None] and df["y"].data == [0.5, 0.001, -2.0]
+    # later blocks of inferred columns are checked as well
+    monkeypatch.setattr(io, "BLOCK_SIZE", 1)
+    for field in ["1_000", " 2.5", "nan"]:
+        file.write_text(f"x\n1\n{field}\n")
+        with pytest.raises(ValueError):
+            read_csv(file)
+    # columns whose type is given parse everything int and float accept
+    file.write_text("x\nnan\n1_000\n")
+    assert read_csv(file, dtypes={"x": float})["x"].data[1] == 1000.0
+
+
+def test_read_csv_invalid_files(tmp_path):
+    file = tmp_path / "data.csv"
+    file.write_text("a,b\n1,2\n3\n")
+    with pytest.raises(ValueError):
+        read_csv(file)
+    file.write_text("a,a\n1,2\n")
+    with pytest.raises(ValueError):
+        read_csv(file)
+    file.write_text("")
+    with pytest.raises(ValueError):
+        read_csv(file)
+
+
+def test_save_and_load(tmp_path):
+    from pandastwo import Series, load
+
+    data = {
+        "int": Series([1, None, -3, 4]),
+        "big": Series([2**70, None, 1, 2]),
+        "float": Series([1.5, None, float("inf"), -0.0]),
+        "int8": Series([1, None, -128, 127], dtype="int8"),
+        "float32": Series([0.5, None, 2.0, -1.0], dtype="float32"),
+        "bool": Series([True, None, False, True]),
+        "str": Series(["a", None, "日本", ""]),
+        "utf8": Series(["x", "y", None, "z"]).utf8_encode(),
+        "dictionary": Series(["a", "b", None, "a"]).dictionary_encode(),
+    }
+    file = tmp_path / "data.p2"
+    DataFrame(data).save(file)
+    for mmap in [True, False]:
+        df = load(file, mmap=mmap)
+        assert list(df.data) == list(data)
+        for name, series in data.items():
+            assert df[name].data_type is series.data_type
+            assert df[name].data == series.data
+            assert df[name].null_count == series.null_count
+            assert df[name].dtype == series.dtype
+        assert (df["int"] + 1).data == [2, None, -2, 5]
+        assert df[df["bool"]]["str"].data == ["a", ""]
+        assert (df["dictionary"] == "a").data == [True, False, False, True]
+    assert list(load(file, columns=["float", "int"]).data) == ["float", "int"]
+    with pytest.raises(KeyError):
+        load(file, columns=["missing"])
+    with pytest.raises(ValueError):
+        load(file, columns="int")
+
+
+def test_load_str_column_is_not_copied(tmp_path, monkeypatch):
+    from pandastwo import Series, load
+    from pandastwo.buffers import StringArray
+
+    # small chunks, so that searches cross chunk boundaries
+    monkeypatch.setattr(StringArray, "SEARCH_CHUNK", 7)
+    values = [f"item-{i % 13}" if i % 5 else None for i in range(200)]
+    values[42] = (
+        "rare"  # found by searching the buffer instead of comparing every value
+    )
+    file = tmp_path / "data.p2"
+    DataFrame(
+        {"name": Series(values).utf8_encode(), "id": Series(list(range(200)))}
+    ).save(file)
+    df = load(file)
+    name, expected = df["name"], Series(values)
+    assert (name == "item-7").data == (expected == "item-7").data
+    assert (name == "item-1").data == (expected == "item-1").data
+    assert (name == "rare").data == (expected == "rare").data
+    assert name.str.contains("m-1").data == expected.str.contains("m-1").data
+    assert (name == name).data == [True] * 200
+    assert df[df["id"] > 150]["name"].data == values[151:]
+    assert name[3] == values[3]
+    # the values are read from the mapped file, the buffer is never copied as a whole
+    assert isinstance(name._values.buffer, memoryview)
+
+
+def test_load_invalid_file(tmp_path):
+    from pandastwo import load
+
+    file = tmp_path / "data.p2"
+    file.write_bytes(b"no pandastwo file")
+    with pytest.raises(ValueError):
+        load(file)
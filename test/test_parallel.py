@@ -0,0 +1,60 @@
+import pytest
+
+from pandastwo import ParallelExecutor, PartitionedDataFrame
+from pandastwo.dataframe import DataFrame
+from pandastwo.series import Series
+
+
+@pytest.fixture
+def df():
+    return DataFrame(
+        {
+            "SKU": Series(["X4E", "T3B", "F8D", "C7X", None] * 20),
+            "price": Series([7.0, 3.5, 8.0, 6.0, None] * 20),
+            "sales": Series([5, 3, 1, 10, 2] * 20),
+            "taxed": Series([False, False, True, False, None] * 20),
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ParallelExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def test_parallel_query(df, executor):
+    pdf = executor.share(df, partitions=3)
+    assert pdf.npartitions == 3 and len(pdf) == 100
+    result = pdf[(pdf["price"] + 5.0 > 10.0) & (pdf["sales"] > 3) & ~pdf["taxed"]]
+    expected = df[(df["price"] + 5.0 > 10.0) & (df["sales"] > 3) & ~df["taxed"]]
+    assert result.to_dataframe()["SKU"].data == expected["SKU"].data
+    assert (pdf["price"] * pdf["sales"]).collect().data == (
+        df["price"] * df["sales"]
+    ).data
+    assert result.agg({"sales": "sum", "SKU": "count"})["sales"].data == [
+        expected["sales"].sum()
+    ]
+    for name in ["count", "sum", "mean", "var", "min", "max"]:
+        assert getattr(pdf["price"], name)() == pytest.approx(
+            getattr(df["price"], name)()
+        )
+    assert pdf["taxed"].any() and not pdf["taxed"].all()
+    with pytest.raises(ValueError):
+        pdf["SKU"].sum()
+
+
+def test_parallel_partitions_on_disk(df, executor, tmp_path):
+    pdf = (
+        PartitionedDataFrame.from_dataframe(df, 30)
+        .save(tmp_path / "parts")
+        .parallel(executor)
+    )
+    filtered = pdf[pdf["sales"] > 2]
+    assert filtered["sales"].sum() == 360
+    assert filtered.parallel(None)["sales"].sum() == 360
+    assert [len(part["sales"]) for part in filtered.partitions()] == [18, 18, 18, 6]
+    with pytest.raises(ValueError):
+        executor.share(df, partitions=0)
+    with pytest.raises(ValueError):
+        ParallelExecutor(max_workers=0)
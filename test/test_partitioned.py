@@ -0,0 +1,66 @@
+import pytest
+
+from pandastwo import PartitionedDataFrame
+from pandastwo.dataframe import DataFrame
+from pandastwo.series import Series
+
+
+@pytest.fixture
+def df():
+    return DataFrame(
+        {
+            "SKU": Series(["X4E", "T3B", "F8D", "C7X", None]),
+            "price": Series([7.0, 3.5, 8.0, 6.0, None]),
+            "sales": Series([5, 3, 1, 10, 2]),
+            "taxed": Series([False, False, True, False, None]),
+        }
+    )
+
+
+def test_partitioned_query(df):
+    pdf = PartitionedDataFrame.from_dataframe(df, 2)
+    assert pdf.npartitions == 3 and len(pdf) == 5
+    result = pdf[(pdf["price"] + 5.0 > 10.0) & (pdf["sales"] > 3) & ~pdf["taxed"]]
+    assert result.to_dataframe()["SKU"].data == ["X4E", "C7X"]
+    assert [len(part["SKU"]) for part in result.partitions()] == [1, 1, 0]
+    revenue = pdf.with_column("revenue", pdf["price"] * pdf["sales"])
+    assert revenue["revenue"].collect().data == [35.0, 10.5, 8.0, 60.0, None]
+    assert (10 - pdf["sales"]).collect().data == [5, 7, 9, 0, 8]
+    with pytest.raises(ValueError):
+        pdf["sales"] + result["sales"]
+    with pytest.raises(ValueError):
+        pdf[0]
+
+
+def test_partitioned_aggregations(df):
+    pdf = PartitionedDataFrame.from_dataframe(df, 2)
+    for name in ["count", "sum", "mean", "var", "std", "min", "max"]:
+        assert getattr(pdf["price"], name)() == pytest.approx(
+            getattr(df["price"], name)()
+        )
+    assert pdf["SKU"].min() == "C7X" and pdf["taxed"].max() is True
+    assert pdf["taxed"].any() and not pdf["taxed"].all()
+    result = pdf.agg({"sales": ["sum", "max"], "price": "mean"})
+    assert result["sales_sum"].data == [21] and result["sales_max"].data == [10]
+    assert result["price"].data == [6.125]
+    empty = pdf[pdf["sales"] > 100]
+    assert empty["price"].mean() is None and empty["sales"].sum() == 0
+    with pytest.raises(ValueError):
+        pdf["SKU"].sum()
+    with pytest.raises(ValueError):
+        pdf.agg({"sales": "median"})
+
+
+def test_partitions_on_disk(df, tmp_path):
+    pdf = PartitionedDataFrame.from_dataframe(df, 2).save(tmp_path / "parts")
+    assert pdf.npartitions == 3
+    filtered = pdf[pdf["sales"] > 2].save(tmp_path / "filtered")
+    assert filtered.to_dataframe()["SKU"].data == ["X4E", "T3B", "C7X"]
+
+    file = tmp_path / "data.csv"
+    file.write_text("id,price\n1,7.0\n2,\n3,8.5\n4,1.0\n5,2.0\n")
+    pdf = PartitionedDataFrame.from_csv(file, tmp_path / "csv", chunksize=2)
+    assert pdf.npartitions == 3
+    assert pdf["price"].sum() == 18.5 and pdf["price"].count() == 4
+    with pytest.raises(ValueError):
+        PartitionedDataFrame([])
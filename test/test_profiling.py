@@ -0,0 +1,93 @@
+import pandastwo
+from pandastwo.dataframe import DataFrame
+from pandastwo.series import Series
+
+
+def test_profile():
+    df = DataFrame(
+        {
+            "SKU": Series(["X4E", "T3B", "F8D", "C7X"]),
+            "price": Series([7.0, 3.5, 8.0, None]),
+            "sales": Series([5, 3, 1, 10]),
+            "taxed": Series([False, False, True, False]),
+        }
+    )
+    original = Series.__add__
+    events = []
+    with pandastwo.profile(callback=lambda *event: events.append(event)) as profile:
+        assert Series.__add__ is not original
+        result = df[(df["price"] + 5.0 > 10.0) & (df["sales"] > 3) & ~df["taxed"]][
+            "SKU"
+        ]
+        assert result.data == ["X4E"]
+        df["SKU"].str.lower()
+        df["sales"].sum()
+    assert Series.__add__ is original
+
+    operations = profile.operations
+    for name in [
+        "Series.__add__",
+        "Series.__gt__",
+        "Series.__and__",
+        "Series.__invert__",
+        "DataFrame.__getitem__[mask]",
+    ]:
+        assert name in operations
+    assert operations["Series.__and__"].count == 2
+    assert operations["Series.__add__"].rows == 4
+    # float results: 4 doubles and a validity bitmap
+    assert operations["Series.__add__"].bytes == 33
+    assert (
+        operations["Series.str.lower"].count == 1
+        and operations["Series.sum"].bytes == 0
+    )
+    assert "Series.__eq__" not in operations
+    assert len(events) == sum(stats.count for stats in operations.values())
+    assert events[0][:2] == ("DataFrame.__getitem__[column]", 4) and events[0][2] >= 0
+    assert profile.summary().splitlines()[0].split() == [
+        "operation",
+        "calls",
+        "rows",
+        "seconds",
+        "bytes",
+    ]
+
+
+def test_nested_profiles():
+    series = Series([1, 2, 3])
+    with pandastwo.profile() as outer:
+        series + 1
+        with pandastwo.profile() as inner:
+            series * 2
+        series - 1
+    assert list(outer.operations) == [
+        "Series.__add__",
+        "Series.__mul__",
+        "Series.__sub__",
+    ]
+    assert list(inner.operations) == ["Series.__mul__"]
+    series + 1
+    assert outer.operations["Series.__add__"].count == 1
+
+
+def test_profile_counts_only_allocated_bytes():
+    df = DataFrame(
+        {
+            "price": Series([float(i) for i in range(5000)]),
+            "sales": Series([i % 7 for i in range(5000)]),
+        }
+    )
+    other = DataFrame({"sales": Series(list(range(7))), "name": Series(["a"] * 7)})
+    with pandastwo.profile() as profile:
+        df["price"]
+        df["sales"]
+        df.view(df["sales"] > 3)
+        df.merge(other, on="sales", how="left")
+    operations = profile.operations
+    # selecting columns and creating views allocates nothing
+    assert operations["DataFrame.__getitem__[column]"].bytes == 0
+    assert operations["DataFrame.view"].bytes == 0
+    # the left columns are kept as they are, only the name column is new
+    merged = df.merge(other, on="sales", how="left")
+    assert operations["DataFrame.merge"].bytes < 5000 * 16
+    assert merged["price"] is df["price"]
@@ -1,6 +1,7 @@
-from pandastwo.series import Series
 import pytest
 
+from pandastwo.series import Series
+
 
 def test_sanity_check():
     # this is a sanity check to make sure the test is working
@@ -562,3 +563,726 @@ def test_unallowed_datatype():
 
     # float inf is allowed -> might lead to errors though.
     # Is allowed for now, but should be discussed.
+
+
+def test_typed_storage():
+    from array import array
+
+    from pandastwo.buffers import Bitmap
+
+    a = Series([1, 2, None])
+    assert isinstance(a._values, array) and a._values.typecode == "q"
+    assert a._validity is not None and a._validity.to_list() == [True, True, False]
+
+    b = Series([1.0, None, 3.0])
+    assert isinstance(b._values, array) and b._values.typecode == "d"
+
+    c = Series([True, None, False, True])
+    assert isinstance(c._values, Bitmap)
+    assert c._values.to_list() == [True, False, False, True]
+
+    d = Series(["a", "b"])
+    assert d._validity is None
+
+
+def test_int_storage_larger_than_64_bit():
+    a = Series([2**70, 1, None])
+    assert a.data == [2**70, 1, None]
+    assert (a + Series([1, 1, 1])).data == [2**70 + 1, 2, None]
+
+
+def test_data_is_a_copy():
+    a = Series([1, 2, 3])
+    a.data.append(4)
+    assert a.data == [1, 2, 3]
+    assert len(a) == 3
+
+
+def test_bool_operations_with_none():
+    a = Series([True, True, True, False, False, False, None, None, None])
+    b = Series([True, False, None, True, False, None, True, False, None])
+    assert (a & b).data == [x and y for x, y in zip(a.data, b.data)]
+    assert (a | b).data == [x or y for x, y in zip(a.data, b.data)]
+    assert (a ^ b).data == [
+        None if x is None or y is None else x ^ y for x, y in zip(a.data, b.data)
+    ]
+    assert (a == b).data == [x == y for x, y in zip(a.data, b.data)]
+
+
+def test_bool_operations_large():
+    values = [[True, False, None][i % 3] for i in range(1000)]
+    a = Series(values)
+    b = Series(values[::-1])
+    assert (~a).data == [None if x is None else not x for x in values]
+    assert (a & b).data == [x and y for x, y in zip(values, values[::-1])]
+
+
+def test_filter_without_match():
+    a = Series([1, 2, 3])
+    b = a[Series([False, None, False])]
+    assert len(b) == 0
+    assert b.data == []
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ([1, 2, None, 4] * 500, [3, None, 1, 0] * 500),
+        ([1.5, None, -2.0, 0.5] * 500, [2, 3, None, 1] * 500),
+        ([2**62, 1, None, 3] * 500, [2**62, 2, 3, None] * 500),
+        ([2**53 + 1, 1, None, 3] * 500, [float(2**53), 1.0, 2.0, None] * 500),
+    ],
+)
+def test_numpy_backend_matches_python(a, b):
+    """checks whether the numpy kernels give exactly the same results as the python kernels"""
+    import operator
+
+    from pandastwo import numpy_backend
+
+    pytest.importorskip("numpy")
+
+    def evaluate(operation, enabled):
+        numpy_backend.ENABLED = enabled
+        try:
+            return operation(Series(a), Series(b)).data
+        except (ValueError, ZeroDivisionError) as e:
+            return type(e)
+        finally:
+            numpy_backend.ENABLED = True
+
+    operations = [
+        operator.add,
+        operator.sub,
+        operator.mul,
+        operator.truediv,
+        operator.eq,
+        operator.lt,
+        operator.le,
+        operator.gt,
+        operator.ge,
+        operator.ne,
+        lambda x, y: x[Series([True, False, None, True] * 500)],
+    ]
+    for operation in operations:
+        assert evaluate(operation, True) == evaluate(operation, False)
+
+
+def test_scalar_operations():
+    a = Series([1, 2, None])
+    assert (a + 1).data == [2, 3, None]
+    assert (a + 1).data_type is int
+    assert (a * 1.5).data == [1.5, 3.0, None]
+    assert (a * 1.5).data_type is float
+    assert (a / 2).data == [0.5, 1.0, None]
+    assert (a > 1).data == [False, True, None]
+    assert (a != 2.0).data == [True, False, None]
+
+
+def test_reflected_scalar_operations():
+    a = Series([1, 2, None])
+    assert (1 + a).data == [2, 3, None]
+    assert (10 - a).data == [9, 8, None]
+    assert (2.0 * a).data == [2.0, 4.0, None]
+    assert (4 / a).data == [4.0, 2.0, None]
+    assert (1 < a).data == [False, True, None]
+
+
+def test_scalar_operations_exceptions():
+    a = Series([1, 2, 3])
+    with pytest.raises(ValueError):
+        a + True
+    with pytest.raises(ValueError):
+        a + "a"
+    with pytest.raises(ValueError):
+        Series(["a", "b"]) + 1
+    with pytest.raises(ZeroDivisionError):
+        a / 0
+
+
+def test_equality_with_scalar():
+    a = Series(["a", "b", None])
+    assert (a == "a").data == [True, False, False]
+
+    b = Series([1.0, 2.0, None])
+    assert (b == 2.0).data == [False, True, False]
+    with pytest.raises(ValueError):
+        b == 2
+
+    c = Series([True, False, None])
+    assert (c == True).data == [True, False, False]  # noqa: E712
+    assert (c == False).data == [False, True, False]  # noqa: E712
+
+
+def test_boolean_operations_with_scalar():
+    a = Series([True, False, None])
+    assert (a & True).data == [True, False, None]
+    assert (a | False).data == [True, False, False]
+    assert (a ^ True).data == [False, True, None]
+    assert (True & a).data == [True, False, None]
+    assert (False | a).data == [True, False, None]
+    with pytest.raises(ValueError):
+        a & 1
+    with pytest.raises(ValueError):
+        Series([1, 2, 3]) & True
+
+
+def test_results_with_only_none():
+    """results produced by operations are not validated again and may consist of only None"""
+    a = Series([1, None])
+    b = Series([None, 2])
+    assert (a + b).data == [None, None]
+    assert (a + b).data_type is int
+    assert (a < b).data == [None, None]
+    assert (a < b).data_type is bool
+
+
+def test_operations_on_empty_series():
+    a = Series([1, 2])[Series([False, False])]
+    assert (a + 1).data == []
+    assert (a * a).data == []
+    assert (a > 1).data == []
+    assert (a == a).data == []
+
+
+def test_view():
+    """checks whether a view gives the same result as filtering and only creates its buffers when used"""
+    s = Series([1, None, 3, 4, None, 6])
+    mask = Series([True, True, False, True, None, False])
+    view = s.view(mask)
+    assert view._view is not None
+    assert len(view) == 3
+    assert [view[0], view[1], view[2]] == [1, None, 4]
+    with pytest.raises(IndexError):
+        view[3]
+    assert view._view is not None
+    assert view.data == s[mask].data
+    assert view._view is None
+    assert (s.view(mask) + 1).data == [2, None, 5]
+    assert s.view(mask).view(Series([False, True, True])).data == [None, 4]
+    with pytest.raises(ValueError):
+        s.view(Series([True]))
+    with pytest.raises(ValueError):
+        s.view([True] * 6)
+
+
+def test_copy():
+    """checks whether copies do not share mutable buffers"""
+    s = Series([1, 2, None])
+    copy = s.copy()
+    assert copy.data == s.data
+    assert copy._values is not s._values
+    view = s.view(Series([True, False, True]))
+    copy = view.copy()
+    assert copy._view is None and view._view is not None
+    assert copy.data == [1, None]
+
+
+def test_null_count():
+    """checks whether the number of None values is known after construction and operations"""
+    a = Series([1, None, 3, None])
+    b = Series([1, 2, 3, 4])
+    assert a.null_count == 2 and a.has_nulls
+    assert b.null_count == 0 and not b.has_nulls
+    assert (a + b).null_count == 2
+    assert (b * 2).null_count == 0
+    assert (a > 1).null_count == 2
+    assert (a == b).null_count == 0
+    assert (~(b > 2)).null_count == 0
+    assert ((a > 1) | True).null_count == 0
+    assert ((a > 1) & (b > 1)).null_count == 2
+    # filtering out all None values drops the validity bitmap
+    filtered = a[Series([True, False, True, False])]
+    assert filtered.null_count == 0 and filtered._validity is None
+    assert a.view(Series([True, True, False, False])).null_count == 1
+
+
+def test_operations_without_nulls():
+    """checks the operations on Series without None values (no checks for None)"""
+    a = Series([1, 2, 3])
+    b = Series([2.0, 2.0, 0.5])
+    assert (a + b).data == [3.0, 4.0, 3.5]
+    assert (a / a).data == [1.0, 1.0, 1.0]
+    assert (a - 1).data == [0, 1, 2]
+    assert (1.5 * a).data == [1.5, 3.0, 4.5]
+    assert (a < b).data == [True, False, False]
+    assert (a >= 2).data == [False, True, True]
+    assert ((a > 1) ^ (b > 1)).data == [True, False, True]
+
+
+def test_aggregations():
+    s = Series([1, None, 3, 4])
+    assert s.count() == 3
+    assert s.sum() == 8
+    assert s.mean() == 8 / 3
+    assert s.min() == 1
+    assert s.max() == 4
+    assert s.var() == pytest.approx(7 / 3)
+    assert s.std() == pytest.approx((7 / 3) ** 0.5)
+    assert s.var(ddof=0) == pytest.approx(14 / 9)
+    assert Series(["b", None, "a"]).min() == "a"
+    b = Series([True, None, False])
+    assert (b.min(), b.max(), b.any(), b.all()) == (False, True, True, False)
+    assert Series([True, None]).all()
+
+
+def test_aggregations_without_values():
+    s = Series([1, None])[Series([False, True])]
+    assert s.count() == 0
+    assert s.sum() == 0
+    assert s.mean() is None
+    assert s.min() is None
+    assert s.var() is None
+    assert Series([1.5]).var() is None
+    assert not Series([None, False]).any()
+    assert Series([None, True])[Series([True, False])].all()
+
+
+def test_aggregations_exceptions():
+    with pytest.raises(ValueError):
+        Series(["a"]).sum()
+    with pytest.raises(ValueError):
+        Series([True]).mean()
+    with pytest.raises(ValueError):
+        Series([1]).any()
+
+
+def test_large_aggregations():
+    """checks aggregations over many chunks against the statistics module"""
+    import math
+    import random
+    import statistics
+
+    data = [
+        random.choice([random.uniform(-1e6, 1e6), 0.1, None]) for _ in range(200_000)
+    ]
+    data[0] = 1e16
+    values = [x for x in data if x is not None]
+    s = Series(data)
+    assert s.sum() == pytest.approx(math.fsum(values), rel=1e-15)
+    assert s.mean() == pytest.approx(statistics.fmean(values), rel=1e-12)
+    assert s.var() == pytest.approx(statistics.variance(values), rel=1e-9)
+    assert s.min() == min(values)
+    assert s.max() == max(values)
+    ints = Series([random.randint(-(2**62), 2**62) for _ in range(100_000)])
+    assert ints.sum() == sum(ints.data)
+    assert math.isnan(Series([1.0, math.nan] * 70_000).max())
+
+
+@pytest.mark.parametrize("n", [10, 3000])
+def test_take_with_missing_positions(n):
+    """checks gathering by position, -1 gives None (used by joins)"""
+    import random
+    from array import array
+
+    positions = array("q", [random.choice([-1, random.randrange(n)]) for _ in range(n)])
+    for values in ([1, None, 2**40], [1.5, None], [True, False, None], ["a", None]):
+        data = [values[0]] + [random.choice(values) for _ in range(n - 1)]
+        s = Series(data)
+        taken = s._take(positions)
+        assert taken.data == [None if p == -1 else data[p] for p in positions]
+        assert taken.null_count == taken.data.count(None)
+
+
+def test_sort_values():
+    s = Series([3, None, 1, 2, 1])
+    assert s.argsort().data == [2, 4, 3, 0, 1]
+    assert s.sort_values().data == [1, 1, 2, 3, None]
+    assert s.sort_values(ascending=False, na_position="first").data == [
+        None,
+        3,
+        2,
+        1,
+        1,
+    ]
+    assert Series([1.0, float("nan"), None, -1.0]).sort_values(False).data[:2] == [
+        1.0,
+        -1.0,
+    ]
+    assert Series([True, None, False, True]).sort_values().data == [
+        False,
+        True,
+        True,
+        None,
+    ]
+    assert Series(["b", "a", None, "c"]).sort_values(False).data == [
+        "c",
+        "b",
+        "a",
+        None,
+    ]
+    with pytest.raises(ValueError):
+        s.sort_values(na_position="middle")
+    with pytest.raises(ValueError):
+        s.sort_values(ascending=[True])
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [-(2**63), 2**63 - 1, 0, -1, 5],  # full int64 range, comparison sort
+        [-5, 1000, 7, 0],  # small range, radix sort
+        [2**70, -(2**70), 1],  # stored as objects
+        [0.5, -1.5, float("nan"), float("inf"), 2.0],
+        [True, False],
+        ["b", "a", "ab"],
+    ],
+)
+@pytest.mark.parametrize("ascending", [True, False])
+def test_large_sort_is_stable(values, ascending):
+    """checks the sort of every data type against sorted() (numpy and python kernels)"""
+    import math
+    import random
+
+    data = [values[0]] + [random.choice(values + [None]) for _ in range(3000)]
+    order = Series(data).argsort(ascending).data
+    valid = [
+        i
+        for i, x in enumerate(data)
+        if x is not None and not (isinstance(x, float) and math.isnan(x))
+    ]
+    expected = sorted(valid, key=data.__getitem__, reverse=not ascending)
+    expected += [
+        i for i, x in enumerate(data) if isinstance(x, float) and math.isnan(x)
+    ]
+    expected += [i for i, x in enumerate(data) if x is None]
+    assert order == expected
+
+
+def test_dictionary_encoding():
+    """checks that dictionary encoded str Series behave like plain ones"""
+    from pandastwo.buffers import DictionaryArray
+
+    data = ["b", None, "a", "b", "c", None]
+    plain = Series(data)
+    encoded = plain.dictionary_encode()
+    assert isinstance(encoded._values, DictionaryArray)
+    assert not isinstance(plain._values, DictionaryArray)
+    assert encoded.data == data
+    assert [encoded[i] for i in range(len(data))] == data
+    assert (
+        (encoded == "b").data
+        == (plain == "b").data
+        == [True, False, False, True, False, False]
+    )
+    assert (encoded == "x").data == [False] * 6
+    assert (encoded == encoded).data == (plain == plain).data
+    other = Series(["c", None, "a", "x", "c", "a"]).dictionary_encode()
+    assert (encoded == other).data == (plain == Series(other.data)).data
+    assert (encoded == Series(other.data)).data == (encoded == other).data
+    mask = Series([True, True, False, True, False, True])
+    assert encoded[mask].data == plain[mask].data
+    assert isinstance(encoded[mask]._values, DictionaryArray)
+    assert encoded.sort_values().data == plain.sort_values().data
+    assert encoded.min() == "a" and encoded.max() == "c" and encoded.count() == 4
+    with pytest.raises(ValueError):
+        Series([1]).dictionary_encode()
+
+
+def test_dictionary_encoding_is_automatic():
+    import random
+
+    from pandastwo.buffers import DictionaryArray
+
+    low = Series([random.choice(["a", "b", None]) for _ in range(5000)] + ["a"])
+    high = Series([str(i) for i in range(5000)])
+    assert isinstance(low._values, DictionaryArray)
+    assert not isinstance(high._values, DictionaryArray)
+    assert low.data.count(None) == low.null_count
+
+
+def test_utf8_encoding():
+    """checks that str Series stored in a UTF-8 buffer behave like plain ones"""
+    from pandastwo.buffers import StringArray
+
+    data = ["ab", None, "", "b", "日本", "ab", None, "abc"]
+    plain = Series(data)
+    encoded = plain.utf8_encode()
+    assert isinstance(encoded._values, StringArray)
+    assert encoded.data == data
+    assert [encoded[i] for i in range(len(data))] == data
+    for value in ["ab", "b", "", "日本", "x"]:
+        assert (encoded == value).data == (plain == value).data
+    other = Series(["ab", None, None, "a", "日本", "", "c", "abc"])
+    assert (encoded == other.utf8_encode()).data == (plain == other).data
+    mask = Series([True, True, False, True, False, True, True, False])
+    assert encoded[mask].data == plain[mask].data
+    assert isinstance(encoded[mask]._values, StringArray)
+    assert encoded.dictionary_encode().data == data
+    assert encoded.sort_values().data == plain.sort_values().data
+    with pytest.raises(ValueError):
+        Series([1]).utf8_encode()
+
+
+def test_slicing():
+    data = [3, None, 1, 4, None, 5, 9]
+    indices = [
+        slice(None),
+        slice(2, 5),
+        slice(-3, None),
+        slice(5, 2),
+        slice(None, None, -2),
+        slice(1, 100, 3),
+    ]
+    for index in indices:
+        assert Series(data)[index].data == data[index]
+        assert (
+            Series([str(x) for x in data]).utf8_encode()[index].data
+            == [str(x) for x in data][index]
+        )
+        assert (
+            Series([x == 1 for x in data])[index].data == [x == 1 for x in data][index]
+        )
+    assert Series(data)[2:5].null_count == 1
+    assert not Series(data)[2:4].has_nulls
+
+
+def test_string_functions():
+    data = ["Apple", None, "banana", "", "Cherry", "apple"]
+    for series in [
+        Series(data),
+        Series(data).dictionary_encode(),
+        Series(data).utf8_encode(),
+    ]:
+        assert series.str.contains("an").data == [
+            False,
+            None,
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert series.str.contains("").data == [True, None, True, True, True, True]
+        assert series.str.startswith("a").data == [
+            False,
+            None,
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert series.str.endswith("y").data == [False, None, False, False, True, False]
+        assert series.str.lower().data == [
+            "apple",
+            None,
+            "banana",
+            "",
+            "cherry",
+            "apple",
+        ]
+        assert series.str.upper().data == [
+            "APPLE",
+            None,
+            "BANANA",
+            "",
+            "CHERRY",
+            "APPLE",
+        ]
+        assert series.str.len().data == [5, None, 6, 0, 6, 5]
+        assert series.str.slice(1, 3).data == ["pp", None, "an", "", "he", "pp"]
+        assert series.str.slice(step=-1).data == [
+            "elppA",
+            None,
+            "ananab",
+            "",
+            "yrrehC",
+            "elppa",
+        ]
+        assert series[series.str.contains("pp")].data == ["Apple", "apple"]
+    from pandastwo.buffers import DictionaryArray
+
+    # computed once per distinct value, "Apple" and "apple" share a code afterwards
+    lower = Series(data).dictionary_encode().str.lower()
+    assert isinstance(lower._values, DictionaryArray) and lower._values.dictionary == [
+        "apple",
+        "banana",
+        "",
+        "cherry",
+    ]
+    with pytest.raises(ValueError):
+        Series([1, 2]).str
+    with pytest.raises(ValueError):
+        Series(data).str.contains(1)
+    with pytest.raises(ValueError):
+        Series(data).str.slice(1.5)
+
+
+def test_string_comparisons():
+    data = ["b", None, "a", "ä", "B"]
+    for series in [
+        Series(data),
+        Series(data).dictionary_encode(),
+        Series(data).utf8_encode(),
+    ]:
+        assert (series < "b").data == [False, None, True, False, True]
+        assert (series > "b").data == [False, None, False, True, False]
+        assert (series >= "b").data == [True, None, False, True, False]
+        assert (series < Series(["c", "a", None, "a", "A"])).data == [
+            True,
+            None,
+            None,
+            False,
+            False,
+        ]
+    with pytest.raises(ValueError):
+        Series(data) < 1
+    with pytest.raises(ValueError):
+        Series(data) < Series([1, 2, 3, 4, 5])
+
+
+def test_lazy_string_comparisons():
+    data = ["b", None, "a", "ä", "B"]
+    for series in [
+        Series(data),
+        Series(data).dictionary_encode(),
+        Series(data).utf8_encode(),
+    ]:
+        assert (series.lazy() < "b").collect().data == [False, None, True, False, True]
+        assert (series.lazy() >= "b").collect().data == (series >= "b").data
+        other = Series(["c", "a", None, "a", "A"])
+        assert (series.lazy() < other.lazy()).collect().data == [
+            True,
+            None,
+            None,
+            False,
+            False,
+        ]
+    with pytest.raises(ValueError):
+        Series(data).lazy() < 1
+    with pytest.raises(ValueError):
+        Series(data).lazy() < Series([1, 2, 3, 4, 5]).lazy()
+
+
+def test_buffer_protocol():
+    from array import array
+
+    values = array("q", [1, 2, 3])
+    series = Series(values)
+    assert series.data == [1, 2, 3] and series.data_type is int
+    values[0] = 10  # the buffer is shared
+    assert series[0] == 10
+    view = memoryview(Series([1.5, None, 3.0]))
+    assert view.format == "d" and view.readonly and view.tolist() == [1.5, 0.0, 3.0]
+    assert Series([1, None, 3]).validity_buffer().tobytes() == b"\x05"
+    assert Series([1, 2]).validity_buffer() is None
+    with_nulls = Series.from_buffers(array("d", [1.0, 2.0, 3.0]), validity=b"\xfd")
+    assert with_nulls.data == [1.0, None, 3.0] and with_nulls.null_count == 1
+    assert (with_nulls + 1).data == [2.0, None, 4.0]
+    narrow = Series(array("i", [1, 2]))
+    assert narrow.dtype == "int32" and narrow.data == [1, 2]
+    halves = Series.from_buffers(array("f", [0.5, 1.5]), validity=b"\x02")
+    assert halves.dtype == "float32" and halves.data == [None, 1.5]
+    assert Series(array("b", [-1])).dtype == "int8"
+    assert Series(array("h", [7]), dtype="int64").dtype == "int64"
+    with pytest.raises(ValueError):
+        Series(array("B", [1, 2]))
+    with pytest.raises(ValueError):
+        Series(array("u", "ab"))
+    with pytest.raises(ValueError):
+        Series.from_buffers(array("q", range(10)), validity=b"\xff")
+    with pytest.raises(TypeError):
+        memoryview(Series(["a"]))
+
+
+def test_buffer_protocol_numpy():
+    np = pytest.importorskip("numpy")
+
+    values = np.arange(2000, dtype=np.int64)
+    series = Series(values)
+    assert series.sum() == int(values.sum())
+    exported = np.asarray(series * 2)
+    assert exported.dtype == np.int64 and exported[-1] == 3998
+    for dtype, name in [(np.int32, "int32"), (np.float32, "float32")]:
+        values = np.arange(4, dtype=dtype)
+        series = Series(values)
+        values[0] = 5  # the buffer is shared
+        assert series.dtype == name and series[0] == 5
+    assert not np.asarray(series).flags.writeable
+    with pytest.raises(ValueError):
+        Series(values[::2])
+
+
+def test_memory_usage_and_compact():
+    assert Series([1, None, 3]).memory_usage() == {
+        "values": 24,
+        "validity": 1,
+        "objects": 0,
+        "total": 25,
+    }
+    assert Series([1.5, 2.5]).memory_usage()["validity"] == 0
+    names = Series([f"customer number {i}" for i in range(1000)])
+    shallow, deep = names.memory_usage(), names.memory_usage(deep=True)
+    assert (
+        shallow["objects"] == 0
+        and deep["objects"] > 0
+        and deep["total"] > shallow["total"]
+    )
+    compact = names.compact()
+    assert compact.data == names.data
+    assert compact.memory_usage(deep=True)["total"] < deep["total"]
+    regions = Series(["north", "south", None] * 1000)
+    repeated = regions.compact()
+    assert repeated.data == regions.data
+    assert (
+        repeated.memory_usage(deep=True)["total"]
+        <= regions.utf8_encode().memory_usage(deep=True)["total"]
+    )
+    numbers = Series([1, 2, 300])
+    narrow = numbers.compact()
+    assert narrow.dtype == "int16" and narrow.data == [1, 2, 300]
+    assert narrow.compact() is narrow
+    view = names.view(Series([i % 2 == 0 for i in range(1000)]))
+    assert view.compact().data == names.data[::2]
+
+
+@pytest.mark.parametrize("n", [10, 3000])
+def test_narrow_widths(n):
+    """checks int and float Series stored in fewer than 64 bits, the kernels never wrap around"""
+    values = [i % 200 - 100 for i in range(n)]
+    values[1] = None
+    small = Series(values, dtype="int8")
+    assert small.data_type is int and small.dtype == "int8" and small.data == values
+    assert memoryview(small).itemsize == 1 and small.memory_usage()["values"] == n
+    assert (
+        Series(values).dtype == "int64" and Series(values, dtype="auto").dtype == "int8"
+    )
+    assert Series([1, 70000], dtype="auto").dtype == "int32"
+    assert Series([2**70]).dtype == "object" and Series(["a"]).dtype == "str"
+
+    squared = small * small
+    assert squared.dtype == "int16"
+    assert squared.data == [None if x is None else x * x for x in values]
+    assert (small + small).dtype == "int16" and (small - 1).dtype == "int8"
+    assert (small * 10**12).dtype == "int64" and (small * 2**70).dtype == "object"
+    assert (small + Series(values, dtype="int32")).dtype == "int32"
+    assert (small / 2).dtype == "float64"
+    assert (small.lazy() * small.lazy()).collect().dtype == "int16"
+    assert (small > 50).data == [None if x is None else x > 50 for x in values]
+    assert small.sum() == sum(x for x in values if x is not None)
+    assert small[small > 50].dtype == "int8" and small[2:].dtype == "int8"
+    assert small.sort_values().data == sorted(x for x in values if x is not None) + [
+        None
+    ]
+
+    halves = Series([i / 2 for i in range(n)], dtype="float32")
+    assert halves.dtype == "float32" and (halves * 2).dtype == "float32"
+    assert (halves * 1e38).dtype == "float64"  # float32 would overflow
+    assert (halves + Series([0.5] * n)).dtype == "float64"
+    assert (
+        Series([0.1], dtype="float32").data != [0.1]
+        and Series([0.1], dtype="auto").dtype == "float64"
+    )
+    nan = float("nan")
+    assert Series([0.5, nan, None], dtype="auto").dtype == "float32"
+    assert Series([0.1, nan], dtype="auto").dtype == "float64"
+    assert Series([0.5, nan, -0.0]).compact().dtype == "float32"
+
+    with pytest.raises(ValueError):
+        Series([1, 300], dtype="int8")
+    with pytest.raises(ValueError):
+        Series([1e39], dtype="float32")
+    with pytest.raises(ValueError):
+        Series([1.5], dtype="int32")
+    with pytest.raises(ValueError):
+        Series(["a"], dtype="int8")
+    with pytest.raises(ValueError):
+        Series([2**70], dtype="int64")